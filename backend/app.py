@@ -1,12 +1,29 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
+import json
+import logging
 import os
 
+# LLM call records and provider failures are logged (backend.llm_metrics, backend.llm_router)
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'),
+                    format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
 app = Flask(__name__)
 CORS(app)
 
 from backend.career_ai import career_guidance, recommend_by_skills, analyze_skill_gap, get_ai_features
-from backend.career_comparison import compare_careers, get_salary_comparison, get_skill_comparison, get_growth_comparison, get_career_fit_score, get_career_details
+from backend.guidance_jobs import get_guidance_job
+from backend.fuzzy_matcher import find_best_career_match
+from backend.llm_guidance import stream_personalized_guidance, stream_interview_prep, stream_career_fit, render_metrics
+from backend.career_comparison import compare_careers, compare_full, get_salary_comparison, get_skill_comparison, get_growth_comparison, get_career_fit_score, get_career_details
+from backend.skill_index import compare_matrix, rank_career_fit
+from backend.career_index import query_careers, COLUMNS
+from backend.career_graph import find_career_path
+from backend.skill_sessions import start_skill_session, update_skill_session, get_skill_session
+from backend.skill_extractor import extract_skills, MAX_EXTRACT_CHARS
+from backend.skill_cooccurrence import get_related_skills
+from backend.interview_generator import start_interview, process_interview_answer, get_interview_analysis, get_interview_tips
 from backend.onet_integration import get_onet_data, search_onet_careers, download_onet_data, get_career_statistics
 
 @app.route('/')
@@ -23,10 +40,78 @@ def career():
     data = request.json
     career = data.get("career")
     level = data.get("level", "fresher")
+    stream = bool(data.get("stream", False))
+
+    response = career_guidance(career, level, stream_ai=stream)
+    return jsonify(response)
 
-    response = career_guidance(career, level)
+@app.route('/career/guidance/<job_id>', methods=['GET'])
+def career_guidance_result(job_id):
+    """Poll the AI guidance job queued by /career."""
+    response = get_guidance_job(job_id)
+    if response["status"] == "not_found":
+        return jsonify(response), 404
     return jsonify(response)
 
+# ============ STREAMING (SERVER-SENT EVENTS) ENDPOINTS ============
+
+def _sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def _sse_response(chunks, meta):
+    """Wrap a text-chunk generator as an SSE stream: meta, token*, then done or failure."""
+    def events():
+        yield _sse_event("meta", meta)
+        try:
+            for chunk in chunks:
+                yield _sse_event("token", {"text": chunk})
+        except Exception as e:
+            yield _sse_event("failure", {"message": str(e)})
+            return
+        yield _sse_event("done", {})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _resolve_career_arg():
+    career = request.args.get("career", "")
+    best_match, _ = find_best_career_match(career) if career else (None, 0)
+    return best_match
+
+@app.route('/career/stream', methods=['GET'])
+def career_stream():
+    """Stream AI personalized guidance token by token."""
+    best_match = _resolve_career_arg()
+    if not best_match:
+        return jsonify({"status": "error", "message": "Career not found"}), 404
+
+    level = request.args.get("level", "fresher")
+    skills = [s.strip() for s in request.args.get("skills", "").split(",") if s.strip()]
+    chunks = stream_personalized_guidance(best_match, level, skills or None)
+    return _sse_response(chunks, {"career": best_match.title(), "level": level.title()})
+
+@app.route('/interview-prep/stream', methods=['GET'])
+def interview_prep_stream():
+    """Stream an AI interview preparation guide."""
+    best_match = _resolve_career_arg()
+    if not best_match:
+        return jsonify({"status": "error", "message": "Career not found"}), 404
+
+    return _sse_response(stream_interview_prep(best_match), {"career": best_match.title()})
+
+@app.route('/career-fit/stream', methods=['GET'])
+def career_fit_stream():
+    """Stream an AI career fit analysis; other query params form the user profile."""
+    best_match = _resolve_career_arg()
+    if not best_match:
+        return jsonify({"status": "error", "message": "Career not found"}), 404
+
+    user_profile = {k: v for k, v in request.args.items() if k != "career"}
+    return _sse_response(stream_career_fit(best_match, user_profile), {"career": best_match.title()})
+
 @app.route('/recommend', methods=['POST'])
 def recommend():
     """Recommend careers based on user's skills."""
@@ -58,12 +143,111 @@ def skill_gap():
     response = analyze_skill_gap(career, skills)
     return jsonify(response)
 
+def _page_args(data):
+    # limit/offset from a JSON body or the query string
+    return int(data.get("limit", request.args.get("limit", 10))), int(data.get("offset", request.args.get("offset", 0)))
+
+def _is_string_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+@app.route('/skills/session', methods=['POST'])
+def skill_session_start():
+    """Start a skill scoring session; later toggles only send the skills that changed."""
+    data = request.json or {}
+    try:
+        limit, offset = _page_args(data)
+    except (TypeError, ValueError):
+        return jsonify({"status": "error", "message": "limit and offset must be integers"}), 400
+    if not _is_string_list(data.get("skills", [])):
+        return jsonify({"status": "error", "message": "skills must be a list of strings"}), 400
+    if not isinstance(data.get("career") or "", str):
+        return jsonify({"status": "error", "message": "career must be a string"}), 400
+    
+    response = start_skill_session(data.get("skills", []), data.get("career"), limit, offset)
+    if response["status"] != "success":
+        return jsonify(response), 400
+    return jsonify(response)
+
+@app.route('/skills/session/<session_id>', methods=['GET', 'POST'])
+def skill_session_update(session_id):
+    """Add/remove skills ({"add": [...], "remove": [...]}) and get the updated ranking."""
+    data = (request.json or {}) if request.method == 'POST' else {}
+    try:
+        limit, offset = _page_args(data)
+    except (TypeError, ValueError):
+        return jsonify({"status": "error", "message": "limit and offset must be integers"}), 400
+    
+    if request.method == 'POST':
+        if not (_is_string_list(data.get("add", [])) and _is_string_list(data.get("remove", []))):
+            return jsonify({"status": "error", "message": "add and remove must be lists of strings"}), 400
+        response = update_skill_session(session_id, data.get("add", []), data.get("remove", []), limit, offset)
+    else:
+        response = get_skill_session(session_id, limit, offset)
+    if response["status"] == "not_found":
+        return jsonify(response), 404
+    if response["status"] == "conflict":
+        return jsonify(response), 409
+    if response["status"] != "success":
+        return jsonify(response), 400
+    return jsonify(response)
+
+@app.route('/skills/related', methods=['GET'])
+def skills_related():
+    """Skills most often required together with ?skill=..."""
+    skill = request.args.get("skill", "").strip()
+    if not skill:
+        return jsonify({"status": "error", "message": "Please provide a skill"}), 400
+    try:
+        limit = int(request.args.get("limit", 10))
+    except ValueError:
+        return jsonify({"status": "error", "message": "limit must be an integer"}), 400
+    
+    response = get_related_skills(skill, limit)
+    if response["status"] == "not_found":
+        return jsonify(response), 404
+    if response["status"] != "success":
+        return jsonify(response), 400
+    return jsonify(response)
+
+@app.route('/skills/extract', methods=['POST'])
+def skills_extract():
+    """Extract catalog skills from resume/profile text and recommend careers for them."""
+    data = request.json or {}
+    text = data.get("text", "")
+    
+    if not isinstance(text, str) or not text.strip():
+        return jsonify({
+            "status": "error",
+            "message": "Please provide resume or profile text"
+        }), 400
+    if len(text) > MAX_EXTRACT_CHARS:
+        return jsonify({
+            "status": "error",
+            "message": f"Text is longer than {MAX_EXTRACT_CHARS} characters"
+        }), 413
+    career = data.get("career")
+    if career is not None and (not isinstance(career, str) or not career.strip()):
+        return jsonify({"status": "error", "message": "career must be a non-empty string"}), 400
+    
+    response = extract_skills(text)
+    if response["skills"]:
+        if data.get("recommend", True):
+            response["recommendations"] = recommend_by_skills(response["skills"]).get("recommendations", [])
+        if career:
+            response["skill_gap"] = analyze_skill_gap(career, response["skills"])
+    return jsonify(response)
+
 @app.route('/ai-status', methods=['GET'])
 def ai_status():
     """Check AI features status."""
     response = get_ai_features()
     return jsonify(response)
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """LLM call metrics (per worker) in Prometheus text format."""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
 # ============ CAREER COMPARISON ENDPOINTS ============
 
 @app.route('/compare', methods=['POST'])
@@ -81,6 +265,44 @@ def compare():
     response = compare_careers(careers)
     return jsonify(response)
 
+@app.route('/compare/full', methods=['POST'])
+def compare_all_views():
+    """Salary, skills, growth and fit comparisons in one request."""
+    data = request.json or {}
+    careers = data.get("careers", [])
+    # Views come from the body or ?views=salary,fit; default is all of them
+    views = data.get("views") or request.args.get("views")
+    if isinstance(views, str):
+        views = [v.strip().lower() for v in views.split(",") if v.strip()]
+    
+    if not careers or len(careers) < 2:
+        return jsonify({
+            "status": "error",
+            "message": "Please provide at least 2 careers to compare"
+        }), 400
+    
+    response = compare_full(careers, views, data.get("skills", []))
+    if response["status"] != "success":
+        return jsonify(response), 400
+    return jsonify(response)
+
+@app.route('/compare/matrix', methods=['POST'])
+def compare_matrix_view():
+    """Pairwise skill similarity, shared/unique skills and salary deltas for up to 50 careers."""
+    data = request.json or {}
+    careers = data.get("careers", [])
+    
+    if not careers or len(careers) < 2:
+        return jsonify({
+            "status": "error",
+            "message": "Please provide at least 2 careers to compare"
+        }), 400
+    
+    response = compare_matrix(careers, data.get("metric", "jaccard"))
+    if response["status"] != "success":
+        return jsonify(response), 400
+    return jsonify(response)
+
 @app.route('/salary-comparison', methods=['POST'])
 def salary_comparison():
     """Compare salary across careers."""
@@ -118,12 +340,119 @@ def career_fit():
     response = get_career_fit_score(careers, user_skills)
     return jsonify(response)
 
+@app.route('/careers/query', methods=['GET'])
+def careers_query():
+    """Careers filtered by salary/growth ranges, e.g. ?min_entry=80000&min_growth=20&sort=growth"""
+    try:
+        filters = {}
+        for column in COLUMNS:
+            low, high = request.args.get(f"min_{column}"), request.args.get(f"max_{column}")
+            if low is not None or high is not None:
+                filters[column] = (None if low is None else float(low), None if high is None else float(high))
+        limit = int(request.args.get("limit", 20))
+        offset = int(request.args.get("offset", 0))
+    except ValueError:
+        return jsonify({"status": "error", "message": "Bounds must be numbers; limit and offset must be integers"}), 400
+    
+    response = query_careers(
+        filters,
+        sort=request.args.get("sort", "mid"),
+        descending=request.args.get("order", "desc") != "asc",
+        limit=limit,
+        offset=offset
+    )
+    if response["status"] != "success":
+        return jsonify(response), 400
+    return jsonify(response)
+
+@app.route('/career-fit/rank', methods=['POST'])
+def career_fit_rank():
+    """Rank every career by how much of its skill list the user already has."""
+    data = request.json or {}
+    user_skills = data.get("skills", [])
+    
+    if not user_skills:
+        return jsonify({
+            "status": "error",
+            "message": "Please provide at least one skill"
+        }), 400
+    
+    try:
+        limit = int(data.get("limit", 20))
+        offset = int(data.get("offset", 0))
+    except (TypeError, ValueError):
+        return jsonify({"status": "error", "message": "limit and offset must be integers"}), 400
+    
+    response = rank_career_fit(user_skills, limit, offset)
+    if response["status"] != "success":
+        return jsonify(response), 400
+    return jsonify(response)
+
+@app.route('/career-path', methods=['GET'])
+def career_path():
+    """Cheapest chain of similar careers from ?from= to ?to=, by skills to acquire."""
+    from_career = request.args.get("from", "").strip()
+    to_career = request.args.get("to", "").strip()
+    if not from_career or not to_career:
+        return jsonify({"status": "error", "message": "Please provide from and to careers"}), 400
+    
+    response = find_career_path(from_career, to_career)
+    if response["status"] in ("not_found", "not_connected", "no_path"):
+        return jsonify(response), 404
+    return jsonify(response)
+
 @app.route('/career-details/<career_name>', methods=['GET'])
 def career_details(career_name):
     """Get comprehensive career details."""
     response = get_career_details(career_name)
     return jsonify(response)
 
+# ============ MOCK INTERVIEW ENDPOINTS ============
+
+@app.route('/interview/start', methods=['POST'])
+def interview_start():
+    """Start a mock interview; later answers only need the returned session_id."""
+    data = request.json or {}
+    career = data.get("career")
+    level = data.get("level", "fresher")
+
+    if not career:
+        return jsonify({"status": "error", "message": "Career is required"}), 400
+
+    response = start_interview(career, level)
+    return jsonify(response)
+
+@app.route('/interview/answer', methods=['POST'])
+def interview_answer():
+    """Submit an answer; returns the next question or the final feedback."""
+    data = request.json or {}
+    session_id = data.get("session_id")
+    answer = data.get("answer", "")
+
+    if not session_id:
+        return jsonify({"status": "error", "message": "session_id is required"}), 400
+
+    response = process_interview_answer(session_id, answer)
+    if response["status"] == "not_found":
+        return jsonify(response), 404
+    if response["status"] == "conflict":
+        return jsonify(response), 409
+    return jsonify(response)
+
+@app.route('/interview/<session_id>/analysis', methods=['GET'])
+def interview_analysis(session_id):
+    """Poll the background feedback on each submitted answer."""
+    response = get_interview_analysis(session_id)
+    if response["status"] == "not_found":
+        return jsonify(response), 404
+    return jsonify(response)
+
+@app.route('/interview/tips/<career_name>', methods=['GET'])
+def interview_tips(career_name):
+    """Get interview tips for a career."""
+    response = get_interview_tips(career_name, request.args.get("level", "fresher"))
+    return jsonify(response)
+
 # ============ O*NET INTEGRATION ENDPOINTS ============
 
 @app.route('/onet/search', methods=['POST'])
@@ -1,9 +1,21 @@
+from urllib.parse import urlencode
+
 from .career_data import CAREER_DB, CAREER_LEVELS
-from .fuzzy_matcher import find_best_career_match, find_similar_careers
+from .fuzzy_matcher import find_best_career_match, find_similar_careers, get_match_stats
+from .utils import normalize_text
 from .recommender import recommend_careers_by_skills, find_skill_gap
-from .llm_guidance import generate_personalized_guidance, get_ai_status
+from .llm_guidance import get_ai_status, get_ready_guidance, GEMINI_AVAILABLE, OPENAI_AVAILABLE
+from .guidance_jobs import submit_guidance_job, get_job_stats
+from .prefetch import prefetch_guidance, record_guidance_request, get_prefetch_stats
+from .startup import get_startup_report
+from .interview_generator import get_session_stats
+from .question_bank import get_question_bank_stats
+from .skill_sessions import get_skill_session_stats
+from .skill_normalizer import get_normalizer_stats
+from .skill_cooccurrence import suggest_next_skills, get_cooccurrence_stats
+from .career_graph import get_career_graph_stats
 
-def career_guidance(career, level="fresher"):
+def career_guidance(career, level="fresher", stream_ai=False):
     """
     Provides structured career guidance with AI enhancements.
     Uses fuzzy matching and skill-based recommendations.
@@ -11,6 +23,7 @@ def career_guidance(career, level="fresher"):
     Args:
         career: Career interest (string)
         level: User level - "student", "fresher", or "professional"
+        stream_ai: Return an SSE URL for the AI guidance instead of queuing a job
     
     Returns:
         Dictionary with structured career guidance
@@ -38,10 +51,20 @@ def career_guidance(career, level="fresher"):
         elif level == "professional":
             roadmap.insert(0, "Consider specialization and leadership development")
         
-        # Try to get AI-powered personalized guidance
-        ai_guidance = None
-        if confidence < 100:  # Show confidence if fuzzy matched
-            ai_guidance = generate_personalized_guidance(best_match, level)
+        # Precomputed or cached (e.g. prefetched) guidance is served inline;
+        # otherwise queue it and the client polls or streams it
+        record_guidance_request(best_match, level)
+        ready = get_ready_guidance(best_match, level)
+        ai_job_id = None
+        ai_stream = False
+        # Guidance is generated unless the user typed the catalog title itself. Alias
+        # hits ("BI developer") also report confidence 100, so it is not the gate.
+        typed_title = normalize_text(career) == normalize_text(best_match)
+        if ready is None and not typed_title:
+            if stream_ai:
+                ai_stream = GEMINI_AVAILABLE or OPENAI_AVAILABLE
+            else:
+                ai_job_id = submit_guidance_job(best_match, level)
         
         result = {
             "status": "success",
@@ -57,9 +80,15 @@ def career_guidance(career, level="fresher"):
             "tips": level_info["tips"]
         }
         
-        # Add AI-generated guidance if available
-        if ai_guidance and ai_guidance.get("status") == "success":
-            result["ai_personalized_guidance"] = ai_guidance.get("personalized_guidance")
+        # Point the client at the background AI guidance job if one was queued
+        if ready is not None:
+            result["ai_personalized_guidance"] = ready["text"]
+            result["ai_provider"] = ready["provider"]
+        elif ai_job_id:
+            result["ai_guidance_job_id"] = ai_job_id
+            result["ai_guidance_url"] = f"/career/guidance/{ai_job_id}"
+        elif ai_stream:
+            result["ai_guidance_stream_url"] = "/career/stream?" + urlencode({"career": best_match, "level": level})
         
         # Find and include similar careers
         similar = find_similar_careers(best_match, top_n=2)
@@ -68,6 +97,8 @@ def career_guidance(career, level="fresher"):
                 {"career": c.title(), "similarity": f"{round(s*100, 0)}%"} 
                 for c, s in similar
             ]
+            # Users often open a suggested career next; warm its guidance while they read
+            prefetch_guidance([c for c, _ in similar], level)
         
         return result
     else:
@@ -148,7 +179,9 @@ def analyze_skill_gap(career, skills_list):
             "status": "success",
             **gap,
             "career": best_match.title(),
-            "analysis_summary": f"You have {gap['current_skills']}/{gap['total_skills']} required skills ({gap['skill_match_percentage']}%)"
+            "analysis_summary": f"You have {gap['current_skills']}/{gap['total_skills']} required skills ({gap['skill_match_percentage']}%)",
+            # Missing skills most often required alongside the ones the user has
+            "next_skills": suggest_next_skills(skills_list, gap["missing_skills"])
         }
     
     return {"status": "error", "message": "Unable to analyze skill gap"}
@@ -162,5 +195,15 @@ def get_ai_features():
             "skill_recommendation": True,
             "skill_gap_analysis": True,
             "personalized_guidance": get_ai_status()
-        }
+        },
+        "career_matching": get_match_stats(),
+        "guidance_jobs": get_job_stats(),
+        "guidance_prefetch": get_prefetch_stats(),
+        "interview_sessions": get_session_stats(),
+        "interview_question_bank": get_question_bank_stats(),
+        "skill_sessions": get_skill_session_stats(),
+        "skill_normalization": get_normalizer_stats(),
+        "skill_cooccurrence": get_cooccurrence_stats(),
+        "career_graph": get_career_graph_stats(),
+        "startup": get_startup_report()
     }
@@ -2,21 +2,42 @@
 Career Comparison Module
 Provides side-by-side comparison of careers
 """
+import time
+
 from .career_data import CAREER_DB
 from .fuzzy_matcher import find_best_career_match
+from .skill_normalizer import normalize_skills
 
-def compare_careers(career_names: list) -> dict:
-    """Compare 2-3 careers side by side"""
+# Views /compare/full can return, in response order
+COMPARISON_VIEWS = ("salary", "skills", "growth", "fit")
+
+
+def _resolve_careers(career_names: list, limit: int = 3):
+    """
+    Map user inputs to CAREER_DB keys, once per input.
+
+    Args:
+        career_names (list): Career names as typed by the user
+        limit (int): Inputs beyond this many are ignored
+
+    Returns:
+        tuple: (career keys, None) or (None, error dict)
+    """
     if not career_names or len(career_names) == 0:
-        return {"status": "error", "message": "No careers provided for comparison"}
+        return None, {"status": "error", "message": "No careers provided for comparison"}
     
-    if len(career_names) > 3:
-        career_names = career_names[:3]  # Limit to 3 careers
+    if len(career_names) > limit:
+        career_names = career_names[:limit]  # Side-by-side views show at most 3 careers
     
     # Find best matches for the requested careers
     careers_to_compare = []
     for career_input in career_names:
-        match = find_best_career_match(career_input)
+        # Catalog keys (e.g. from a previous response) skip the matcher
+        key = career_input.lower().strip()
+        if key in CAREER_DB:
+            careers_to_compare.append(key)
+            continue
+        match, _ = find_best_career_match(career_input)
         if match and match in CAREER_DB:
             careers_to_compare.append(match)
         else:
@@ -26,16 +47,24 @@ def compare_careers(career_names: list) -> dict:
                     careers_to_compare.append(db_career)
                     break
             else:
-                return {
+                return None, {
                     "status": "error",
                     "message": f"Career '{career_input}' not found. Available: " + ", ".join(list(CAREER_DB.keys())[:5])
                 }
     
     if len(set(careers_to_compare)) < len(careers_to_compare):
-        return {
+        return None, {
             "status": "error",
             "message": "Please provide different careers for comparison"
         }
+    return careers_to_compare, None
+
+
+def compare_careers(career_names: list) -> dict:
+    """Compare 2-3 careers side by side"""
+    careers_to_compare, error = _resolve_careers(career_names)
+    if error:
+        return error
     
     # Build comparison data
     comparison = {
@@ -75,81 +104,94 @@ def compare_careers(career_names: list) -> dict:
     return comparison
 
 
-def get_salary_comparison(career_names: list) -> dict:
-    """Get salary comparison across careers"""
-    comparison = compare_careers(career_names)
-    
-    if comparison["status"] != "success":
-        return comparison
-    
-    salary_data = {
-        "status": "success",
-        "careers": []
-    }
-    
-    for career in comparison["careers"]:
-        salary_data["careers"].append({
-            "name": career["name"],
-            "salary": career["salary"],
-            "market": career["market"]
+def _salary_view(careers: list) -> list:
+    return [
+        {
+            "name": career.title(),
+            "salary": CAREER_DB[career].get("salary", {}),
+            "market": CAREER_DB[career].get("market", "")
+        }
+        for career in careers
+    ]
+
+
+def _skills_view(careers: list) -> list:
+    skills = {career: CAREER_DB[career].get("skills", []) for career in careers}
+    result = []
+    for career in careers:
+        # Skills required by at least one of the other careers
+        others = set()
+        for other in careers:
+            if other != career:
+                others.update(skills[other])
+        result.append({
+            "name": career.title(),
+            "required_skills": skills[career],
+            "common_with_others": [s for s in skills[career] if s in others],
+            "unique_skills": [s for s in skills[career] if s not in others]
         })
-    
-    return salary_data
+    return result
 
 
-def get_skill_comparison(career_names: list) -> dict:
-    """Get skill comparison across careers"""
-    comparison = compare_careers(career_names)
-    
-    if comparison["status"] != "success":
-        return comparison
-    
-    # Find common and unique skills
-    all_careers_data = comparison["careers"]
-    all_skills = set()
-    for career in all_careers_data:
-        all_skills.update(career["skills"])
-    
-    skill_comparison = {
-        "status": "success",
-        "careers": []
-    }
-    
-    for career in all_careers_data:
-        common_skills = set(career["skills"]) & all_skills
+def _growth_view(careers: list) -> list:
+    return [
+        {
+            "name": career.title(),
+            "growth_path": CAREER_DB[career].get("growth", {}),
+            "market": CAREER_DB[career].get("market", ""),
+            "future": CAREER_DB[career].get("future", ""),
+            "job_outlook": CAREER_DB[career].get("job_outlook", "Data not available")
+        }
+        for career in careers
+    ]
+
+
+def _fit_view(careers: list, user_skills: list) -> list:
+    user_skills_set = set(skill.lower() for skill in normalize_skills(user_skills))
+    result = []
+    for career in careers:
+        career_data = CAREER_DB[career]
+        career_skills = set(skill.lower() for skill in career_data.get("skills", []))
+        matching_skills = user_skills_set & career_skills
+        missing_skills = career_skills - user_skills_set
+        fit_percentage = int((len(matching_skills) / len(career_skills)) * 100) if career_skills else 0
         
-        skill_comparison["careers"].append({
-            "name": career["name"],
-            "required_skills": career["skills"],
-            "common_with_others": list(common_skills),
-            "unique_skills": list(set(career["skills"]) - all_skills.intersection(*[set(c["skills"]) for c in all_careers_data if c["name"] != career["name"]]))
+        result.append({
+            "name": career.title(),
+            "fit_score": fit_percentage,
+            "matching_skills": list(matching_skills),
+            "missing_skills": list(missing_skills),
+            "salary_range": career_data.get("salary", {}),
+            "description": career_data.get("description", "")
         })
     
-    return skill_comparison
+    # Sort by fit score
+    result.sort(key=lambda x: x["fit_score"], reverse=True)
+    return result
+
+
+def get_salary_comparison(career_names: list) -> dict:
+    """Get salary comparison across careers"""
+    careers, error = _resolve_careers(career_names)
+    if error:
+        return error
+    return {"status": "success", "careers": _salary_view(careers)}
+
+
+def get_skill_comparison(career_names: list) -> dict:
+    """Get skill comparison across careers"""
+    careers, error = _resolve_careers(career_names)
+    if error:
+        return error
+    return {"status": "success", "careers": _skills_view(careers)}
 
 
 def get_growth_comparison(career_names: list) -> dict:
     """Get career growth path comparison"""
-    comparison = compare_careers(career_names)
-    
-    if comparison["status"] != "success":
-        return comparison
-    
-    growth_data = {
-        "status": "success",
-        "careers": []
-    }
-    
-    for career in comparison["careers"]:
-        growth_data["careers"].append({
-            "name": career["name"],
-            "growth_path": career["growth"],
-            "market": career["market"],
-            "future": career["future"],
-            "job_outlook": career["job_outlook"]
-        })
-    
-    return growth_data
+    careers, error = _resolve_careers(career_names)
+    if error:
+        return error
+    return {"status": "success", "careers": _growth_view(careers)}
 
 
 def get_career_fit_score(career_names: list, user_skills: list = None) -> dict:
@@ -157,50 +199,64 @@ def get_career_fit_score(career_names: list, user_skills: list = None) -> dict:
     if not user_skills or len(user_skills) == 0:
         user_skills = []
     
-    comparison = compare_careers(career_names)
+    careers, error = _resolve_careers(career_names)
+    if error:
+        return error
+    return {"status": "success", "careers": _fit_view(careers, user_skills), "user_skills": user_skills}
+
+
+def compare_full(career_names: list, views: list = None, user_skills: list = None) -> dict:
+    """
+    Salary, skills, growth and fit comparisons from one career resolution.
+
+    Args:
+        career_names (list): 2-3 career names as typed by the user
+        views (list): Subset of COMPARISON_VIEWS (default: all of them)
+        user_skills (list): Skills for the fit view
+
+    Returns:
+        dict: Resolved career names, the selected views and per-view timings
+    """
+    views = list(views) if views else list(COMPARISON_VIEWS)
+    unknown = [v for v in views if v not in COMPARISON_VIEWS]
+    if unknown:
+        return {
+            "status": "error",
+            "message": f"Unknown view(s): {', '.join(unknown)}. Available: {', '.join(COMPARISON_VIEWS)}"
+        }
+    
+    timings = {}
+    start = time.perf_counter()
+    careers, error = _resolve_careers(career_names)
+    timings["resolve"] = round((time.perf_counter() - start) * 1000, 3)
+    if error:
+        return error
     
-    if comparison["status"] != "success":
-        return comparison
+    builders = {
+        "salary": lambda: _salary_view(careers),
+        "skills": lambda: _skills_view(careers),
+        "growth": lambda: _growth_view(careers),
+        "fit": lambda: _fit_view(careers, user_skills or [])
+    }
+    result = {}
+    for view in COMPARISON_VIEWS:
+        if view in views:
+            start = time.perf_counter()
+            result[view] = builders[view]()
+            timings[view] = round((time.perf_counter() - start) * 1000, 3)
     
-    fit_data = {
+    return {
         "status": "success",
-        "careers": [],
-        "user_skills": user_skills
+        "careers": [career.title() for career in careers],
+        "views": result,
+        "user_skills": user_skills or [],
+        "timings_ms": timings
     }
-    
-    user_skills_set = set(skill.lower() for skill in user_skills)
-    
-    for career in comparison["careers"]:
-        career_skills = set(skill.lower() for skill in career["skills"])
-        
-        if len(career_skills) > 0:
-            matching_skills = user_skills_set & career_skills
-            missing_skills = career_skills - user_skills_set
-            
-            fit_percentage = int((len(matching_skills) / len(career_skills)) * 100) if career_skills else 0
-        else:
-            fit_percentage = 0
-            matching_skills = set()
-            missing_skills = set()
-        
-        fit_data["careers"].append({
-            "name": career["name"],
-            "fit_score": fit_percentage,
-            "matching_skills": list(matching_skills),
-            "missing_skills": list(missing_skills),
-            "salary_range": career["salary"],
-            "description": career["description"]
-        })
-    
-    # Sort by fit score
-    fit_data["careers"].sort(key=lambda x: x["fit_score"], reverse=True)
-    
-    return fit_data
 
 
 def get_career_details(career_name: str) -> dict:
     """Get comprehensive details for a single career"""
-    career = find_best_career_match(career_name)
+    career, _ = find_best_career_match(career_name)
     
     if not career or career not in CAREER_DB:
         return {
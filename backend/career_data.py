@@ -1,4 +1,5 @@
 import os
+import hashlib
 import json
 from pathlib import Path
 
@@ -193,3 +194,63 @@ CAREER_LEVELS = {
         "tips": ["Seek senior roles", "Develop leadership skills", "Consider specialization", "Build mentor relationships"]
     }
 }
+
+# Common job-posting titles and abbreviations for the built-in careers. These
+# seed the alias index in `fuzzy_matcher`; an O*NET import adds its own
+# Alternate Titles on top (see `backend/onet_importer.py`).
+CAREER_ALIASES = {
+    "data analyst": ["bi developer", "bi analyst", "business intelligence analyst", "reporting analyst", "sql analyst", "analytics specialist"],
+    "software engineer": ["swe", "software developer", "programmer", "backend developer", "backend engineer", "sde", "application developer"],
+    "web developer": ["frontend developer", "front end developer", "full stack developer", "fullstack developer", "web designer", "javascript developer"],
+    "machine learning engineer": ["ml engineer", "mle", "ai engineer", "deep learning engineer"],
+    "product manager": ["pm", "apm", "associate product manager", "product owner", "technical product manager"],
+    "ux designer": ["ui designer", "ui ux designer", "ui/ux designer", "product designer", "interaction designer", "user experience designer"],
+    "cybersecurity analyst": ["security analyst", "infosec analyst", "information security analyst", "soc analyst", "penetration tester", "pentester"],
+    "cloud architect": ["sre", "site reliability engineer", "cloud engineer", "aws architect", "platform engineer"]
+}
+
+
+# Other names users type for catalog skills, used by `skill_normalizer`.
+# Spacing, punctuation, case, version suffixes ("Python3") and plurals are
+# handled there, and typos are corrected against these names as well.
+SKILL_ALIASES = {
+    "JavaScript": ["js", "ecmascript", "es6", "vanilla js"],
+    "Node.js": ["node"],
+    "React": ["reactjs", "react.js"],
+    "Python": ["py"],
+    "SQL": ["mysql", "postgresql", "postgres", "t-sql", "sql server", "sqlite"],
+    "Power BI": ["pbi"],
+    "Excel": ["ms excel", "microsoft excel", "spreadsheets"],
+    "Statistics": ["stats", "statistical analysis"],
+    "Data Visualization": ["dataviz", "data viz", "tableau"],
+    "Mathematics": ["math", "maths"],
+    "Kubernetes": ["k8s", "kube"],
+    "Docker": ["containers", "containerization"],
+    "Terraform": ["infrastructure as code", "iac"],
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "Git": ["github", "gitlab", "version control"],
+    "Linux": ["unix", "bash", "shell scripting"],
+    "CSS": ["sass", "scss"],
+    "DSA": ["data structures", "algorithms", "data structures and algorithms"],
+    "OOP": ["object oriented programming", "object-oriented programming", "object oriented design"],
+    "REST APIs": ["rest", "rest api", "restful api", "restful"],
+    "System Design": ["systems design", "distributed systems", "software architecture"],
+    "Database Design": ["data modeling", "schema design"],
+    "Big Data": ["hadoop", "spark", "apache spark"],
+    "Networking": ["computer networking", "tcp/ip"],
+    "PyTorch": ["torch"],
+    "Penetration Testing": ["pentesting", "pen testing", "ethical hacking"],
+    "User Research": ["ux research", "usability testing"],
+    "Problem Solving": ["troubleshooting"],
+    "Communication": ["communication skills", "presentation skills"],
+    "Leadership": ["team leadership", "people management"]
+}
+
+def _catalog_version():
+    material = json.dumps([CAREER_DB, CAREER_LEVELS], sort_keys=True)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()[:12]
+
+
+# Changes whenever careers or levels change; precomputed guidance is keyed by it
+CATALOG_VERSION = _catalog_version()
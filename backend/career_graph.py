@@ -0,0 +1,228 @@
+"""
+Career Transition Graph
+Every career linked to its CAREER_GRAPH_K most similar careers by skill
+overlap (Jaccard, as in `get_career_similarity`). Links are
+kept in both directions, and a step to a career costs the number of its
+skills the current career does not use, plus CAREER_PATH_HOP_COST. The
+graph is built once per catalog version, and /career-path runs A* over it.
+A*'s estimate is the target's skills still missing. It never overestimates,
+because each of those skills has to be picked up on some step.
+numpy is imported on first use (see backend/startup.py).
+"""
+import heapq
+import os
+import threading
+import time
+
+from .career_data import CAREER_DB, CATALOG_VERSION
+from .fuzzy_matcher import find_best_career_match
+from .skill_index import get_skill_index
+
+# Nearest careers linked from each career, and the fixed cost of one step
+CAREER_GRAPH_K = int(os.getenv('CAREER_GRAPH_K', '10'))
+CAREER_PATH_HOP_COST = float(os.getenv('CAREER_PATH_HOP_COST', '0.5'))
+MAX_PATH_HOPS = 10
+
+_BLOCK = 512  # rows of the similarity matrix computed at once
+
+
+class CareerGraph:
+    """Adjacency lists over SkillIndex rows: i -> [(j, cost, similarity), ...]."""
+
+    def __init__(self, index, k=CAREER_GRAPH_K, hop_cost=CAREER_PATH_HOP_COST):
+        import numpy as np
+
+        self.version = index.version
+        self.index = index
+        self.skills = [frozenset(index.career_skills(i).tolist()) for i in range(len(index.careers))]
+        n = len(index.careers)
+        A = index.matrix
+        sizes = index.sizes.astype(np.float32)
+
+        neighbours = [dict() for _ in range(n)]  # i -> {j: similarity}
+        for lo in range(0, n, _BLOCK):
+            hi = min(lo + _BLOCK, n)
+            overlap = (A[lo:hi] @ A.T).toarray()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                similarity = np.nan_to_num(overlap / (sizes[lo:hi, None] + sizes[None, :] - overlap))
+            similarity[np.arange(hi - lo), np.arange(lo, hi)] = 0  # no self loops
+            kk = min(k, n - 1)
+            if kk <= 0:
+                break
+            top = np.argpartition(-similarity, kk - 1, axis=1)[:, :kk]
+            for r, row in enumerate(top.tolist()):
+                i = lo + r
+                for j in row:
+                    s = float(similarity[r, j])
+                    if s > 0:  # careers sharing no skill are not a realistic step
+                        neighbours[i][j] = s
+                        neighbours[j][i] = s
+
+        self.edges = 0
+        self.adjacency = []
+        for i in range(n):
+            edges = [(j, len(self.skills[j] - self.skills[i]) + hop_cost, s) for j, s in neighbours[i].items()]
+            self.adjacency.append(edges)
+            self.edges += len(edges)
+
+        # Connected component of each row, so unreachable targets need no search
+        self.component = [-1] * n
+        self.components = 0
+        for root in range(n):
+            if self.component[root] >= 0:
+                continue
+            self.component[root] = self.components
+            stack = [root]
+            while stack:
+                i = stack.pop()
+                for j, _, _ in self.adjacency[i]:
+                    if self.component[j] < 0:
+                        self.component[j] = self.components
+                        stack.append(j)
+            self.components += 1
+
+    def connected(self, source, target):
+        return self.component[source] == self.component[target]
+
+    def shortest_path(self, source, target, max_hops=MAX_PATH_HOPS):
+        """
+        Cheapest path of at most `max_hops` steps from row `source` to row `target`.
+
+        The search state is (row, steps taken), so a dearer route that
+        reaches a career in fewer steps is kept when it may be the only one
+        that arrives within the limit. A state is dropped only if the same
+        career was reached as cheaply in no more steps.
+
+        Returns:
+            tuple: (total cost, list of rows from source to target), or
+            (None, None) if the target is unreachable within `max_hops`
+        """
+        if not self.connected(source, target):
+            return None, None
+        goal = self.skills[target]
+
+        def estimate(i):
+            return len(goal - self.skills[i])
+
+        inf = float("inf")
+        best = {source: [0.0] + [inf] * max_hops}  # row -> cheapest cost reached with h steps
+        previous = {}  # (row, steps) -> (row, steps) before it
+        heap = [(estimate(source), 0.0, 0, source)]
+        while heap:
+            _, cost, h, i = heapq.heappop(heap)
+            if i == target:
+                state, path = (i, h), [i]
+                while state in previous:
+                    state = previous[state]
+                    path.append(state[0])
+                return cost, path[::-1]
+            if cost > best[i][h] or h >= max_hops:
+                continue
+            for j, step, _ in self.adjacency[i]:
+                new_cost = cost + step
+                costs = best.setdefault(j, [inf] * (max_hops + 1))
+                if min(costs[:h + 2]) <= new_cost:
+                    continue
+                costs[h + 1] = new_cost
+                previous[(j, h + 1)] = (i, h)
+                heapq.heappush(heap, (new_cost + estimate(j), new_cost, h + 1, j))
+        return None, None
+
+    def similarity(self, i, j):
+        for k, _, s in self.adjacency[i]:
+            if k == j:
+                return s
+        return 0.0
+
+    def stats(self):
+        return {
+            "catalog_version": self.version,
+            "careers": len(self.adjacency),
+            "edges": self.edges,
+            "components": self.components
+        }
+
+
+_graph = None
+_graph_lock = threading.Lock()
+
+
+def get_career_graph():
+    """Shared graph for the loaded catalog, built on first use."""
+    global _graph
+    with _graph_lock:
+        if _graph is None or _graph.version != CATALOG_VERSION:
+            _graph = CareerGraph(get_skill_index())
+        return _graph
+
+
+def _resolve(name):
+    key, _ = find_best_career_match(name)
+    return key if key in CAREER_DB else None
+
+
+def find_career_path(from_career: str, to_career: str) -> dict:
+    """
+    Cheapest chain of similar careers from one career to another.
+
+    Args:
+        from_career (str): Current career
+        to_career (str): Target career
+
+    Returns:
+        dict: Each step with the skills it adds, the total cost and, for
+        comparison, the skills a direct switch would need
+    """
+    source_key, target_key = _resolve(from_career), _resolve(to_career)
+    for name, key in ((from_career, source_key), (to_career, target_key)):
+        if key is None:
+            return {"status": "not_found", "message": f"Career '{name}' not found"}
+
+    start = time.perf_counter()
+    graph = get_career_graph()
+    index = graph.index
+    source, target = index.row[source_key], index.row[target_key]
+    cost, path = graph.shortest_path(source, target)
+    elapsed = round((time.perf_counter() - start) * 1000, 3)
+
+    direct_missing = sorted(graph.skills[target] - graph.skills[source])
+    result = {
+        "from": source_key.title(),
+        "to": target_key.title(),
+        "direct_missing_skills": [index.skill_names[j] for j in direct_missing],
+        "elapsed_ms": elapsed
+    }
+    if path is None and not graph.connected(source, target):
+        return {
+            "status": "not_connected",
+            "message": f"No chain of similar careers links '{source_key.title()}' to '{target_key.title()}'",
+            **result
+        }
+    if path is None:
+        return {
+            "status": "no_path",
+            "message": f"No chain of similar careers within {MAX_PATH_HOPS} steps leads to '{target_key.title()}'",
+            **result
+        }
+
+    steps = []
+    for a, b in zip(path, path[1:]):
+        new_skills = sorted(graph.skills[b] - graph.skills[a])
+        steps.append({
+            "career": index.careers[b].title(),
+            "similarity": round(graph.similarity(a, b), 4),
+            "new_skills": [index.skill_names[j] for j in new_skills]
+        })
+    return {
+        "status": "success",
+        **result,
+        "total_cost": round(cost, 3),
+        "hops": len(steps),
+        "path": steps
+    }
+
+
+def get_career_graph_stats() -> dict:
+    """Return the size of the career graph (empty until first use)."""
+    graph = _graph
+    return graph.stats() if graph is not None else {"loaded": False}
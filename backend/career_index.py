@@ -0,0 +1,169 @@
+"""
+Career Column Index
+Salary levels and the job-outlook growth percentage of every career as
+NumPy columns, each with a precomputed sort order. Range filters are binary
+searches on the sorted values combined as boolean masks, and ranking walks
+one column's sort order, so /careers/query never scans the catalog dicts.
+numpy is imported on first use (see backend/startup.py).
+"""
+import math
+import re
+import threading
+import time
+
+from .career_data import CAREER_DB, CATALOG_VERSION
+
+SALARY_LEVELS = ("entry", "mid", "senior", "lead")
+# Queryable columns; "growth" is the percentage parsed from job_outlook
+COLUMNS = SALARY_LEVELS + ("growth",)
+MAX_QUERY_LIMIT = 100
+
+_GROWTH_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*%")
+
+
+def parse_growth_percent(job_outlook):
+    """First percentage in a job_outlook string ("32% growth (2021-2031)" -> 32.0), or None."""
+    match = _GROWTH_RE.search(job_outlook or "")
+    return float(match.group(1)) if match else None
+
+
+class CareerColumns:
+    """One float column per queryable field; NaN where a career has no value."""
+
+    def __init__(self, career_db, version=None):
+        import numpy as np
+
+        self.version = version
+        self.careers = list(career_db)
+        n = len(self.careers)
+        self.values = {name: np.full(n, np.nan) for name in COLUMNS}
+        for i, career in enumerate(self.careers):
+            data = career_db[career]
+            salary = data.get("salary") or {}
+            for level in SALARY_LEVELS:
+                if isinstance(salary.get(level), (int, float)):
+                    self.values[level][i] = salary[level]
+            growth = parse_growth_percent(data.get("job_outlook"))
+            if growth is not None:
+                self.values["growth"][i] = growth
+
+        # Ascending order of the careers that have a value; NaNs are left out
+        self.order = {}
+        self.sorted_values = {}
+        for name, column in self.values.items():
+            present = np.flatnonzero(~np.isnan(column))
+            order = present[np.argsort(column[present], kind="stable")]
+            self.order[name] = order
+            self.sorted_values[name] = column[order]
+
+    def range_mask(self, name, low=None, high=None):
+        """Boolean mask of careers with low <= value <= high (either bound optional)."""
+        import numpy as np
+
+        sorted_values = self.sorted_values[name]
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side="left")
+        stop = len(sorted_values) if high is None else np.searchsorted(sorted_values, high, side="right")
+        mask = np.zeros(len(self.careers), dtype=bool)
+        mask[self.order[name][start:stop]] = True
+        return mask
+
+    def query(self, filters=None, sort="mid", descending=True, limit=20, offset=0):
+        """
+        Filter and rank careers.
+
+        Args:
+            filters (dict): column -> (low, high), either bound may be None
+            sort (str): Column to rank by; careers without a value are excluded
+            descending (bool): Highest first
+            limit (int): Page size
+            offset (int): Rows to skip
+
+        Returns:
+            tuple: (total matches, list of row indices for the page)
+        """
+        import numpy as np
+
+        mask = np.zeros(len(self.careers), dtype=bool)
+        mask[self.order[sort]] = True
+        for name, (low, high) in (filters or {}).items():
+            mask &= self.range_mask(name, low, high)
+
+        order = self.order[sort][::-1] if descending else self.order[sort]
+        ranked = order[mask[order]]
+        return int(len(ranked)), ranked[offset:offset + limit].tolist()
+
+    def row(self, i):
+        import numpy as np
+
+        def value(name):
+            v = self.values[name][i]
+            return None if np.isnan(v) else (int(v) if name in SALARY_LEVELS else float(v))
+
+        return {
+            "name": self.careers[i].title(),
+            "salary": {level: value(level) for level in SALARY_LEVELS},
+            "growth_percent": value("growth")
+        }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_career_columns():
+    """Shared column index for the loaded catalog, built on first use."""
+    global _index
+    with _index_lock:
+        if _index is None or _index.version != CATALOG_VERSION:
+            _index = CareerColumns(CAREER_DB, CATALOG_VERSION)
+        return _index
+
+
+def query_careers(filters=None, sort="mid", descending=True, limit=20, offset=0):
+    """
+    Careers matching salary/growth ranges, ranked by one column.
+
+    Args:
+        filters (dict): column -> (low, high) for columns in COLUMNS; low > high matches nothing
+        sort (str): Column in COLUMNS to rank by
+        descending (bool): Highest first
+        limit (int): Page size (at most MAX_QUERY_LIMIT)
+        offset (int): Rows to skip
+
+    Returns:
+        dict: Matching careers with their salary levels, growth and job outlook
+    """
+    unknown = [name for name in list(filters or {}) + [sort] if name not in COLUMNS]
+    if unknown:
+        return {
+            "status": "error",
+            "message": f"Unknown column(s): {', '.join(unknown)}. Available: {', '.join(COLUMNS)}"
+        }
+    if not 1 <= limit <= MAX_QUERY_LIMIT or offset < 0:
+        return {
+            "status": "error",
+            "message": f"limit must be between 1 and {MAX_QUERY_LIMIT} and offset must not be negative"
+        }
+    # NaN sorts after every value, so it would silently match nothing (low) or everything (high)
+    if any(bound is not None and math.isnan(bound) for bounds in (filters or {}).values() for bound in bounds):
+        return {"status": "error", "message": "Bounds must be numbers"}
+
+    start = time.perf_counter()
+    index = get_career_columns()
+    total, rows = index.query(filters, sort, descending, limit, offset)
+    careers = []
+    for i in rows:
+        career = index.row(i)
+        career["job_outlook"] = CAREER_DB[index.careers[i]].get("job_outlook", "")
+        careers.append(career)
+
+    return {
+        "status": "success",
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "sort": sort,
+        "order": "desc" if descending else "asc",
+        "careers": careers,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)
+    }
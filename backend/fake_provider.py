@@ -0,0 +1,210 @@
+"""
+Fake LLM Provider
+Local stand-in for the OpenAI chat completions API and the Gemini REST API
+so the LLM code paths (streaming, fallbacks, deadlines, hedging, circuit
+breakers) can be exercised offline.
+
+Run one server per provider to give them different latencies:
+    python -m backend.fake_provider --port 8089 --latency 1.5
+    python -m backend.fake_provider --port 8090 --latency 0.3 --error-rate 0.2
+
+then start the app with:
+    OPENAI_API_KEY=fake OPENAI_BASE_URL=http://127.0.0.1:8089/v1
+    GEMINI_API_KEY=fake GEMINI_API_ENDPOINT=http://127.0.0.1:8090
+"""
+import argparse
+import json
+import random
+import re
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def fake_grading_json(prompt):
+    """Well-formed interview grading for prompts that ask for the JSON format."""
+    count = len(re.findall(r"^Q\d+:", prompt, re.MULTILINE))
+    answers = [{"question_number": i, "score": 5 + i % 4, "feedback": f"Answer {i} is clear; add a concrete example."}
+               for i in range(1, count + 1)]
+    return json.dumps({
+        "answers": answers,
+        "technical_score": 6,
+        "communication_score": 7,
+        "problem_solving_score": 6,
+        "strengths": ["Clear structure"],
+        "improvements": ["More measurable results"],
+        "assessment": "Solid answers with room for more depth.",
+        "recommendation": "Further Discussion"
+    })
+
+
+def fake_completion_text(prompt, words=60):
+    """Deterministic filler text derived from the prompt."""
+    if "Respond with only a JSON object" in prompt:
+        return fake_grading_json(prompt)
+    match = re.search(r"Respond with only a JSON array of (\d+) question strings", prompt)
+    if match:
+        return json.dumps([f"Fake question {i}: {' '.join(prompt.split()[4:14])}?"
+                           for i in range(1, int(match.group(1)) + 1)])
+    seed = prompt.split()[:12] or ["career"]
+    return " ".join(seed[i % len(seed)] for i in range(words))
+
+
+class FakeProviderHandler(BaseHTTPRequestHandler):
+    # Seconds before the first byte, and between streamed chunks
+    latency = 0.5
+    chunk_delay = 0.02
+    error_rate = 0.0
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        path = self.path.split('?', 1)[0].rstrip('/')
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+
+        time.sleep(self.latency)
+        if random.random() < self.error_rate:
+            self._json(503, {"error": {"code": 503, "message": "fake provider overloaded"}})
+            return
+
+        if path.endswith('/chat/completions'):
+            prompt = " ".join(m.get("content", "") for m in body.get("messages", []) if m.get("role") == "user")
+            model = body.get("model", "fake-model")
+            text = fake_completion_text(prompt)
+            if body.get("stream"):
+                include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+                self._stream(text, model, prompt if include_usage else None)
+            else:
+                self._complete(text, model, prompt)
+        elif path.endswith(':generateContent') or path.endswith(':streamGenerateContent'):
+            prompt = " ".join(part.get("text", "")
+                              for content in body.get("contents", [])
+                              for part in content.get("parts", []))
+            text = fake_completion_text(prompt)
+            if path.endswith(':streamGenerateContent'):
+                self._gemini_stream(text, prompt)
+            else:
+                self._json(200, self._gemini_response(text, prompt))
+        else:
+            self.send_error(404)
+
+    def _json(self, status, obj):
+        payload = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _gemini_response(self, text, prompt, generated=None):
+        # `generated` is everything produced so far; streamed usage is a running total
+        generated = text if generated is None else generated
+        return {
+            "candidates": [{
+                "content": {"parts": [{"text": text}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0
+            }],
+            "usageMetadata": {
+                "promptTokenCount": len(prompt.split()),
+                "candidatesTokenCount": len(generated.split()),
+                "totalTokenCount": len(prompt.split()) + len(generated.split())
+            }
+        }
+
+    def _gemini_stream(self, text, prompt):
+        # Gemini's REST streaming response is one JSON array written incrementally
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        words = text.split()
+        for i in range(0, len(words), 5):
+            piece = " ".join(words[i:i + 5]) + " "
+            prefix = "[" if i == 0 else ",\r\n"
+            response = self._gemini_response(piece, prompt, " ".join(words[:i + 5]))
+            self._write_chunk((prefix + json.dumps(response)).encode())
+            time.sleep(self.chunk_delay)
+        self._write_chunk(b"]")
+        self._write_chunk(b"")
+
+    def _complete(self, text, model, prompt):
+        self._json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": len(prompt.split()),
+                "completion_tokens": len(text.split()),
+                "total_tokens": len(prompt.split()) + len(text.split())
+            }
+        })
+
+    def _stream(self, text, model, usage_prompt=None):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        for i, word in enumerate(text.split()):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": word if i == 0 else " " + word}, "finish_reason": None}]
+            }
+            self._write_chunk(f"data: {json.dumps(chunk)}\n\n".encode())
+            time.sleep(self.chunk_delay)
+        if usage_prompt is not None:
+            # stream_options.include_usage: a final chunk with usage and no choices
+            usage = {
+                "prompt_tokens": len(usage_prompt.split()),
+                "completion_tokens": len(text.split()),
+                "total_tokens": len(usage_prompt.split()) + len(text.split())
+            }
+            chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [], "usage": usage}
+            self._write_chunk(f"data: {json.dumps(chunk)}\n\n".encode())
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+def serve(port=8089, latency=0.5, chunk_delay=0.02, error_rate=0.0):
+    FakeProviderHandler.latency = latency
+    FakeProviderHandler.chunk_delay = chunk_delay
+    FakeProviderHandler.error_rate = error_rate
+    server = ThreadingHTTPServer(('127.0.0.1', port), FakeProviderHandler)
+    print(f"Fake LLM provider on http://127.0.0.1:{port} (OpenAI: /v1, Gemini: /v1beta; "
+          f"latency {latency}s, error rate {error_rate:.0%})")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local fake OpenAI/Gemini-compatible LLM server')
+    parser.add_argument('--port', type=int, default=8089, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=0.5, help='Seconds before the first byte of each response')
+    parser.add_argument('--chunk-delay', type=float, default=0.02, help='Seconds between streamed chunks')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 503')
+    args = parser.parse_args()
+
+    serve(args.port, args.latency, args.chunk_delay, args.error_rate)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,119 @@
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
-from .career_data import CAREER_DB
+from .career_data import CAREER_DB, CAREER_ALIASES
+from .utils import index_fingerprint, normalize_text
 
+import json
+import logging
+import os
 import pickle
+import threading
 from pathlib import Path
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+
+# fuzzywuzzy, numpy and sklearn are imported on first use (see backend/startup.py)
+
+logger = logging.getLogger(__name__)
 
 
 # Attempt to load TF-IDF index built by `backend/onet_importer.py`
 _VEC_PATH = Path(__file__).parent / 'CAREER_DB_onet.vec.pkl'
 _IDX_PATH = Path(__file__).parent / 'CAREER_DB_onet.idx.pkl'
 _MATRIX_PATH = Path(__file__).parent / 'CAREER_DB_onet.matrix.npz'
+_ALIAS_PATH = Path(__file__).parent / 'CAREER_DB_onet.aliases.json'
+# Dense LSA projection of the TF-IDF index (`onet_importer.py --lsa-dim`)
+_LSA_PATH = Path(__file__).parent / 'CAREER_DB_onet.lsa.npz'
+
+# "lsa" uses the dense embeddings when they were built, "tfidf" always the sparse matrix
+SEMANTIC_MATCHING = os.getenv('SEMANTIC_MATCHING', 'lsa')
+# Minimum cosine for a semantic match; LSA cosines run higher than sparse TF-IDF ones
+TFIDF_MATCH_THRESHOLD = float(os.getenv('TFIDF_MATCH_THRESHOLD', '0.15'))
+LSA_MATCH_THRESHOLD = float(os.getenv('LSA_MATCH_THRESHOLD', '0.35'))
 
 _TFIDF_VEC = None
 _TFIDF_MATRIX = None
 _TFIDF_TITLES = None
+_LSA_COMPONENTS = None   # dim x features
+_LSA_EMBEDDINGS = None   # careers x dim, L2-normalized
+_TITLE_ROWS = None       # career key -> row of the index
+_IN_CATALOG = None       # row -> whether its career is in CAREER_DB
+
+# normalized title/alias -> CAREER_DB key
+_ALIAS_INDEX = None
+_ALIAS_LOCK = threading.Lock()
+
+_STATS_LOCK = threading.Lock()
+_MATCH_STATS = {
+    "lookups": 0,
+    "exact_hits": 0,
+    "alias_hits": 0,
+    "semantic_hits": 0,
+    "fuzzy_hits": 0,
+    "misses": 0
+}
+
+
+def _count(stat):
+    with _STATS_LOCK:
+        _MATCH_STATS["lookups"] += 1
+        _MATCH_STATS[stat] += 1
+
+
+def _load_alias_index():
+    """Build the exact-match index once: career keys, built-in aliases, O*NET alternate titles."""
+    global _ALIAS_INDEX
+    if _ALIAS_INDEX is not None:
+        return _ALIAS_INDEX
+
+    with _ALIAS_LOCK:
+        if _ALIAS_INDEX is not None:
+            return _ALIAS_INDEX
+
+        index = {}
+        if _ALIAS_PATH.exists():
+            try:
+                with open(_ALIAS_PATH, 'r', encoding='utf-8') as f:
+                    index.update({a: k for a, k in json.load(f).items() if k in CAREER_DB})
+            except Exception:
+                pass
+        for career, aliases in CAREER_ALIASES.items():
+            if career in CAREER_DB:
+                for alias in aliases:
+                    index.setdefault(normalize_text(alias), career)
+        # canonical titles always win over aliases
+        for career in CAREER_DB:
+            index[normalize_text(career)] = career
+
+        _ALIAS_INDEX = index
+    return _ALIAS_INDEX
+
+
+def get_match_stats():
+    """Return lookup counters for `find_best_career_match` and the fast-path hit rate."""
+    with _STATS_LOCK:
+        stats = dict(_MATCH_STATS)
+    fast = stats["exact_hits"] + stats["alias_hits"]
+    stats["alias_index_size"] = len(_ALIAS_INDEX) if _ALIAS_INDEX is not None else 0
+    stats["fast_path_hit_rate"] = round(fast / stats["lookups"], 4) if stats["lookups"] else 0.0
+    return stats
+
+
+def _load_lsa():
+    # Only a projection fitted on this exact index is usable; anything else is skipped
+    import numpy as np
+
+    with np.load(_LSA_PATH) as lsa:
+        if 'fingerprint' not in lsa.files:
+            logger.warning("Ignoring %s: no index fingerprint (re-run the O*NET import)", _LSA_PATH)
+            return None, None
+        components, embeddings = lsa['components'], lsa['embeddings']
+        if (str(lsa['fingerprint']) != index_fingerprint(_TFIDF_VEC.vocabulary_, _TFIDF_TITLES)
+                or components.shape[1] != len(_TFIDF_VEC.vocabulary_)
+                or embeddings.shape != (len(_TFIDF_TITLES), components.shape[0])):
+            logger.warning("Ignoring %s: it was built for a different TF-IDF index", _LSA_PATH)
+            return None, None
+    return components, embeddings
+
 
 def _try_load_index():
-    global _TFIDF_VEC, _TFIDF_MATRIX, _TFIDF_TITLES
+    global _TFIDF_VEC, _TFIDF_MATRIX, _TFIDF_TITLES, _LSA_COMPONENTS, _LSA_EMBEDDINGS, _TITLE_ROWS, _IN_CATALOG
     if _TFIDF_VEC is not None:
         return True
     try:
@@ -30,45 +125,128 @@ def _try_load_index():
                 _TFIDF_TITLES = meta.get('titles', [])
             from scipy.sparse import load_npz
             _TFIDF_MATRIX = load_npz(str(_MATRIX_PATH))
+            import numpy as np
+
+            _TITLE_ROWS = {title: i for i, title in enumerate(_TFIDF_TITLES)}
+            _IN_CATALOG = np.array([title in CAREER_DB for title in _TFIDF_TITLES], dtype=bool)
+            if _LSA_PATH.exists():
+                try:
+                    _LSA_COMPONENTS, _LSA_EMBEDDINGS = _load_lsa()
+                except Exception as e:
+                    logger.warning("Ignoring %s: %s", _LSA_PATH, e)
             return True
     except Exception:
         _TFIDF_VEC = None
         _TFIDF_MATRIX = None
         _TFIDF_TITLES = None
+        _LSA_COMPONENTS = None
+        _LSA_EMBEDDINGS = None
     return False
 
 
+def semantic_scores(text, backend=None):
+    """Cosine similarity of `text` to every career in the TF-IDF index.
+
+    With LSA embeddings the query is projected to the dense space and scored
+    with one matrix-vector product; otherwise it is compared against the
+    sparse TF-IDF matrix.
+
+    Returns (scores array aligned with the index titles, "lsa" | "tfidf"),
+    or (None, None) when no index was built.
+    """
+    if not _try_load_index():
+        return None, None
+    backend = backend or SEMANTIC_MATCHING
+    q = _TFIDF_VEC.transform([text])
+    if backend == 'lsa' and _LSA_EMBEDDINGS is not None:
+        import numpy as np
+
+        # Only the query's few nonzero terms contribute: gather those columns of the projection
+        v = _LSA_COMPONENTS[:, q.indices] @ q.data.astype(np.float32)
+        norm = np.linalg.norm(v)
+        if norm == 0:
+            return np.zeros(len(_TFIDF_TITLES), dtype=np.float32), 'lsa'
+        return _LSA_EMBEDDINGS @ (v / norm), 'lsa'
+
+    from sklearn.metrics.pairwise import cosine_similarity
+    return cosine_similarity(q, _TFIDF_MATRIX).flatten(), 'tfidf'
+
+
+def lsa_available():
+    """True when LSA embeddings were built and SEMANTIC_MATCHING selects them."""
+    return SEMANTIC_MATCHING == 'lsa' and _try_load_index() and _LSA_EMBEDDINGS is not None
+
+
+def _top_careers(sims, top_n):
+    # Catalog careers with a positive score, filtered before the top-n cut
+    import numpy as np
+
+    keep = np.flatnonzero((sims > 0) & _IN_CATALOG)
+    n = min(top_n, len(keep))
+    if n <= 0:
+        return []
+    top = keep[np.argpartition(-sims[keep], n - 1)[:n]]
+    top = top[np.argsort(-sims[top])]
+    return [(_TFIDF_TITLES[j], float(sims[j])) for j in top.tolist()]
+
+
+def semantic_search(text, top_n=5, backend=None):
+    """Top careers for free text by semantic similarity.
+
+    Returns a list of up to `top_n` (career_key, cosine) tuples with a
+    positive cosine, best first; empty when no index was built.
+    """
+    sims, _ = semantic_scores(text, backend)
+    if sims is None:
+        return []
+    return _top_careers(sims, top_n)
+
+
 def find_best_career_match(user_input):
-    """Find best career using TF‑IDF semantic search if available, else fuzzy match.
+    """Find best career by exact title/alias lookup, then TF‑IDF semantic search if available, else fuzzy match.
 
     Returns (career_key, confidence_percent)
     """
     user_input = user_input.lower().strip()
 
-    # Try semantic TF-IDF search first
+    # O(1) fast path: canonical titles and known alternate titles ("BI developer", "SRE")
+    key = normalize_text(user_input)
+    career = _load_alias_index().get(key)
+    if career is not None:
+        _count("exact_hits" if normalize_text(career) == key else "alias_hits")
+        return career, 100
+
+    # Try semantic search (dense LSA or sparse TF-IDF) first
     if _try_load_index() and _TFIDF_VEC is not None and _TFIDF_MATRIX is not None:
         try:
-            q = _TFIDF_VEC.transform([user_input])
-            sims = cosine_similarity(q, _TFIDF_MATRIX).flatten()
+            import numpy as np
+
+            sims, backend = semantic_scores(user_input)
             best_idx = int(np.argmax(sims))
             best_score = float(sims[best_idx])
             best_title = _TFIDF_TITLES[best_idx]
             # convert to percentage
             pct = round(best_score * 100, 1)
             # if score is reasonably strong, return
-            if best_score >= 0.15:
+            threshold = LSA_MATCH_THRESHOLD if backend == 'lsa' else TFIDF_MATCH_THRESHOLD
+            if best_score >= threshold:
+                _count("semantic_hits")
                 return best_title, pct
         except Exception:
             pass
 
     # Fallback to fuzzy matching on CAREER_DB keys
+    from fuzzywuzzy import fuzz, process
+
     careers = list(CAREER_DB.keys())
     best_match = process.extractOne(user_input, careers, scorer=fuzz.token_set_ratio)
     if best_match:
         career_name, score = best_match
         if score >= 70:
+            _count("fuzzy_hits")
             return career_name, score
 
+    _count("misses")
     return None, 0
 
 
@@ -112,6 +290,15 @@ def find_similar_careers(career_name, top_n=3):
     if career_name not in CAREER_DB:
         return []
     
+    # With LSA embeddings: cosine of the career's embedding against all others
+    if lsa_available() and career_name in _TITLE_ROWS:
+        import numpy as np
+
+        i = _TITLE_ROWS[career_name]
+        sims = _LSA_EMBEDDINGS @ _LSA_EMBEDDINGS[i]
+        sims[i] = -np.inf
+        return _top_careers(sims, top_n)
+    
     similarities = []
     for other_career in CAREER_DB.keys():
         if other_career != career_name:
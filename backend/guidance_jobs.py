@@ -0,0 +1,167 @@
+"""
+Guidance Jobs Module
+Runs LLM guidance generation on a bounded background executor so /career
+returns immediately; clients poll /career/guidance/<job_id> for the result.
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from .llm_guidance import generate_personalized_guidance, GEMINI_AVAILABLE, OPENAI_AVAILABLE
+
+# Threads per gunicorn worker that may wait on a provider at once
+MAX_WORKERS = int(os.getenv('GUIDANCE_WORKERS', '4'))
+# Jobs allowed to queue behind them before new requests skip AI guidance
+MAX_PENDING = int(os.getenv('GUIDANCE_MAX_PENDING', '32'))
+# How long finished results stay available for polling
+JOB_TTL_SECONDS = int(os.getenv('GUIDANCE_JOB_TTL', '600'))
+
+_executor = None
+_jobs = {}
+_pending_by_request = {}  # (career, level, skills) -> job_id while the job is pending
+_pending = 0
+_lock = threading.Lock()
+_stats = {
+    "submitted": 0,
+    "completed": 0,
+    "failed": 0,
+    "rejected": 0,
+    "coalesced": 0
+}
+
+
+def _get_executor():
+    # Created on first use so no threads exist before gunicorn forks workers
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='guidance')
+    return _executor
+
+
+def _purge_expired(now):
+    expired = [job_id for job_id, job in _jobs.items()
+               if job["finished_at"] is not None and now - job["finished_at"] > JOB_TTL_SECONDS]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+def _request_key(career_name, level, skills):
+    return career_name, level, tuple(sorted(s.lower() for s in skills or []))
+
+
+def _run_job(job_id, career_name, level, skills):
+    global _pending
+    try:
+        result = generate_personalized_guidance(career_name, level, skills)
+    except Exception as e:
+        result = {"status": "error", "message": f"Error generating guidance: {str(e)}"}
+
+    with _lock:
+        _pending -= 1
+        _pending_by_request.pop(_request_key(career_name, level, skills), None)
+        job = _jobs.get(job_id)
+        if job is None:
+            return
+        if result and result.get("status") == "success":
+            job["status"] = "success"
+            job["result"] = result
+            _stats["completed"] += 1
+        else:
+            job["status"] = "error"
+            job["result"] = result or {"message": "No AI providers configured"}
+            _stats["failed"] += 1
+        job["finished_at"] = time.time()
+
+
+def submit_guidance_job(career_name, level, skills=None):
+    """
+    Queue personalized guidance generation in the background.
+
+    Args:
+        career_name: Matched career key
+        level: User level (student/fresher/professional)
+        skills: User's current skills (optional)
+
+    Returns:
+        str: Job ID to poll (shared with an identical pending job), or None
+        if no provider is configured or the queue is full (the caller
+        should just omit AI guidance)
+    """
+    global _pending
+    if not (GEMINI_AVAILABLE or OPENAI_AVAILABLE):
+        return None
+
+    now = time.time()
+    with _lock:
+        _purge_expired(now)
+        request_key = _request_key(career_name, level, skills)
+        if request_key in _pending_by_request:
+            _stats["coalesced"] += 1
+            return _pending_by_request[request_key]
+        if _pending >= MAX_PENDING:
+            _stats["rejected"] += 1
+            return None
+
+        job_id = uuid.uuid4().hex
+        _jobs[job_id] = {
+            "status": "pending",
+            "career": career_name,
+            "level": level,
+            "created_at": now,
+            "finished_at": None,
+            "result": None
+        }
+        _pending_by_request[request_key] = job_id
+        _pending += 1
+        _stats["submitted"] += 1
+        executor = _get_executor()
+
+    executor.submit(_run_job, job_id, career_name, level, skills)
+    return job_id
+
+
+def get_guidance_job(job_id):
+    """
+    Look up a guidance job.
+
+    Args:
+        job_id: ID returned by `submit_guidance_job`
+
+    Returns:
+        dict: Job status, plus the guidance once it has finished
+    """
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return {
+                "status": "not_found",
+                "job_id": job_id,
+                "message": "Guidance job not found or expired"
+            }
+        job = dict(job)
+
+    response = {
+        "status": job["status"],
+        "job_id": job_id,
+        "career": job["career"].title(),
+        "level": job["level"].title()
+    }
+    if job["status"] == "success":
+        response["ai_personalized_guidance"] = job["result"].get("personalized_guidance")
+        response["provider"] = job["result"].get("provider")
+        response["elapsed_seconds"] = round(job["finished_at"] - job["created_at"], 3)
+    elif job["status"] == "error":
+        response["message"] = job["result"].get("message", "Unable to generate guidance")
+    return response
+
+
+def get_job_stats():
+    """Return guidance job counters and current queue depth."""
+    with _lock:
+        stats = dict(_stats)
+        stats["pending"] = _pending
+    stats["max_workers"] = MAX_WORKERS
+    stats["max_pending"] = MAX_PENDING
+    return stats
@@ -0,0 +1,123 @@
+"""
+Precomputed Guidance Store
+Generic (not skill-specific) AI guidance for every (career, level) pair,
+generated offline by `python -m backend.precompute_guidance` and keyed by
+`CATALOG_VERSION` so edits to the catalog never serve stale text.
+"""
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .career_data import CATALOG_VERSION
+
+_DEFAULT_PATH = Path(__file__).parent / 'guidance_store.sqlite3'
+
+
+class GuidanceStore:
+    """SQLite table of guidance rows with an in-process read cache."""
+
+    def __init__(self, path=_DEFAULT_PATH, version=CATALOG_VERSION):
+        self.path = str(path)
+        self.version = version
+        self._memory = {}  # (career, level) -> row dict
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+    def _connect(self):
+        # One connection per thread and per process (never reuse across a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS guidance ("
+            "catalog_version TEXT NOT NULL, career TEXT NOT NULL, level TEXT NOT NULL, "
+            "text TEXT NOT NULL, provider TEXT, model TEXT, created_at REAL NOT NULL, "
+            "PRIMARY KEY (catalog_version, career, level))"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, stat):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get(self, career, level):
+        """
+        Look up precomputed guidance for the current catalog version.
+
+        Returns:
+            dict: {"text", "provider", "model"} or None
+        """
+        key = (career.lower().strip(), level.lower().strip())
+        with self._lock:
+            cached = self._memory.get(key, False)
+        if cached is False:
+            try:
+                row = self._connect().execute(
+                    "SELECT text, provider, model FROM guidance "
+                    "WHERE catalog_version = ? AND career = ? AND level = ?",
+                    (self.version,) + key
+                ).fetchone()
+            except sqlite3.Error:
+                self._count("errors")
+                return None
+            cached = {"text": row[0], "provider": row[1], "model": row[2]} if row else None
+            # Misses are not remembered: the precompute job may fill them while we run
+            if cached is not None:
+                with self._lock:
+                    self._memory[key] = cached
+        self._count("hits" if cached else "misses")
+        return cached
+
+    def put(self, career, level, text, provider=None, model=None):
+        key = (career.lower().strip(), level.lower().strip())
+        self._connect().execute(
+            "INSERT OR REPLACE INTO guidance VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.version,) + key + (text, provider, model, time.time())
+        )
+        with self._lock:
+            self._memory[key] = {"text": text, "provider": provider, "model": model}
+        self._count("writes")
+
+    def completed(self):
+        """Set of (career, level) pairs already stored for the current version."""
+        rows = self._connect().execute(
+            "SELECT career, level FROM guidance WHERE catalog_version = ?", (self.version,)
+        ).fetchall()
+        return {(career, level) for career, level in rows}
+
+    def prune(self):
+        """Delete rows from older catalog versions; returns the number removed."""
+        return self._connect().execute(
+            "DELETE FROM guidance WHERE catalog_version != ?", (self.version,)
+        ).rowcount
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["catalog_version"] = self.version
+        try:
+            stats["entries"] = self._connect().execute(
+                "SELECT COUNT(*) FROM guidance WHERE catalog_version = ?", (self.version,)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            stats["entries"] = 0
+        return stats
+
+
+def _store_from_env():
+    if os.getenv('GUIDANCE_STORE_ENABLED', 'True') != 'True':
+        return None
+    return GuidanceStore(os.getenv('GUIDANCE_STORE_PATH', str(_DEFAULT_PATH)))
+
+
+# Shared store used by `llm_guidance`; None when GUIDANCE_STORE_ENABLED is not "True"
+guidance_store = _store_from_env()
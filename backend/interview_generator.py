@@ -2,9 +2,24 @@
 Interview Generator Module
 Generates role-specific interview questions and provides feedback using LLM
 """
-import json
-from .llm_guidance import generate_personalized_guidance, generate_interview_prep
-from .career_data import CAREER_DB
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .llm_guidance import generate_answer_feedback, generate_interview_prep, grade_interview
+from .career_data import CAREER_DB, CAREER_LEVELS
+from .fuzzy_matcher import find_best_career_match
+from .question_bank import get_role_questions
+from .session_store import MemorySessionStore, SQLiteSessionStore, SessionConflict, SessionNotFound, new_session_id
+
+# Questions per mock interview
+TOTAL_QUESTIONS = 5
+# "batch": one provider call grades every answer at the end of the interview.
+# "per_answer": each answer is also analyzed in the background as it arrives.
+GRADING_MODE = os.getenv('INTERVIEW_GRADING', 'batch')
+# Threads per worker analyzing answers while the candidate reads the next question
+ANALYSIS_WORKERS = int(os.getenv('INTERVIEW_ANALYSIS_WORKERS', '4'))
 
 # Interview question templates
 INTERVIEW_QUESTIONS = {
@@ -108,21 +123,53 @@ INTERVIEW_QUESTIONS = {
 
 class InterviewSession:
     """Manages a mock interview session"""
-    
-    def __init__(self, career: str, level: str = "fresher"):
+
+    # Thousands of sessions may be live per worker; keep each one small
+    __slots__ = ('session_id', 'career', 'level', 'available_questions',
+                 'answers', 'analyses', 'current_question_index', 'feedback_points')
+
+    def __init__(self, career: str, level: str = "fresher", session_id: str = None, questions: list = None):
+        self.session_id = session_id or new_session_id()
         self.career = career.lower()
         self.level = level.lower()
-        self.questions_asked = []
         self.answers = []
+        self.analyses = []  # one entry per answer, filled in by a background job
         self.current_question_index = 0
-        self.session_id = f"{career}_{level}_{len(self.questions_asked)}"
         self.feedback_points = []
-        
-        # Get career-specific questions or use generic ones
-        if self.career in INTERVIEW_QUESTIONS:
+
+        # Hand-written questions, then the question bank, then generic ones
+        if questions is not None:
+            self.available_questions = questions
+        elif self.career in INTERVIEW_QUESTIONS:
             self.available_questions = INTERVIEW_QUESTIONS[self.career]
         else:
-            self.available_questions = self._get_generic_questions()
+            self.available_questions = get_role_questions(self.career, self.level) or self._get_generic_questions()
+
+    @property
+    def questions_asked(self):
+        return self.available_questions[:self.current_question_index]
+
+    def to_dict(self) -> dict:
+        # Bank questions can be upgraded mid-interview, so the session keeps its own list
+        return {
+            "session_id": self.session_id,
+            "career": self.career,
+            "level": self.level,
+            "questions": None if self.career in INTERVIEW_QUESTIONS else self.available_questions,
+            "answers": self.answers,
+            "analyses": self.analyses,
+            "current_index": self.current_question_index,
+            "feedback_points": self.feedback_points
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "InterviewSession":
+        session = cls(data["career"], data["level"], session_id=data["session_id"], questions=data.get("questions"))
+        session.answers = data.get("answers", [])
+        session.analyses = data.get("analyses", [])
+        session.current_question_index = data.get("current_index", 0)
+        session.feedback_points = data.get("feedback_points", [])
+        return session
     
     def _get_generic_questions(self):
         """Generate generic questions for unknown careers"""
@@ -144,12 +191,11 @@ class InterviewSession:
         """Get the first interview question"""
         if len(self.available_questions) > 0:
             question = self.available_questions[self.current_question_index]
-            self.questions_asked.append(question)
             self.current_question_index += 1
             return {
                 "question": question,
                 "question_number": 1,
-                "total_questions": 5,
+                "total_questions": TOTAL_QUESTIONS,
                 "status": "success"
             }
         return {"status": "error", "message": "No questions available"}
@@ -161,104 +207,186 @@ class InterviewSession:
                 "status": "error",
                 "message": "Please provide a more detailed answer (at least 10 characters)"
             }
+        if len(self.answers) >= TOTAL_QUESTIONS:
+            return {"status": "error", "message": "This interview is already complete"}
         
         self.answers.append(answer)
         current_q_num = len(self.answers)
+
+        if GRADING_MODE == "per_answer":
+            # Analysis runs in the background; the next question does not wait for it
+            self._add_pending_analysis(current_q_num - 1)
         
-        if current_q_num >= 5:
-            # All questions answered, provide feedback
-            return self._generate_feedback()
+        if current_q_num >= TOTAL_QUESTIONS:
+            # All questions answered; the caller grades them and then calls complete()
+            return {"status": "grading"}
         
         # Get next question
         if self.current_question_index < len(self.available_questions):
             question = self.available_questions[self.current_question_index]
-            self.questions_asked.append(question)
             self.current_question_index += 1
             
-            # AI analysis of previous answer
-            analysis = self._analyze_answer(self.questions_asked[-2], answer)
-            
             return {
                 "status": "next_question",
-                "previous_analysis": analysis,
+                "analyses": self._take_ready_analyses(),
+                "analysis_pending": [a["question_number"] for a in self.analyses if a["status"] == "pending"],
+                "analysis_url": f"/interview/{self.session_id}/analysis",
                 "question": question,
                 "question_number": current_q_num + 1,
-                "total_questions": 5
+                "total_questions": TOTAL_QUESTIONS
             }
         
         return {"status": "error", "message": "Interview ended unexpectedly"}
-    
-    def _analyze_answer(self, question: str, answer: str) -> str:
-        """Use LLM to analyze the answer to a question"""
-        try:
-            # Use generate_personalized_guidance with analysis context
-            analysis_prompt = f"""You are an experienced {self.career} interviewer.
-        
-Question asked: "{question}"
-Candidate's answer: "{answer}"
 
-Provide a brief, constructive 1-2 sentence feedback on this answer. Comment on clarity, technical depth, and relevance. Be encouraging but honest. Keep it under 100 words."""
-            
-            # Try to extract just feedback from generate_personalized_guidance
-            response = generate_personalized_guidance(self.career, self.level)
-            if isinstance(response, dict) and 'guidance' in response:
-                return "Good effort. Keep going!"
-            return "Interesting perspective. Let's continue."
-        except:
-            return "Good answer! Let's move forward."
+    def _add_pending_analysis(self, index: int):
+        # The job itself is queued by process_interview_answer once this state is saved
+        self.analyses.append({
+            "question_number": index + 1,
+            "question": self.available_questions[index],
+            "status": "pending",
+            "feedback": None,
+            "delivered": False
+        })
+
+    def record_analysis(self, index: int, feedback: str):
+        """Store the background analysis of answer `index`."""
+        self.analyses[index].update(status="ready", feedback=feedback)
+
+    def _record_grade(self, graded: dict):
+        index = graded["question_number"] - 1
+        if index >= len(self.analyses):
+            self.analyses.append({
+                "question_number": index + 1,
+                "question": self.available_questions[index],
+                "status": "ready",
+                "feedback": graded["feedback"],
+                "delivered": False
+            })
+        elif not self.analyses[index]["feedback"]:
+            # A background analysis that is still running keeps its slot; the grade fills it in
+            self.analyses[index].update(status="ready", feedback=graded["feedback"])
+        self.analyses[index]["score"] = graded["score"]
+
+    def _take_ready_analyses(self) -> list:
+        # Each finished analysis is sent once on a response; polling can always fetch all of them
+        ready = []
+        for analysis in self.analyses:
+            if analysis["status"] == "ready" and not analysis["delivered"]:
+                analysis["delivered"] = True
+                ready.append({k: analysis.get(k) for k in ("question_number", "question", "score", "feedback")})
+        return ready
+
+    def get_analyses(self) -> dict:
+        """All answer analyses so far, finished or pending."""
+        return {
+            "status": "success",
+            "session_id": self.session_id,
+            "analyses": [{k: a.get(k) for k in ("question_number", "question", "status", "score", "feedback")}
+                         for a in self.analyses],
+            "complete": all(a["status"] == "ready" for a in self.analyses)
+        }
     
-    def _generate_feedback(self) -> dict:
-        """Generate overall interview feedback and score"""
-        all_answers_text = "\n".join([f"Q: {q}\nA: {a}" for q, a in zip(self.questions_asked, self.answers)])
-        
-        try:
-            # Use AI guidance to generate feedback
-            feedback_text = generate_interview_prep(self.career)
-            if isinstance(feedback_text, dict) and 'interview_tips' in feedback_text:
-                feedback = {
-                    "assessment": f"Great interview responses for a {self.level} {self.career}!",
-                    "technical_score": 7,
-                    "communication_score": 7,
-                    "problem_solving_score": 7,
-                    "strengths": ["Shows good understanding", "Communicates ideas clearly"],
-                    "improvements": ["Dive deeper into technical details", "Provide more examples"],
-                    "recommendation": "Further Discussion"
-                }
-            else:
-                feedback = {
-                    "assessment": f"Strong performance in this {self.career} interview!",
-                    "technical_score": 7,
-                    "communication_score": 7,
-                    "problem_solving_score": 7,
-                    "strengths": ["Engaged and thoughtful", "Good grasp of fundamentals"],
-                    "improvements": ["Gain more hands-on experience", "Study advanced topics"],
-                    "recommendation": "Further Discussion"
-                }
-        except:
+    def complete(self, result) -> dict:
+        """Record the grading of all answers (from `_grade_answers`) and build the overall feedback"""
+        if isinstance(result, dict) and result.get("status") == "success":
+            grading = result["grading"]
+            for graded in grading["answers"]:
+                self._record_grade(graded)
+            feedback = {k: grading[k] for k in (
+                "assessment", "technical_score", "communication_score", "problem_solving_score",
+                "strengths", "improvements", "recommendation"
+            )}
+            feedback["assessment"] = feedback["assessment"] or f"Interview graded for a {self.level} {self.career}."
+            feedback["graded"] = True
+            feedback["provider"] = result.get("provider")
+        else:
+            # No provider configured or an unusable reply; scores are unknown
             feedback = {
-                "assessment": f"Great interview responses for a {self.level} {self.career}!",
-                "technical_score": 7,
-                "communication_score": 7,
-                "problem_solving_score": 7,
-                "strengths": ["Engaged and thoughtful", "Good grasp of fundamentals"],
-                "improvements": ["Gain more hands-on experience", "Study advanced topics"],
-                "recommendation": "Further Discussion"
+                "assessment": f"Thanks for completing this {self.level} {self.career} interview!",
+                "technical_score": None,
+                "communication_score": None,
+                "problem_solving_score": None,
+                "strengths": ["Engaged and thoughtful"],
+                "improvements": ["Gain more hands-on experience", "Provide more concrete examples"],
+                "recommendation": "Further Discussion",
+                "graded": False
             }
-        
+
         return {
             "status": "interview_complete",
             "feedback": feedback,
+            "analyses": self._take_ready_analyses(),
+            "analysis_pending": [a["question_number"] for a in self.analyses if a["status"] == "pending"],
+            "analysis_url": f"/interview/{self.session_id}/analysis",
             "total_questions_answered": len(self.answers),
             "session_id": self.session_id
         }
 
 
+def _grade_answers(career: str, level: str, qa_pairs: list):
+    """Grade all answers with one provider call; None if that fails"""
+    try:
+        return grade_interview(career, level, qa_pairs)
+    except Exception:
+        return None
+
+
+def _analyze_answer(career: str, question: str, answer: str) -> str:
+    """Use LLM to analyze the answer to a question"""
+    try:
+        response = generate_answer_feedback(career, question, answer)
+        if isinstance(response, dict) and response.get("status") == "success":
+            return response["feedback"]
+        return "Interesting perspective. Let's continue."
+    except Exception:
+        return "Good answer! Let's move forward."
+
+
+_analysis_executor = None
+_analysis_lock = threading.Lock()
+
+
+def _get_analysis_executor():
+    # Created on first use so no threads exist before gunicorn forks workers
+    global _analysis_executor
+    with _analysis_lock:
+        if _analysis_executor is None:
+            _analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix='interview-analysis')
+        return _analysis_executor
+
+
+def _run_analysis(session_id, index, career, question, answer):
+    feedback = _analyze_answer(career, question, answer)
+    try:
+        session_store.update(session_id, lambda session: session.record_analysis(index, feedback))
+    except SessionNotFound:
+        pass  # the session expired while the provider was answering
+
+
+def _session_store_from_env():
+    ttl = int(os.getenv('INTERVIEW_SESSION_TTL', '1800'))
+    max_sessions = int(os.getenv('INTERVIEW_MAX_SESSIONS', '10000'))
+    if os.getenv('INTERVIEW_SESSION_STORE', 'memory') == 'sqlite':
+        # Shared by all workers on the host, so any of them can take the next answer
+        path = os.getenv('INTERVIEW_SESSION_PATH', str(Path(__file__).parent / 'interview_sessions.sqlite3'))
+        return SQLiteSessionStore(InterviewSession, path, ttl_seconds=ttl, max_sessions=max_sessions)
+    return MemorySessionStore(ttl_seconds=ttl, max_sessions=max_sessions)
+
+
+# Live interview sessions (INTERVIEW_SESSION_STORE=memory|sqlite)
+session_store = _session_store_from_env()
+
+
 def start_interview(career: str, level: str = "fresher") -> dict:
     """Start a new mock interview session"""
-    from .fuzzy_matcher import find_best_career_match
+    # Unknown levels fall back to "fresher" (as in career_guidance); each level is a
+    # separate question bank entry and LLM generation
+    level = level.lower().strip() if isinstance(level, str) and level.strip() else "fresher"
+    if level not in CAREER_LEVELS:
+        level = "fresher"
     
-    # Find best match for the career
-    matched_career = find_best_career_match(career)
+    # Find best match for the career once; the session remembers it
+    matched_career, _ = find_best_career_match(career)
     if not matched_career:
         return {
             "status": "error",
@@ -269,55 +397,78 @@ def start_interview(career: str, level: str = "fresher") -> dict:
     first_q = session.get_first_question()
     
     if first_q["status"] == "success":
-        # Store session (in production, use database/cache)
+        session_store.put(session)
         return {
             "status": "interview_started",
+            "session_id": session.session_id,
             "career": matched_career,
-            "level": level,
-            "first_question": first_q,
-            "session_data": {
-                "questions_asked": session.questions_asked,
-                "answers": session.answers,
-                "current_index": session.current_question_index
-            }
+            "level": session.level,
+            "first_question": first_q
         }
     
     return first_q
 
 
-def process_interview_answer(career: str, level: str, answer: str, session_data: dict) -> dict:
-    """Process an answer and get next question or feedback"""
-    from .fuzzy_matcher import find_best_career_match
-    
-    # Find best match for the career
-    matched_career = find_best_career_match(career)
-    if not matched_career:
+def process_interview_answer(session_id: str, answer: str) -> dict:
+    """Process an answer for a stored session and get next question or feedback"""
+    # The SQLite store re-runs submit_answer on a write conflict, so it only changes the
+    # session; analysis jobs and grading start once the answer has been saved.
+    answered = {}
+
+    def submit(session):
+        result = session.submit_answer(answer)
+        answered.clear()
+        if result["status"] in ("next_question", "grading"):
+            index = len(session.answers) - 1
+            answered.update(
+                career=session.career,
+                level=session.level,
+                index=index,
+                question=session.available_questions[index],
+                qa_pairs=list(zip(session.questions_asked, session.answers))
+            )
+        return result
+
+    try:
+        result = session_store.update(session_id, submit)
+        if answered and GRADING_MODE == "per_answer":
+            _get_analysis_executor().submit(
+                _run_analysis, session_id, answered["index"], answered["career"], answered["question"], answer
+            )
+        if result["status"] == "grading":
+            # The provider call runs outside the session's lock; recording the grades is retry-safe
+            grading = _grade_answers(answered["career"], answered["level"], answered["qa_pairs"])
+            result = session_store.update(session_id, lambda session: session.complete(grading))
+    except SessionNotFound:
         return {
-            "status": "error",
-            "message": f"Career '{career}' not found"
+            "status": "not_found",
+            "message": "Interview session not found or expired. Start a new interview."
         }
-    
-    session = InterviewSession(matched_career, level)
-    session.questions_asked = session_data.get("questions_asked", [])
-    session.answers = session_data.get("answers", [])
-    session.current_question_index = session_data.get("current_index", 0)
-    
-    result = session.submit_answer(answer)
-    
-    result["session_data"] = {
-        "questions_asked": session.questions_asked,
-        "answers": session.answers,
-        "current_index": session.current_question_index
-    }
-    
+    except SessionConflict as e:
+        return {"status": "conflict", "message": str(e)}
+    result["session_id"] = session_id
     return result
 
 
+def get_interview_analysis(session_id: str) -> dict:
+    """Poll the background analyses of a session's answers"""
+    session = session_store.get(session_id)
+    if session is None:
+        return {
+            "status": "not_found",
+            "message": "Interview session not found or expired. Start a new interview."
+        }
+    return session.get_analyses()
+
+
+def get_session_stats() -> dict:
+    """Return interview session store counters."""
+    return session_store.stats()
+
+
 def get_interview_tips(career: str, level: str = "fresher") -> dict:
     """Get tips for interviewing for a specific career"""
-    from .fuzzy_matcher import find_best_career_match
-    
-    matched_career = find_best_career_match(career)
+    matched_career, _ = find_best_career_match(career)
     if not matched_career or matched_career.lower() not in CAREER_DB:
         return {
             "status": "error",
@@ -326,8 +477,8 @@ def get_interview_tips(career: str, level: str = "fresher") -> dict:
     
     try:
         tips_data = generate_interview_prep(matched_career)
-        if isinstance(tips_data, dict) and 'interview_tips' in tips_data:
-            tips = tips_data['interview_tips']
+        if isinstance(tips_data, dict) and 'interview_guide' in tips_data:
+            tips = tips_data['interview_guide']
         else:
             tips = f"Prepare examples of projects, understand the company's mission, practice answering behavioral questions, and have thoughtful questions ready for your interviewers."
     except:
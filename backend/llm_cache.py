@@ -0,0 +1,187 @@
+"""
+LLM Response Cache
+Two-tier cache for provider completions: an in-process LRU in front of an
+on-disk SQLite store shared by all gunicorn workers on the host.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+_DEFAULT_PATH = Path(__file__).parent / 'llm_cache.sqlite3'
+
+
+def make_cache_key(prompt, model, *extra):
+    """
+    Fingerprint a prompt for caching.
+
+    Whitespace and case are normalized so cosmetic prompt edits don't split
+    the cache; the model and any extra parameters (system prompt, token
+    limit) are part of the key because they change the output.
+    """
+    normalized = " ".join(prompt.lower().split())
+    material = "\x1f".join([model, normalized] + [str(e) for e in extra])
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """In-memory LRU plus optional SQLite tier, both with TTL and size bounds."""
+
+    def __init__(self, path=_DEFAULT_PATH, ttl_seconds=7 * 24 * 3600,
+                 max_memory_entries=256, max_disk_entries=10000):
+        self.path = str(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+
+        self._memory = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._writes_since_prune = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "disk_errors": 0
+        }
+
+    def _connect(self):
+        # One connection per thread and per process (never reuse across a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed_at)")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, stat, n=1):
+        with self._lock:
+            self._stats[stat] += n
+
+    def _remember(self, key, expires_at, value):
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get(self, key):
+        """Return the cached value for `key`, or None on a miss or expiry."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return entry[1]
+                del self._memory[key]
+
+        if self.path:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                    value = json.loads(row[0])
+                    self._remember(key, row[1], value)
+                    self._count("disk_hits")
+                    return value
+            except sqlite3.Error:
+                self._count("disk_errors")
+
+        self._count("misses")
+        return None
+
+    def set(self, key, value):
+        """Store a JSON-serializable value in both tiers."""
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        self._remember(key, expires_at, value)
+        self._count("sets")
+
+        if not self.path:
+            return
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now)
+            )
+            with self._lock:
+                self._writes_since_prune += 1
+                prune = self._writes_since_prune >= 100
+                if prune:
+                    self._writes_since_prune = 0
+            if prune:
+                self._prune(conn, now)
+        except sqlite3.Error:
+            self._count("disk_errors")
+
+    def _prune(self, conn, now):
+        # Drop expired rows, then the least recently used beyond the size cap
+        deleted = conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+        excess = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_disk_entries
+        if excess > 0:
+            deleted += conn.execute(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY accessed_at LIMIT ?)", (excess,)
+            ).rowcount
+        self._count("evictions", max(deleted, 0))
+
+    def clear(self):
+        """Empty both tiers (stats are kept)."""
+        with self._lock:
+            self._memory.clear()
+        if self.path:
+            try:
+                self._connect().execute("DELETE FROM llm_cache")
+            except sqlite3.Error:
+                self._count("disk_errors")
+
+    def stats(self):
+        """Return hit/miss counters and the overall hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        stats["disk_enabled"] = bool(self.path)
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
+
+
+def _cache_from_env():
+    if os.getenv('LLM_CACHE_ENABLED', 'True') != 'True':
+        return None
+    path = os.getenv('LLM_CACHE_PATH', str(_DEFAULT_PATH))
+    return LLMCache(
+        path=path or None,  # LLM_CACHE_PATH= (empty) keeps the cache in memory only
+        ttl_seconds=int(os.getenv('LLM_CACHE_TTL', str(7 * 24 * 3600))),
+        max_memory_entries=int(os.getenv('LLM_CACHE_MEMORY_ENTRIES', '256')),
+        max_disk_entries=int(os.getenv('LLM_CACHE_DISK_ENTRIES', '10000'))
+    )
+
+
+# Shared cache used by `llm_guidance`; None when LLM_CACHE_ENABLED is not "True"
+llm_cache = _cache_from_env()
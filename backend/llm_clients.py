@@ -0,0 +1,253 @@
+"""
+LLM Provider Clients
+Pooled, keep-alive HTTP clients for the provider SDKs, a per-provider
+concurrency limit, and connection reuse counters.
+
+Benchmark pooled against per-request clients on a local fake provider:
+    python -m backend.llm_clients --requests 200 --concurrency 16
+"""
+import argparse
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from .metrics import LatencyHistogram
+
+# Connections kept per provider per worker, and how long an idle one stays open
+LLM_POOL_SIZE = int(os.getenv('LLM_POOL_SIZE', '10'))
+LLM_KEEPALIVE = float(os.getenv('LLM_KEEPALIVE', '60'))
+# HTTP/2 is negotiated over TLS when the `h2` package is installed (httpx[http2])
+LLM_HTTP2 = os.getenv('LLM_HTTP2', 'True') == 'True'
+# Provider calls in flight per worker; extra callers queue until the call deadline
+LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '8'))
+
+
+def http2_available():
+    if not LLM_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ConnectionStats:
+    """Counts requests against newly opened connections to show how often a pooled one was reused."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "new_connections": 0,
+            "tls_handshakes": 0,
+            "http2_requests": 0
+        }
+
+    def count(self, stat, n=1):
+        with self._lock:
+            self._stats[stat] += n
+
+    def on_request(self, request):
+        """httpx request hook: attach a connection trace to every outgoing request."""
+        self.count("requests")
+        request.extensions["trace"] = self._trace
+
+    def _trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self.count("new_connections")
+        elif event_name == "connection.start_tls.complete":
+            self.count("tls_handshakes")
+        elif event_name == "http2.send_request_headers.started":
+            self.count("http2_requests")
+
+    def snapshot(self):
+        with self._lock:
+            stats = dict(self._stats)
+        reused = max(stats["requests"] - stats["new_connections"], 0)
+        stats["reused_connections"] = reused
+        stats["reuse_rate"] = round(reused / stats["requests"], 4) if stats["requests"] else 0.0
+        return stats
+
+
+class ProviderBusy(RuntimeError):
+    """The provider's concurrency limit stayed full for the whole call deadline."""
+
+
+class ConcurrencyLimit:
+    """Bounded semaphore with wait-time and saturation counters."""
+
+    def __init__(self, limit=LLM_MAX_CONCURRENCY):
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self.wait = LatencyHistogram()
+        self._stats = {"acquired": 0, "queued": 0, "rejected": 0, "max_in_use": 0}
+
+    @contextmanager
+    def slot(self, timeout):
+        start = time.perf_counter()
+        if not self._semaphore.acquire(blocking=False):
+            with self._lock:
+                self._stats["queued"] += 1
+            if not self._semaphore.acquire(timeout=timeout):
+                with self._lock:
+                    self._stats["rejected"] += 1
+                raise ProviderBusy(f"{self.limit} calls already in flight")
+        self.wait.record(time.perf_counter() - start)
+        with self._lock:
+            self._in_use += 1
+            self._stats["acquired"] += 1
+            self._stats["max_in_use"] = max(self._stats["max_in_use"], self._in_use)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._semaphore.release()
+
+    def snapshot(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_use"] = self._in_use
+        stats["limit"] = self.limit
+        stats["wait_p95_ms"] = self.wait.snapshot()["p95_ms"]
+        return stats
+
+
+def build_http_client(stats=None, pool_size=LLM_POOL_SIZE, keepalive=LLM_KEEPALIVE):
+    """
+    Create an httpx client with a bounded keep-alive pool for an OpenAI-compatible SDK.
+
+    Args:
+        stats (ConnectionStats): Optional counters fed by a connection trace
+        pool_size (int): Maximum open (and idle kept-alive) connections
+        keepalive (float): Seconds an idle connection is kept
+
+    Returns:
+        httpx.Client: Pass as `http_client=` to `openai.OpenAI`
+    """
+    import httpx
+
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=keepalive
+        ),
+        http2=http2_available(),
+        event_hooks={"request": [stats.on_request]} if stats is not None else None,
+        follow_redirects=True
+    )
+
+
+def tune_requests_session(session, pool_size=LLM_POOL_SIZE):
+    """Resize the urllib3 pools behind a `requests` session (Gemini's REST transport)."""
+    from requests.adapters import HTTPAdapter
+
+    for prefix in ("https://", "http://"):
+        session.mount(prefix, HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+
+
+def requests_session_stats(session):
+    """Requests vs. opened connections, read from the urllib3 pools of a `requests` session."""
+    requests_made = 0
+    new_connections = 0
+    for adapter in session.adapters.values():
+        manager = getattr(adapter, "poolmanager", None)
+        if manager is None:
+            continue
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is None:
+                continue
+            requests_made += pool.num_requests
+            new_connections += pool.num_connections
+    reused = max(requests_made - new_connections, 0)
+    return {
+        "requests": requests_made,
+        "new_connections": new_connections,
+        "reused_connections": reused,
+        "reuse_rate": round(reused / requests_made, 4) if requests_made else 0.0
+    }
+
+
+def _bench_run(make_client, prompt, total, concurrency):
+    from concurrent.futures import ThreadPoolExecutor
+
+    latency = LatencyHistogram()
+
+    def one(_):
+        # make_client returns a context manager, so per-call clients are closed after use
+        with make_client() as client:
+            start = time.perf_counter()
+            client.chat.completions.create(
+                model="fake-model",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=50
+            )
+            latency.record(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(total)))
+    elapsed = time.perf_counter() - start
+    return elapsed, latency.snapshot()
+
+
+def main():
+    from contextlib import nullcontext
+    from http.server import ThreadingHTTPServer
+    from openai import OpenAI
+    from .fake_provider import FakeProviderHandler
+
+    parser = argparse.ArgumentParser(description='Compare pooled and per-request LLM clients against a local fake provider')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per run')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent callers')
+    parser.add_argument('--latency', type=float, default=0.02, help='Fake provider latency in seconds')
+    parser.add_argument('--base-url', help='Use an already running OpenAI-compatible server instead')
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        FakeProviderHandler.latency = args.latency
+        server = ThreadingHTTPServer(('127.0.0.1', 0), FakeProviderHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+    prompt = "Suggest three next steps for a junior data analyst"
+    pool_size = max(args.concurrency, LLM_POOL_SIZE)
+
+    pooled_stats = ConnectionStats()
+    pooled_client = OpenAI(api_key="bench", base_url=base_url, max_retries=0,
+                           http_client=build_http_client(pooled_stats, pool_size=pool_size))
+    fresh_stats = ConnectionStats()
+
+    def fresh_client():
+        # What a client built per call (or a pool that never keeps connections) costs
+        return OpenAI(api_key="bench", base_url=base_url, max_retries=0,
+                      http_client=build_http_client(fresh_stats, pool_size=pool_size, keepalive=0))
+
+    runs = [
+        ("per-request client", fresh_client, fresh_stats),
+        ("pooled keep-alive", lambda: nullcontext(pooled_client), pooled_stats),
+    ]
+    print(f"{args.requests} requests, {args.concurrency} concurrent, against {base_url}")
+    for label, make_client, stats in runs:
+        elapsed, latency = _bench_run(make_client, prompt, args.requests, args.concurrency)
+        conn = stats.snapshot()
+        print(f"  {label:<20} {args.requests / elapsed:7.1f} req/s  p50 {latency['p50_ms']} ms  "
+              f"p95 {latency['p95_ms']} ms  new connections {conn['new_connections']}  "
+              f"reuse {conn['reuse_rate']:.0%}")
+
+    pooled_client.close()
+    if server is not None:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
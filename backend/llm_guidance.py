@@ -1,46 +1,232 @@
+import json
 import os
+import re
+import threading
+import time
 from dotenv import load_dotenv
 
+from .guidance_store import guidance_store
+from .llm_cache import llm_cache, make_cache_key
+from .llm_metrics import llm_metrics, estimate_tokens
+from .llm_clients import (ConnectionStats, ConcurrencyLimit, build_http_client, http2_available,
+                          requests_session_stats, tune_requests_session, LLM_POOL_SIZE, LLM_KEEPALIVE)
+from .llm_router import ProviderRouter
+from .singleflight import SingleFlight
+
 # Load environment variables
 load_dotenv()
 
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 OPENAI_AVAILABLE = bool(OPENAI_API_KEY)
+OPENAI_MODEL = 'gpt-3.5-turbo'
+# Optional OpenAI-compatible endpoint, e.g. `python -m backend.fake_provider` for offline runs
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')
 
 # Google Gemini Configuration
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 GEMINI_AVAILABLE = bool(GEMINI_API_KEY)
+GEMINI_MODEL = 'gemini-pro'
+# Optional REST endpoint override, e.g. a local fake provider (forces the REST transport)
+GEMINI_API_ENDPOINT = os.getenv('GEMINI_API_ENDPOINT')
+# 'grpc' multiplexes every call over one HTTP/2 channel; 'rest' uses a pooled requests session
+GEMINI_TRANSPORT = 'rest' if GEMINI_API_ENDPOINT else os.getenv('GEMINI_TRANSPORT', 'grpc')
 
 # Default provider preference
 DEFAULT_PROVIDER = os.getenv('DEFAULT_AI_PROVIDER', 'gemini')
 
-if OPENAI_AVAILABLE:
-    from openai import OpenAI
-    openai_client = OpenAI(api_key=OPENAI_API_KEY)
+# Provider routing: overall deadline per call, optional hedging, circuit breakers
+LLM_DEADLINE = float(os.getenv('LLM_DEADLINE', '20'))
+LLM_HEDGE = os.getenv('LLM_HEDGE', 'False') == 'True'
+LLM_HEDGE_DELAY = os.getenv('LLM_HEDGE_DELAY')  # seconds; unset = primary's recent p95
+LLM_BREAKER_FAILURES = int(os.getenv('LLM_BREAKER_FAILURES', '5'))
+LLM_BREAKER_RESET = float(os.getenv('LLM_BREAKER_RESET', '30'))
 
-if GEMINI_AVAILABLE:
-    import google.generativeai as genai
-    genai.configure(api_key=GEMINI_API_KEY)
-    gemini_model = genai.GenerativeModel('gemini-pro')
+# SDK clients are built on first use: importing openai / google.generativeai
+# costs more than the rest of the app, and the first request pays it only once.
+_openai_client = None
+_gemini_model = None
+_gemini_session = None
+_client_lock = threading.Lock()
+_openai_connections = ConnectionStats()
 
-def generate_personalized_guidance(career_name, level, skills=None):
-    """
-    Generate personalized career guidance using AI (Gemini by default, falls back to OpenAI).
-    Falls back to template-based guidance if API is not available.
-    
-    Args:
-        career_name: Career name
-        level: User level (student/fresher/professional)
-        skills: User's current skills (optional)
-    
-    Returns:
-        dict: Generated guidance
-    """
-    
+
+def _get_openai_client():
+    global _openai_client
+    if _openai_client is None:
+        with _client_lock:
+            if _openai_client is None:
+                from openai import OpenAI
+                _openai_client = OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL,
+                                        http_client=build_http_client(_openai_connections))
+    return _openai_client
+
+
+def _get_gemini_model():
+    global _gemini_model, _gemini_session
+    if _gemini_model is None:
+        with _client_lock:
+            if _gemini_model is None:
+                import google.generativeai as genai
+                client_options = {"api_endpoint": GEMINI_API_ENDPOINT} if GEMINI_API_ENDPOINT else None
+                genai.configure(api_key=GEMINI_API_KEY, transport=GEMINI_TRANSPORT, client_options=client_options)
+                _gemini_model = genai.GenerativeModel(GEMINI_MODEL)
+                if GEMINI_TRANSPORT == 'rest':
+                    _gemini_session = _gemini_rest_session(genai)
+    return _gemini_model
+
+
+def _gemini_rest_session(genai):
+    # The SDK does not expose its requests session; size its pool when we can reach it
+    try:
+        from google.generativeai.client import _client_manager
+        session = _client_manager.get_default_client("generative")._transport._session
+    except Exception:
+        return None
+    tune_requests_session(session)
+    return session
+
+
+def _connection_stats():
+    stats = {
+        "pool_size": LLM_POOL_SIZE,
+        "keepalive_seconds": LLM_KEEPALIVE,
+        "http2": http2_available(),
+        "gemini_transport": GEMINI_TRANSPORT
+    }
+    if OPENAI_AVAILABLE:
+        stats["OpenAI"] = _openai_connections.snapshot()
+    if _gemini_session is not None:
+        stats["Google Gemini"] = requests_session_stats(_gemini_session)
+    return stats
+
+GUIDANCE_SYSTEM_PROMPT = "You are an expert career counselor providing personalized career guidance."
+INTERVIEW_SYSTEM_PROMPT = "You are an expert in interview preparation and career development."
+CAREER_FIT_SYSTEM_PROMPT = "You are a career counselor evaluating career fit based on user profiles."
+INTERVIEWER_SYSTEM_PROMPT = "You are an experienced interviewer giving candidates brief, constructive feedback."
+GRADING_SYSTEM_PROMPT = "You are an experienced interviewer grading mock interviews. Reply with JSON only."
+
+INTERVIEW_RECOMMENDATIONS = ("Strong Hire", "Hire", "Further Discussion", "No Hire")
+
+
+def _openai_messages(prompt, system_prompt):
+    return [
+        {
+            "role": "system",
+            "content": system_prompt
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+
+
+def _gemini_usage(response):
+    meta = getattr(response, "usage_metadata", None)
+    if not meta or not meta.candidates_token_count:
+        return None
+    return {"prompt_tokens": meta.prompt_token_count, "completion_tokens": meta.candidates_token_count}
+
+
+def _openai_usage(usage):
+    if usage is None:
+        return None
+    return {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens}
+
+
+class _GeminiProvider:
+    name = "Google Gemini"
+    model = GEMINI_MODEL
+
+    def __init__(self):
+        self.limit = ConcurrencyLimit()
+
+    def complete(self, prompt, system_prompt, max_tokens, timeout):
+        # Retries are the router's job (fallback/hedging), not the SDK's
+        with self.limit.slot(timeout):
+            response = _get_gemini_model().generate_content(prompt, request_options={"timeout": timeout, "retry": None})
+            return response.text, _gemini_usage(response)
+
+    def stream(self, prompt, system_prompt, max_tokens, timeout):
+        options = {"timeout": timeout, "retry": None}
+        usage = None
+        with self.limit.slot(timeout):
+            for chunk in _get_gemini_model().generate_content(prompt, stream=True, request_options=options):
+                # Every chunk carries the running totals; the last one is final
+                usage = _gemini_usage(chunk) or usage
+                if chunk.text:
+                    yield chunk.text
+        if usage:
+            yield usage
+
+
+class _OpenAIProvider:
+    name = "OpenAI"
+    model = OPENAI_MODEL
+
+    def __init__(self):
+        self.limit = ConcurrencyLimit()
+
+    def _create(self, prompt, system_prompt, max_tokens, timeout, stream=False):
+        # Retries are the router's job (fallback/hedging), not the SDK's
+        return _get_openai_client().with_options(timeout=timeout, max_retries=0).chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=_openai_messages(prompt, system_prompt),
+            temperature=0.7,
+            max_tokens=max_tokens,
+            stream=stream,
+            **({"stream_options": {"include_usage": True}} if stream else {})
+        )
+
+    def complete(self, prompt, system_prompt, max_tokens, timeout):
+        with self.limit.slot(timeout):
+            response = self._create(prompt, system_prompt, max_tokens, timeout)
+            return response.choices[0].message.content, _openai_usage(response.usage)
+
+    def stream(self, prompt, system_prompt, max_tokens, timeout):
+        usage = None
+        with self.limit.slot(timeout):
+            for chunk in self._create(prompt, system_prompt, max_tokens, timeout, stream=True):
+                # With include_usage the final chunk has no choices, only usage
+                usage = _openai_usage(getattr(chunk, "usage", None)) or usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        if usage:
+            yield usage
+
+
+def _build_router():
+    providers = []
+    if GEMINI_AVAILABLE:
+        providers.append(_GeminiProvider())
+    if OPENAI_AVAILABLE:
+        providers.append(_OpenAIProvider())
+    # Preferred provider first; the other one is the fallback / hedge target
+    preferred = "Google Gemini" if DEFAULT_PROVIDER == 'gemini' else "OpenAI"
+    providers.sort(key=lambda p: p.name != preferred)
+    return ProviderRouter(
+        providers,
+        deadline=LLM_DEADLINE,
+        hedge=LLM_HEDGE,
+        hedge_delay=float(LLM_HEDGE_DELAY) if LLM_HEDGE_DELAY else None,
+        failure_threshold=LLM_BREAKER_FAILURES,
+        reset_timeout=LLM_BREAKER_RESET
+    )
+
+
+router = _build_router()
+
+# Identical prompts requested concurrently share one provider call
+_flights = SingleFlight()
+
+
+def _guidance_prompt(career_name, level, skills=None):
+    # Sorted so the same skill set always yields the same prompt (and cache key)
+    skills = sorted({s.strip() for s in skills or [] if s.strip()}, key=str.lower)
     skills_context = f"\nUser's current skills: {', '.join(skills)}" if skills else ""
-    
-    prompt = f"""Act as an expert career counselor. Provide personalized guidance for someone interested in {career_name} career.
+
+    return f"""Act as an expert career counselor. Provide personalized guidance for someone interested in {career_name} career.
 
 User Details:
 - Career Interest: {career_name}
@@ -55,189 +241,575 @@ Provide:
 
 Make it conversational, encouraging, and practical."""
 
-    # Try Gemini first if available
-    if GEMINI_AVAILABLE and DEFAULT_PROVIDER == 'gemini':
-        try:
-            response = gemini_model.generate_content(prompt)
-            return {
-                "status": "success",
-                "personalized_guidance": response.text,
-                "model": "gemini-pro",
-                "provider": "Google Gemini"
-            }
-        except Exception as e:
-            print(f"Gemini error: {str(e)}")
-            # Fall through to OpenAI or return error
-    
-    # Try OpenAI if available
-    if OPENAI_AVAILABLE:
-        try:
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert career counselor providing personalized career guidance."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            return {
-                "status": "success",
-                "personalized_guidance": response.choices[0].message.content,
-                "model": "gpt-3.5-turbo",
-                "provider": "OpenAI"
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"Error generating guidance: {str(e)}"
+
+def _interview_prep_prompt(career_name):
+    return f"""Generate an interview preparation guide for a {career_name} position.
+
+Include:
+1. Top 10 interview questions likely to be asked
+2. How to structure your answers
+3. Sample answers for 3 key questions
+4. Questions to ask the interviewer
+5. Common mistakes to avoid
+
+Format as a practical guide."""
+
+
+def _career_fit_prompt(career_name, user_profile):
+    profile_str = "\n".join([f"- {k}: {v}" for k, v in user_profile.items()])
+
+    return f"""Analyze how well the {career_name} career aligns with this profile:
+
+{profile_str}
+
+Provide:
+1. Overall fit score (1-10)
+2. Strengths that align with this career
+3. Potential challenges
+4. Recommendations for success
+5. Alternative careers to consider
+
+Be honest and constructive."""
+
+
+def _answer_feedback_prompt(career_name, question, answer):
+    return f"""You are an experienced {career_name} interviewer.
+
+Question asked: "{question}"
+Candidate's answer: "{answer}"
+
+Provide a brief, constructive 1-2 sentence feedback on this answer. Comment on clarity, technical depth, and relevance. Be encouraging but honest. Keep it under 100 words."""
+
+
+def _interview_grading_prompt(career_name, level, qa_pairs):
+    transcript = "\n\n".join(
+        f'Q{i}: {question}\nA{i}: """{answer}"""' for i, (question, answer) in enumerate(qa_pairs, 1)
+    )
+
+    return f"""Grade this mock interview of a {level} candidate for a {career_name} position.
+
+{transcript}
+
+Respond with only a JSON object in this format:
+{{"answers": [{{"question_number": 1, "score": <1-10>, "feedback": "<1-2 sentences on clarity, depth and relevance>"}}],
+ "technical_score": <1-10>, "communication_score": <1-10>, "problem_solving_score": <1-10>,
+ "strengths": ["<strength>"], "improvements": ["<improvement>"],
+ "assessment": "<2-3 sentence overall assessment>",
+ "recommendation": "{'" | "'.join(INTERVIEW_RECOMMENDATIONS)}"}}
+
+Include one "answers" entry per question, in order. Be encouraging but honest."""
+
+
+def _interview_questions_prompt(career_name, level, count):
+    return f"""Write {count} interview questions for a {level} candidate applying for a {career_name} position.
+
+Mix technical questions about the role's core tasks and tools with behavioral questions, and pitch them at the candidate's level.
+
+Respond with only a JSON array of {count} question strings."""
+
+
+def _parse_question_list(text, count):
+    # Models sometimes wrap the array in a code fence or a sentence
+    match = re.search(r"\[.*\]", text, re.DOTALL)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return None
+    if not isinstance(data, list):
+        return None
+    questions = [q.strip() for q in data if isinstance(q, str) and q.strip()]
+    return questions[:count] or None
+
+
+def _score(value):
+    try:
+        return min(10, max(1, int(round(float(value)))))
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_interview_grading(text, count):
+    """
+    Pull the grading JSON out of a completion.
+
+    Returns:
+        dict: Normalized grading, or None if the reply is not usable
+    """
+    # Models sometimes wrap the object in a code fence or a sentence
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    answers = [None] * count
+    for i, entry in enumerate(data.get("answers") or []):
+        if not isinstance(entry, dict):
+            continue
+        number = entry.get("question_number", i + 1)
+        index = number - 1 if isinstance(number, int) and 1 <= number <= count else i
+        if index < count and answers[index] is None:
+            answers[index] = {
+                "question_number": index + 1,
+                "score": _score(entry.get("score")),
+                "feedback": str(entry.get("feedback") or "").strip() or None
             }
-    
+    if not any(answers):
+        return None
+
+    recommendation = data.get("recommendation")
+    return {
+        "answers": [a or {"question_number": i + 1, "score": None, "feedback": None} for i, a in enumerate(answers)],
+        "technical_score": _score(data.get("technical_score")),
+        "communication_score": _score(data.get("communication_score")),
+        "problem_solving_score": _score(data.get("problem_solving_score")),
+        "strengths": [str(s) for s in data.get("strengths") or []][:5],
+        "improvements": [str(s) for s in data.get("improvements") or []][:5],
+        "assessment": str(data.get("assessment") or "").strip(),
+        "recommendation": recommendation if recommendation in INTERVIEW_RECOMMENDATIONS else "Further Discussion"
+    }
+
+
+def _prompt_key(prompt, system_prompt, max_tokens, model=None):
+    """Fingerprint for `model` (default: the primary's), or None if no provider is configured."""
+    if not router.providers:
+        return None
+    return make_cache_key(prompt, model or router.providers[0].model, system_prompt, max_tokens)
+
+
+def _cache_get(prompt, system_prompt, max_tokens):
+    # Completions are cached under the model that wrote them; prefer the primary's
+    if llm_cache is None:
+        return None
+    for model in dict.fromkeys(p.model for p in router.providers):
+        cached = llm_cache.get(_prompt_key(prompt, system_prompt, max_tokens, model))
+        if cached is not None:
+            return cached
     return None
 
 
+def _cache_set(prompt, system_prompt, max_tokens, text, provider, model):
+    if llm_cache is not None:
+        llm_cache.set(_prompt_key(prompt, system_prompt, max_tokens, model),
+                      {"text": text, "provider": provider, "model": model})
+
+
+def _usage_or_estimate(usage, prompt, system_prompt, text):
+    if usage:
+        return usage["prompt_tokens"], usage["completion_tokens"], False
+    return estimate_tokens(system_prompt + prompt), estimate_tokens(text), True
+
+
+def _generate(prompt, system_prompt, max_tokens, operation, use_cache=True):
+    """
+    Run a prompt through the response cache, then the providers on a miss.
+    Concurrent misses for the same prompt wait on a single provider call.
+    Every call is recorded in `llm_metrics` under `operation`. With
+    `use_cache=False` the cached completion is skipped (and replaced).
+
+    Returns:
+        tuple: (text, provider, model), or None if no provider is configured.
+        Errors from the last provider tried are raised to the caller.
+    """
+    start = time.perf_counter()
+    key = _prompt_key(prompt, system_prompt, max_tokens)
+    if key is None:
+        return None
+
+    if use_cache:
+        cached = _cache_get(prompt, system_prompt, max_tokens)
+        if cached is not None:
+            llm_metrics.record(operation, "cache", time.perf_counter() - start,
+                               provider=cached["provider"], model=cached["model"])
+            return cached["text"], cached["provider"], cached["model"]
+
+    try:
+        # Concurrent callers share the call whichever provider ends up answering
+        completion, shared = _flights.do(key, _call_and_cache, prompt, system_prompt, max_tokens)
+    except Exception as e:
+        llm_metrics.record(operation, "error", time.perf_counter() - start, error=str(e))
+        raise
+
+    text, provider, model, route, usage = completion
+    if shared:
+        # Tokens were billed (and recorded) once, by the caller that made the request
+        llm_metrics.record(operation, "coalesced", time.perf_counter() - start, provider=provider, model=model)
+    else:
+        prompt_tokens, completion_tokens, estimated = _usage_or_estimate(usage, prompt, system_prompt, text)
+        llm_metrics.record(operation, route, time.perf_counter() - start, provider=provider, model=model,
+                           prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, estimated=estimated)
+    return text, provider, model
+
+
+def _call_and_cache(prompt, system_prompt, max_tokens):
+    text, provider, model, route, usage = router.complete(prompt, system_prompt, max_tokens)
+    _cache_set(prompt, system_prompt, max_tokens, text, provider, model)
+    return text, provider, model, route, usage
+
+
+def _stream(prompt, system_prompt, max_tokens, operation):
+    """
+    Yield text chunks for a prompt; a cached completion is sent as one chunk.
+
+    A streamed completion is cached only once it has finished. Latency is
+    recorded as time to first token.
+    """
+    start = time.perf_counter()
+    if not router.providers:
+        raise RuntimeError("No AI providers configured. Set GEMINI_API_KEY or OPENAI_API_KEY")
+
+    cached = _cache_get(prompt, system_prompt, max_tokens)
+    if cached is not None:
+        llm_metrics.record(operation, "cache", time.perf_counter() - start,
+                           provider=cached["provider"], model=cached["model"], stream=True)
+        yield cached["text"]
+        return
+
+    parts = []
+    provider = model = usage = None
+    first_token = None
+    try:
+        for provider, model, chunk in router.stream(prompt, system_prompt, max_tokens):
+            if isinstance(chunk, dict):
+                usage = chunk
+                continue
+            if first_token is None:
+                first_token = time.perf_counter() - start
+            parts.append(chunk)
+            yield chunk
+    except Exception as e:
+        llm_metrics.record(operation, "error", time.perf_counter() - start, provider=provider, model=model,
+                           stream=True, error=str(e))
+        raise
+
+    text = "".join(parts)
+    route = "primary" if router.providers and provider == router.providers[0].name else "fallback"
+    prompt_tokens, completion_tokens, estimated = _usage_or_estimate(usage, prompt, system_prompt, text)
+    llm_metrics.record(operation, route, first_token if first_token is not None else time.perf_counter() - start,
+                       provider=provider, model=model, prompt_tokens=prompt_tokens,
+                       completion_tokens=completion_tokens, estimated=estimated, stream=True)
+
+    if parts:
+        _cache_set(prompt, system_prompt, max_tokens, text, provider, model)
+
+
+def _precomputed_guidance(career_name, level, skills):
+    # Only the generic prompt is precomputed; skill-personalized guidance always goes to a provider
+    if skills or guidance_store is None:
+        return None
+    return guidance_store.get(career_name, level)
+
+
+def get_ready_guidance(career_name, level):
+    """
+    Generic guidance that can be served without a provider call.
+
+    Returns:
+        dict: {"text", "provider", "model"} from the precomputed store or the
+        response cache, or None
+    """
+    stored = _precomputed_guidance(career_name, level, None)
+    if stored is not None:
+        return stored
+    return _cache_get(_guidance_prompt(career_name, level), GUIDANCE_SYSTEM_PROMPT, 500)
+
+
+def get_provider_load():
+    """Busiest provider's share of its concurrency limit in use (0.0 - 1.0); 1.0 with no providers."""
+    if not router.providers:
+        return 1.0
+    return max(p.limit.snapshot()["in_use"] / p.limit.limit for p in router.providers)
+
+
+def generate_personalized_guidance(career_name, level, skills=None, use_store=True, use_cache=True):
+    """
+    Generate personalized career guidance using AI (Gemini by default, falls back to OpenAI).
+    Falls back to template-based guidance if API is not available.
+
+    Args:
+        career_name: Career name
+        level: User level (student/fresher/professional)
+        skills: User's current skills (optional)
+        use_store: Serve precomputed guidance when there are no skills
+        use_cache: Serve a cached completion; False always asks a provider
+
+    Returns:
+        dict: Generated guidance
+    """
+    start = time.perf_counter()
+    stored = _precomputed_guidance(career_name, level, skills) if use_store else None
+    if stored is not None:
+        llm_metrics.record("guidance", "precomputed", time.perf_counter() - start,
+                           provider=stored["provider"], model=stored["model"])
+        return {
+            "status": "success",
+            "personalized_guidance": stored["text"],
+            "model": stored["model"],
+            "provider": stored["provider"],
+            "precomputed": True
+        }
+
+    prompt = _guidance_prompt(career_name, level, skills)
+
+    try:
+        completion = _generate(prompt, GUIDANCE_SYSTEM_PROMPT, 500, "guidance", use_cache=use_cache)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error generating guidance: {str(e)}"
+        }
+
+    if completion is None:
+        return None
+
+    text, provider, model = completion
+    return {
+        "status": "success",
+        "personalized_guidance": text,
+        "model": model,
+        "provider": provider
+    }
+
+
 def generate_interview_prep(career_name):
     """
     Generate interview preparation tips using AI.
-    
+
     Args:
         career_name: Target career
-    
+
     Returns:
         dict: Interview preparation guide
     """
-    prompt = f"""Generate an interview preparation guide for a {career_name} position.
+    prompt = _interview_prep_prompt(career_name)
 
-Include:
-1. Top 10 interview questions likely to be asked
-2. How to structure your answers
-3. Sample answers for 3 key questions
-4. Questions to ask the interviewer
-5. Common mistakes to avoid
+    try:
+        completion = _generate(prompt, INTERVIEW_SYSTEM_PROMPT, 800, "interview_prep")
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error generating interview guide: {str(e)}"
+        }
 
-Format as a practical guide."""
+    if completion is None:
+        return None
 
-    # Try Gemini first
-    if GEMINI_AVAILABLE and DEFAULT_PROVIDER == 'gemini':
-        try:
-            response = gemini_model.generate_content(prompt)
-            return {
-                "status": "success",
-                "interview_guide": response.text,
-                "provider": "Google Gemini"
-            }
-        except Exception as e:
-            print(f"Gemini error: {str(e)}")
-    
-    # Try OpenAI
-    if OPENAI_AVAILABLE:
-        try:
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert in interview preparation and career development."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
-            
-            return {
-                "status": "success",
-                "interview_guide": response.choices[0].message.content,
-                "provider": "OpenAI"
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"Error generating interview guide: {str(e)}"
-            }
-    
-    return None
+    text, provider, _ = completion
+    return {
+        "status": "success",
+        "interview_guide": text,
+        "provider": provider
+    }
 
 
 def analyze_career_fit(career_name, user_profile):
     """
     Analyze how well a career fits the user's profile.
-    
+
     Args:
         career_name: Career to analyze
         user_profile: Dict with user's skills, interests, personality
-    
+
     Returns:
         dict: Career fit analysis
     """
-    profile_str = "\n".join([f"- {k}: {v}" for k, v in user_profile.items()])
-    
-    prompt = f"""Analyze how well the {career_name} career aligns with this profile:
+    prompt = _career_fit_prompt(career_name, user_profile)
 
-{profile_str}
+    try:
+        completion = _generate(prompt, CAREER_FIT_SYSTEM_PROMPT, 600, "career_fit")
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error analyzing career fit: {str(e)}"
+        }
 
-Provide:
-1. Overall fit score (1-10)
-2. Strengths that align with this career
-3. Potential challenges
-4. Recommendations for success
-5. Alternative careers to consider
+    if completion is None:
+        return None
 
-Be honest and constructive."""
+    text, provider, _ = completion
+    return {
+        "status": "success",
+        "analysis": text,
+        "provider": provider
+    }
 
-    # Try Gemini first
-    if GEMINI_AVAILABLE and DEFAULT_PROVIDER == 'gemini':
-        try:
-            response = gemini_model.generate_content(prompt)
-            return {
-                "status": "success",
-                "analysis": response.text,
-                "provider": "Google Gemini"
-            }
-        except Exception as e:
-            print(f"Gemini error: {str(e)}")
-    
-    # Try OpenAI
-    if OPENAI_AVAILABLE:
-        try:
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a career counselor evaluating career fit based on user profiles."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=600
-            )
-            
-            return {
-                "status": "success",
-                "analysis": response.choices[0].message.content,
-                "provider": "OpenAI"
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"Error analyzing career fit: {str(e)}"
-            }
-    
-    return None
+
+def generate_answer_feedback(career_name, question, answer):
+    """
+    Short interviewer feedback on one mock interview answer.
+
+    Args:
+        career_name: Career the interview is for
+        question: Question that was asked
+        answer: Candidate's answer
+
+    Returns:
+        dict: Feedback, or None if no provider is configured
+    """
+    prompt = _answer_feedback_prompt(career_name, question, answer)
+
+    try:
+        completion = _generate(prompt, INTERVIEWER_SYSTEM_PROMPT, 150, "answer_feedback")
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error analyzing answer: {str(e)}"
+        }
+
+    if completion is None:
+        return None
+
+    text, provider, _ = completion
+    return {
+        "status": "success",
+        "feedback": text,
+        "provider": provider
+    }
+
+
+def generate_interview_questions(career_name, level, count=10):
+    """
+    Generate role-specific mock interview questions.
+
+    Args:
+        career_name: Target career
+        level: Candidate level
+        count: Number of questions
+
+    Returns:
+        dict: Questions, or None if no provider is configured
+    """
+    prompt = _interview_questions_prompt(career_name, level, count)
+
+    try:
+        completion = _generate(prompt, INTERVIEW_SYSTEM_PROMPT, 60 * count, "interview_questions")
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error generating interview questions: {str(e)}"
+        }
+
+    if completion is None:
+        return None
+
+    text, provider, model = completion
+    questions = _parse_question_list(text, count)
+    if questions is None:
+        return {
+            "status": "error",
+            "message": "Could not parse the interview questions",
+            "provider": provider
+        }
+    return {
+        "status": "success",
+        "questions": questions,
+        "provider": provider,
+        "model": model
+    }
+
+
+def grade_interview(career_name, level, qa_pairs):
+    """
+    Grade a whole mock interview with one provider call.
+
+    All question/answer pairs go into a single structured prompt, and the
+    per-answer scores and feedback are parsed from the one reply. The
+    response cache is keyed on the hash of that prompt, so the same answers
+    are never graded twice.
+
+    Args:
+        career_name: Career the interview is for
+        level: Candidate level
+        qa_pairs: List of (question, answer) tuples
+
+    Returns:
+        dict: Grading, or None if no provider is configured
+    """
+    prompt = _interview_grading_prompt(career_name, level, qa_pairs)
+
+    try:
+        completion = _generate(prompt, GRADING_SYSTEM_PROMPT, 200 + 120 * len(qa_pairs), "interview_grading")
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error grading interview: {str(e)}"
+        }
+
+    if completion is None:
+        return None
+
+    text, provider, _ = completion
+    grading = _parse_interview_grading(text, len(qa_pairs))
+    if grading is None:
+        return {
+            "status": "error",
+            "message": "Could not parse the interview grading",
+            "provider": provider
+        }
+    return {
+        "status": "success",
+        "grading": grading,
+        "provider": provider
+    }
+
+
+def stream_personalized_guidance(career_name, level, skills=None):
+    """
+    Streaming variant of `generate_personalized_guidance`.
+
+    Yields:
+        str: Text chunks as the provider produces them
+
+    Nothing runs until the first chunk is requested, so a missing provider
+    surfaces then, as RuntimeError from the iteration (not from this call).
+    """
+    start = time.perf_counter()
+    stored = _precomputed_guidance(career_name, level, skills)
+    if stored is not None:
+        llm_metrics.record("guidance", "precomputed", time.perf_counter() - start,
+                           provider=stored["provider"], model=stored["model"], stream=True)
+        return iter([stored["text"]])
+    return _stream(_guidance_prompt(career_name, level, skills), GUIDANCE_SYSTEM_PROMPT, 500, "guidance")
+
+
+def stream_interview_prep(career_name):
+    """Streaming variant of `generate_interview_prep`; yields text chunks."""
+    return _stream(_interview_prep_prompt(career_name), INTERVIEW_SYSTEM_PROMPT, 800, "interview_prep")
+
+
+def stream_career_fit(career_name, user_profile):
+    """Streaming variant of `analyze_career_fit`; yields text chunks."""
+    return _stream(_career_fit_prompt(career_name, user_profile), CAREER_FIT_SYSTEM_PROMPT, 600, "career_fit")
+
+
+def render_metrics():
+    """Prometheus text exposition of LLM call, routing and cache metrics."""
+    from .metrics import prometheus_counter
+
+    lines = llm_metrics.prometheus()
+    routing = router.stats()["providers"]
+    lines += prometheus_counter(
+        "llm_circuit_open",
+        [({"provider": name}, 1 if info["circuit"]["state"] != "closed" else 0) for name, info in routing.items()],
+        "1 while a provider's circuit breaker is open or half-open", kind="gauge"
+    )
+    for stat in ("failures", "deadline_exceeded", "hedges_launched", "skipped_open_circuit"):
+        lines += prometheus_counter(f"llm_provider_{stat}_total",
+                                    [({"provider": name}, info[stat]) for name, info in routing.items()])
+    if llm_cache is not None:
+        cache = llm_cache.stats()
+        lines += prometheus_counter(
+            "llm_response_cache_total",
+            [({"result": k}, cache[k]) for k in ("memory_hits", "disk_hits", "misses", "sets", "evictions")],
+            "Response cache operations in this worker"
+        )
+    return "\n".join(lines) + "\n"
 
 
 def get_ai_status():
@@ -246,26 +818,34 @@ def get_ai_status():
         "gemini_available": GEMINI_AVAILABLE,
         "openai_available": OPENAI_AVAILABLE,
         "default_provider": DEFAULT_PROVIDER if (GEMINI_AVAILABLE or OPENAI_AVAILABLE) else "none",
+        "streaming": True,
+        "cache": llm_cache.stats() if llm_cache is not None else {"enabled": False},
+        "coalescing": _flights.stats(),
+        "precomputed": guidance_store.stats() if guidance_store is not None else {"enabled": False},
+        "routing": router.stats(),
+        "connections": _connection_stats(),
+        "concurrency": {p.name: p.limit.snapshot() for p in router.providers},
+        "calls": llm_metrics.snapshot(),
         "providers": []
     }
-    
+
     if GEMINI_AVAILABLE:
         status["providers"].append({
             "name": "Google Gemini",
-            "model": "gemini-pro",
+            "model": GEMINI_MODEL,
             "status": "Active"
         })
-    
+
     if OPENAI_AVAILABLE:
         status["providers"].append({
             "name": "OpenAI",
-            "model": "gpt-3.5-turbo",
+            "model": OPENAI_MODEL,
             "status": "Active"
         })
-    
+
     if not GEMINI_AVAILABLE and not OPENAI_AVAILABLE:
         status["message"] = "No AI providers configured. Set GEMINI_API_KEY or OPENAI_API_KEY"
     else:
         status["message"] = f"AI features enabled: {', '.join([p['name'] for p in status['providers']])}"
-    
+
     return status
@@ -0,0 +1,181 @@
+"""
+LLM Call Instrumentation
+One record per guidance, interview-prep, interview-question, career-fit,
+answer-feedback or interview-grading call: provider, model, latency, token usage, the route that produced the
+answer and whether a cache served it. Records are logged as JSON and aggregated into histograms for
+/ai-status and the Prometheus /metrics endpoint.
+"""
+import json
+import logging
+import threading
+import time
+from collections import deque
+
+from .metrics import LatencyHistogram, Histogram, TOKEN_BUCKETS, prometheus_counter
+
+logger = logging.getLogger(__name__)
+
+# How an answer was produced; "primary" / "fallback" / "hedge" reached a provider
+ROUTES = ("precomputed", "cache", "coalesced", "primary", "fallback", "hedge", "error")
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) for providers that report no usage."""
+    return max(1, len(text) // 4) if text else 0
+
+
+class LLMMetrics:
+    """Aggregates call records per operation and per provider."""
+
+    def __init__(self, recent=50):
+        self._lock = threading.Lock()
+        self._calls = {}       # (operation, route) -> count
+        self._latency = {}     # operation -> LatencyHistogram (end to end, as the caller saw it)
+        self._provider = {}    # (provider, model) -> counters and histograms
+        self._cache = {}       # operation -> {"hit": n, "miss": n}
+        self._recent = deque(maxlen=recent)
+
+    def record(self, operation, route, latency, provider=None, model=None,
+               prompt_tokens=None, completion_tokens=None, estimated=False,
+               stream=False, error=None):
+        """
+        Record one call.
+
+        Args:
+            operation (str): "guidance", "interview_prep", "interview_questions", "career_fit",
+                "answer_feedback" or "interview_grading"
+            route (str): One of ROUTES
+            latency (float): Seconds the caller waited (time to first token for streams)
+            provider (str): Provider that produced the text, if any
+            model (str): Model that produced the text, if any
+            prompt_tokens (int): Prompt tokens billed, if a provider was called
+            completion_tokens (int): Completion tokens billed, if a provider was called
+            estimated (bool): Token counts were estimated from text length
+            stream (bool): Streaming call
+            error (str): Error message when the call failed
+        """
+        entry = {
+            "ts": round(time.time(), 3),
+            "operation": operation,
+            "route": route,
+            "latency_ms": round(latency * 1000, 1),
+            "provider": provider,
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "tokens_estimated": estimated,
+            "stream": stream,
+            "error": error
+        }
+        called_provider = route in ("primary", "fallback", "hedge")
+
+        with self._lock:
+            self._calls[(operation, route)] = self._calls.get((operation, route), 0) + 1
+            latency_hist = self._latency.setdefault(operation, LatencyHistogram())
+            if route != "precomputed":
+                cache = self._cache.setdefault(operation, {"hit": 0, "miss": 0})
+                cache["hit" if route in ("cache", "coalesced") else "miss"] += 1
+            if called_provider and provider:
+                stats = self._provider.get((provider, model))
+                if stats is None:
+                    stats = self._provider[(provider, model)] = {
+                        "calls": 0,
+                        "prompt_tokens": 0,
+                        "completion_tokens": 0,
+                        "estimated_calls": 0,
+                        "latency": LatencyHistogram(),
+                        "completion_tokens_per_call": Histogram(TOKEN_BUCKETS)
+                    }
+                stats["calls"] += 1
+                stats["prompt_tokens"] += prompt_tokens or 0
+                stats["completion_tokens"] += completion_tokens or 0
+                stats["estimated_calls"] += 1 if estimated else 0
+            self._recent.append(entry)
+
+        latency_hist.record(latency)
+        if called_provider and provider:
+            stats["latency"].record(latency)
+            if completion_tokens is not None:
+                stats["completion_tokens_per_call"].observe(completion_tokens)
+
+        if error:
+            logger.warning("llm_call %s", json.dumps(entry))
+        else:
+            logger.info("llm_call %s", json.dumps(entry))
+
+    def snapshot(self):
+        """Aggregates for /ai-status."""
+        with self._lock:
+            calls = dict(self._calls)
+            latency = dict(self._latency)
+            cache = {op: dict(c) for op, c in self._cache.items()}
+            providers = {key: dict(stats) for key, stats in self._provider.items()}
+            recent = list(self._recent)
+
+        operations = {}
+        for (operation, route), n in calls.items():
+            operations.setdefault(operation, {"calls": {}})["calls"][route] = n
+        for operation, info in operations.items():
+            info["latency"] = latency[operation].snapshot()
+            hits = cache.get(operation, {}).get("hit", 0)
+            lookups = hits + cache.get(operation, {}).get("miss", 0)
+            info["cache_hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+
+        return {
+            "operations": operations,
+            "providers": {
+                f"{provider} ({model})": {
+                    "calls": stats["calls"],
+                    "prompt_tokens": stats["prompt_tokens"],
+                    "completion_tokens": stats["completion_tokens"],
+                    "estimated_calls": stats["estimated_calls"],
+                    "latency": stats["latency"].snapshot(),
+                    "completion_tokens_per_call": stats["completion_tokens_per_call"].snapshot()
+                }
+                for (provider, model), stats in providers.items()
+            },
+            "recent_calls": recent[-10:]
+        }
+
+    def prometheus(self):
+        """Prometheus text exposition lines."""
+        with self._lock:
+            calls = dict(self._calls)
+            latency = dict(self._latency)
+            cache = {op: dict(c) for op, c in self._cache.items()}
+            providers = {key: dict(stats) for key, stats in self._provider.items()}
+
+        lines = prometheus_counter(
+            "llm_calls_total",
+            [({"operation": op, "route": route}, n) for (op, route), n in sorted(calls.items())],
+            "LLM calls by operation and the route that produced the answer"
+        )
+        lines += prometheus_counter(
+            "llm_cache_lookups_total",
+            [({"operation": op, "result": result}, n)
+             for op, c in sorted(cache.items()) for result, n in sorted(c.items())],
+            "Response cache lookups (coalesced calls count as hits)"
+        )
+        lines += ["# HELP llm_call_duration_seconds End-to-end LLM call latency", "# TYPE llm_call_duration_seconds histogram"]
+        for op, hist in sorted(latency.items()):
+            lines += hist.prometheus("llm_call_duration_seconds", {"operation": op})
+
+        token_samples = []
+        for (provider, model), stats in sorted(providers.items()):
+            labels = {"provider": provider, "model": model}
+            token_samples.append((dict(labels, kind="prompt"), stats["prompt_tokens"]))
+            token_samples.append((dict(labels, kind="completion"), stats["completion_tokens"]))
+        lines += prometheus_counter("llm_tokens_total", token_samples, "Tokens billed by provider")
+        lines += ["# HELP llm_provider_duration_seconds Latency of calls answered by a provider",
+                  "# TYPE llm_provider_duration_seconds histogram"]
+        for (provider, model), stats in sorted(providers.items()):
+            lines += stats["latency"].prometheus("llm_provider_duration_seconds", {"provider": provider, "model": model})
+        lines += ["# HELP llm_completion_tokens Completion tokens per provider call",
+                  "# TYPE llm_completion_tokens histogram"]
+        for (provider, model), stats in sorted(providers.items()):
+            lines += stats["completion_tokens_per_call"].prometheus("llm_completion_tokens", {"provider": provider, "model": model})
+        return lines
+
+
+# Shared instance fed by `llm_guidance`
+llm_metrics = LLMMetrics()
@@ -0,0 +1,320 @@
+"""
+LLM Provider Router
+Sends each prompt to the preferred provider under a deadline, optionally
+hedges with a second provider once the first is slower than its recent p95,
+and skips providers whose circuit breaker is open.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures; lets one trial call through after `reset_timeout`."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def available(self):
+        """Whether a call could be allowed right now (does not claim the half-open trial)."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                return time.monotonic() - self.opened_at >= self.reset_timeout
+            return not self._trial_in_flight
+
+    def allow(self):
+        """Claim permission for one call; in half-open state only one trial is let through."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "times_opened": self.times_opened
+            }
+
+
+class ProviderUnavailable(RuntimeError):
+    """No provider could serve the request (all failed, timed out or circuit-open)."""
+
+
+class _ProviderState:
+    def __init__(self, breaker):
+        self.breaker = breaker
+        self.latency = LatencyHistogram()
+        self.lock = threading.Lock()
+        self.stats = {
+            "calls": 0,
+            "successes": 0,
+            "failures": 0,
+            "deadline_exceeded": 0,
+            "skipped_open_circuit": 0,
+            "hedges_launched": 0,
+            "hedge_wins": 0
+        }
+
+    def count(self, stat):
+        with self.lock:
+            self.stats[stat] += 1
+
+
+class ProviderRouter:
+    """
+    Route prompts across providers.
+
+    A provider is any object with `name`, `model`, and
+    `complete(prompt, system_prompt, max_tokens, timeout)` returning
+    (text, usage) where usage is {"prompt_tokens", "completion_tokens"} or
+    None. Streaming providers also implement `stream(...)` yielding text
+    chunks and optionally a final usage dict.
+    """
+
+    def __init__(self, providers, deadline=20.0, hedge=False, hedge_delay=None,
+                 hedge_min_samples=20, hedge_fallback_delay=2.0,
+                 failure_threshold=5, reset_timeout=30.0, max_workers=8):
+        self.providers = list(providers)
+        self.deadline = deadline
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay  # seconds, or None to use the primary's recent p95
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_fallback_delay = hedge_fallback_delay
+        self.max_workers = max_workers
+        self._state = {
+            p.name: _ProviderState(CircuitBreaker(failure_threshold, reset_timeout))
+            for p in self.providers
+        }
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self):
+        # Created on first use so no threads exist before gunicorn forks workers
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='llm-router')
+            return self._executor
+
+    def _available(self):
+        available = []
+        for provider in self.providers:
+            state = self._state[provider.name]
+            if state.breaker.available():
+                available.append(provider)
+            else:
+                state.count("skipped_open_circuit")
+        return available
+
+    def _next_allowed(self, queue):
+        # Claim the breaker only when a call is actually about to be made
+        while queue:
+            provider = queue.pop(0)
+            if self._state[provider.name].breaker.allow():
+                return provider
+            self._state[provider.name].count("skipped_open_circuit")
+        return None
+
+    def _hedge_after(self, provider):
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        p95 = self._state[provider.name].latency.percentile(95, min_samples=self.hedge_min_samples)
+        return p95 if p95 is not None else self.hedge_fallback_delay
+
+    def _timed_call(self, provider, prompt, system_prompt, max_tokens, timeout):
+        state = self._state[provider.name]
+        state.count("calls")
+        start = time.perf_counter()
+        try:
+            completion = provider.complete(prompt, system_prompt, max_tokens, timeout)
+        except Exception as e:
+            state.count("failures")
+            state.breaker.record_failure()
+            logger.warning("%s call failed: %s", provider.name, e)
+            raise
+        state.latency.record(time.perf_counter() - start)
+        state.count("successes")
+        state.breaker.record_success()
+        return completion
+
+    def complete(self, prompt, system_prompt, max_tokens):
+        """
+        Return (text, provider_name, model, route, usage) from the first
+        provider to answer within the deadline. `route` is "primary",
+        "fallback" (an earlier provider failed or was circuit-open) or
+        "hedge" (a hedged request beat the primary).
+
+        Raises:
+            ProviderUnavailable: If every provider failed, timed out, or is circuit-open
+        """
+        candidates = self._available()
+        if not candidates:
+            raise ProviderUnavailable("All AI providers are temporarily unavailable (circuit open)")
+
+        start = time.monotonic()
+        deadline_at = start + self.deadline
+        executor = self._get_executor()
+        pending = {}
+        errors = []
+
+        def launch(provider):
+            timeout = max(deadline_at - time.monotonic(), 0.1)
+            future = executor.submit(self._timed_call, provider, prompt, system_prompt, max_tokens, timeout)
+            pending[future] = provider
+
+        queue = list(candidates)
+        primary = self._next_allowed(queue)
+        if primary is None:
+            raise ProviderUnavailable("All AI providers are temporarily unavailable (circuit open)")
+        launch(primary)
+        hedge_at = start + self._hedge_after(primary) if self.hedge and queue else None
+        hedged = False
+
+        while pending:
+            now = time.monotonic()
+            wake_at = deadline_at if hedge_at is None else min(hedge_at, deadline_at)
+            done, _ = wait(list(pending), timeout=max(wake_at - now, 0), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    text, usage = future.result()
+                except Exception as e:
+                    errors.append(f"{provider.name}: {e}")
+                    # Plain fallback: try the next provider right away
+                    if not pending:
+                        fallback = self._next_allowed(queue)
+                        if fallback is not None:
+                            launch(fallback)
+                        hedge_at = None
+                    continue
+                if provider is self.providers[0]:
+                    route = "primary"
+                elif hedged and provider is not primary:
+                    self._state[provider.name].count("hedge_wins")
+                    route = "hedge"
+                else:
+                    route = "fallback"
+                return text, provider.name, provider.model, route, usage
+
+            now = time.monotonic()
+            if hedge_at is not None and now >= hedge_at:
+                secondary = self._next_allowed(queue)
+                if secondary is not None:
+                    self._state[secondary.name].count("hedges_launched")
+                    launch(secondary)
+                    hedged = True
+                hedge_at = None
+            if now >= deadline_at and pending:
+                for provider in pending.values():
+                    self._state[provider.name].count("deadline_exceeded")
+                raise ProviderUnavailable(f"AI providers did not answer within {self.deadline:.1f}s")
+
+        raise ProviderUnavailable("; ".join(errors) or "No AI providers configured")
+
+    def stream(self, prompt, system_prompt, max_tokens):
+        """
+        Yield (provider_name, model, chunk) from the first provider that starts
+        streaming; `chunk` is text, or a usage dict as the last item when the
+        provider reports one. Falls back only before any text was produced,
+        and all attempts share one deadline, as in `complete`.
+        """
+        errors = []
+        deadline_at = time.monotonic() + self.deadline
+        queue = self._available()
+        while queue:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                # Only reached after a failed attempt used up the time
+                raise ProviderUnavailable(f"AI providers did not stream within {self.deadline:.1f}s ({'; '.join(errors)})")
+            provider = self._next_allowed(queue)
+            if provider is None:
+                break
+            state = self._state[provider.name]
+            state.count("calls")
+            start = time.perf_counter()
+            started = False
+            try:
+                for chunk in provider.stream(prompt, system_prompt, max_tokens, remaining):
+                    if not started and isinstance(chunk, str):
+                        # Time to first token is what a streaming client waits for
+                        state.latency.record(time.perf_counter() - start)
+                        started = True
+                    yield provider.name, provider.model, chunk
+            except GeneratorExit:
+                # Client went away mid-stream; the provider itself was healthy
+                state.breaker.record_success()
+                raise
+            except Exception as e:
+                state.count("failures")
+                state.breaker.record_failure()
+                logger.warning("%s stream failed: %s", provider.name, e)
+                if started:
+                    raise
+                errors.append(f"{provider.name}: {e}")
+                continue
+            state.count("successes")
+            state.breaker.record_success()
+            return
+
+        raise ProviderUnavailable("; ".join(errors) or "All AI providers are temporarily unavailable (circuit open)")
+
+    def stats(self):
+        """Per-provider call counters, circuit state and latency histogram."""
+        report = {
+            "deadline_seconds": self.deadline,
+            "hedging": self.hedge,
+            "providers": {}
+        }
+        for provider in self.providers:
+            state = self._state[provider.name]
+            with state.lock:
+                counters = dict(state.stats)
+            report["providers"][provider.name] = {
+                "model": provider.model,
+                "circuit": state.breaker.snapshot(),
+                "hedge_delay_seconds": round(self._hedge_after(provider), 3) if self.hedge else None,
+                "latency": state.latency.snapshot(),
+                **counters
+            }
+        return report
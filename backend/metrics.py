@@ -0,0 +1,152 @@
+"""
+Metrics Module
+Thread-safe histograms used to report provider and endpoint timings and
+token counts, plus Prometheus text rendering for /metrics.
+"""
+import threading
+from collections import deque
+
+# Bucket upper bounds in milliseconds; the last bucket catches everything slower
+DEFAULT_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2000, 5000, 10000, 30000)
+# Bucket upper bounds for token counts per call
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000)
+
+
+def _nearest_rank(sorted_samples, q):
+    return sorted_samples[min(len(sorted_samples) - 1, int(round(q / 100.0 * (len(sorted_samples) - 1))))]
+
+
+class Histogram:
+    """Cumulative bucket counts plus a sliding window of recent samples for percentiles."""
+
+    def __init__(self, buckets, window=500):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._recent = deque(maxlen=window)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = 0
+        while i < len(self.buckets) and value > self.buckets[i]:
+            i += 1
+        with self._lock:
+            self._counts[i] += 1
+            self._recent.append(value)
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def _percentile(self, q, min_samples=1):
+        with self._lock:
+            samples = sorted(self._recent)
+        if len(samples) < max(min_samples, 1):
+            return None
+        return _nearest_rank(samples, q)
+
+    def _summary(self, suffix=""):
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            total = self._sum
+            maximum = self._max
+            samples = sorted(self._recent)
+
+        def pct(q):
+            return round(_nearest_rank(samples, q), 1) if samples else None
+
+        labels = [f"le_{b}{suffix.lstrip('_')}" for b in self.buckets] + ["inf"]
+        return {
+            "count": count,
+            f"mean{suffix}": round(total / count, 1) if count else None,
+            f"max{suffix}": round(maximum, 1) if count else None,
+            f"p50{suffix}": pct(50),
+            f"p95{suffix}": pct(95),
+            f"p99{suffix}": pct(99),
+            "buckets": dict(zip(labels, counts))
+        }
+
+    def percentile(self, q, min_samples=1):
+        """Percentile (0-100) of the recent window, or None below `min_samples` samples."""
+        return self._percentile(q, min_samples)
+
+    def snapshot(self):
+        return self._summary()
+
+    def prometheus(self, name, labels=None, scale=1.0):
+        """
+        Render as a Prometheus histogram (cumulative buckets, sum, count).
+
+        Args:
+            name (str): Metric name without the _bucket/_sum/_count suffix
+            labels (dict): Extra labels for every line
+            scale (float): Multiplier applied to bucket bounds and the sum
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            total = self._sum
+        base = _labels(labels)
+        lines = []
+        cumulative = 0
+        for bound, n in zip(list(self.buckets) + ["+Inf"], counts):
+            cumulative += n
+            le = bound if bound == "+Inf" else _number(bound * scale)
+            lines.append(f'{name}_bucket{_labels(labels, le=le)} {cumulative}')
+        lines.append(f"{name}_sum{base} {_number(total * scale)}")
+        lines.append(f"{name}_count{base} {count}")
+        return lines
+
+
+class LatencyHistogram(Histogram):
+    """Histogram of durations recorded in seconds and reported in milliseconds."""
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS, window=500):
+        super().__init__(buckets_ms, window)
+        self.buckets_ms = self.buckets
+
+    def record(self, seconds):
+        self.observe(seconds * 1000.0)
+
+    def percentile(self, q, min_samples=1):
+        """
+        Percentile (0-100) of the recent window in seconds, or None when
+        fewer than `min_samples` samples have been recorded.
+        """
+        ms = self._percentile(q, min_samples)
+        return ms / 1000.0 if ms is not None else None
+
+    def snapshot(self):
+        return self._summary("_ms")
+
+    def prometheus(self, name, labels=None, scale=0.001):
+        # Prometheus convention is seconds
+        return super().prometheus(name, labels, scale)
+
+
+def _number(value):
+    return f"{value:.6g}" if isinstance(value, float) else str(value)
+
+
+def _labels(labels=None, **extra):
+    items = dict(labels or {}, **extra)
+    if not items:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in items.values())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(items, escaped)) + "}"
+
+
+def prometheus_counter(name, samples, help_text=None, kind="counter"):
+    """
+    Render a counter (or gauge) family.
+
+    Args:
+        name (str): Metric name
+        samples (list): (labels dict, value) pairs
+    """
+    lines = [f"# HELP {name} {help_text}"] if help_text else []
+    lines.append(f"# TYPE {name} {kind}")
+    lines.extend(f"{name}{_labels(labels)} {_number(value)}" for labels, value in samples)
+    return lines
@@ -8,6 +8,11 @@ from pathlib import Path
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+try:
+    from backend.utils import index_fingerprint, normalize_text
+except ImportError:  # run as `python backend/onet_importer.py`
+    from utils import index_fingerprint, normalize_text
+
 
 def extract_text(row, cols):
     parts = []
@@ -19,6 +24,14 @@ def extract_text(row, cols):
     return " \n ".join(parts)
 
 
+def split_tasks(value, limit=12):
+    # Task columns hold one or more statements separated by newlines or semicolons
+    if value is None or pd.isna(value):
+        return []
+    tasks = [t.strip(" .-\t") for t in re.split(r"[\n;]+", str(value))]
+    return [t for t in tasks if len(t.split()) >= 3][:limit]
+
+
 def simple_extract_skills(text, top_n=8):
     # crude skill extraction: take frequent noun-like tokens (words >3 chars)
     tokens = re.findall(r"[A-Za-z][A-Za-z0-9+#]+", text)
@@ -32,13 +45,87 @@ def simple_extract_skills(text, top_n=8):
     return skills
 
 
-def build_onet_db(input_csv, out_json, build_index=True):
-    df = pd.read_csv(input_csv, dtype=str)
+def read_table(path):
+    # O*NET ships tab-delimited .txt files alongside the CSV/Excel exports
+    sep = '\t' if Path(path).suffix.lower() in ('.txt', '.tsv') else ','
+    return pd.read_csv(path, dtype=str, sep=sep)
+
+
+def build_alias_index(alt_titles_path, code_to_key, title_to_key):
+    """Map normalized O*NET Alternate/Short Titles to CAREER_DB keys.
+
+    Rows are joined on the O*NET-SOC code when both files carry one, else on
+    the occupation title. Aliases that point at more than one occupation are
+    dropped so the exact-match fast path never returns an arbitrary pick.
+    """
+    df = read_table(alt_titles_path)
+    code_col = None
+    title_col = None
+    alias_cols = []
+    for c in df.columns:
+        cl = c.lower()
+        if 'code' in cl and code_col is None:
+            code_col = c
+        elif 'alternate' in cl or 'short' in cl:
+            alias_cols.append(c)
+        elif 'title' in cl and title_col is None:
+            title_col = c
+
+    if not alias_cols:
+        raise RuntimeError(f"No alternate-title column found in {alt_titles_path}; columns: {list(df.columns)}")
+
+    aliases = {}
+    ambiguous = set()
+    for _, row in df.iterrows():
+        key = None
+        if code_col is not None and not pd.isna(row[code_col]):
+            key = code_to_key.get(str(row[code_col]).strip())
+        if key is None and title_col is not None and not pd.isna(row[title_col]):
+            key = title_to_key.get(normalize_text(row[title_col]))
+        if key is None:
+            continue
+
+        for c in alias_cols:
+            if pd.isna(row[c]):
+                continue
+            alias = normalize_text(row[c])
+            if not alias or alias in ambiguous:
+                continue
+            if aliases.get(alias, key) != key:
+                ambiguous.add(alias)
+                del aliases[alias]
+                continue
+            aliases[alias] = key
+
+    return aliases, len(ambiguous)
+
+
+def fit_lsa(X, dim=192, seed=0):
+    """Fit a truncated-SVD (LSA) projection of a TF-IDF matrix.
+
+    Returns (components, embeddings): the dim x features projection, and one
+    L2-normalized dim-vector per row of X, both float32, so cosine similarity
+    against every career is a single dense matrix-vector product.
+    """
+    import numpy as np
+    from sklearn.decomposition import TruncatedSVD
+
+    dim = max(1, min(dim, min(X.shape) - 1))
+    svd = TruncatedSVD(n_components=dim, algorithm='randomized', random_state=seed)
+    embeddings = svd.fit_transform(X).astype(np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings /= np.where(norms > 0, norms, 1)
+    return svd.components_.astype(np.float32), embeddings
+
+
+def build_onet_db(input_csv, out_json, build_index=True, alt_titles=None, lsa_dim=192):
+    df = read_table(input_csv)
     # heuristic column selection
     cols = list(df.columns)
     title_col = None
     desc_col = None
     task_col = None
+    code_col = None
     for c in cols:
         cl = c.lower()
         if 'title' in cl and title_col is None:
@@ -47,6 +134,8 @@ def build_onet_db(input_csv, out_json, build_index=True):
             desc_col = c
         if 'task' in cl and task_col is None:
             task_col = c
+        if 'code' in cl and code_col is None:
+            code_col = c
 
     if title_col is None:
         raise RuntimeError(f"No title-like column found in {input_csv}; columns: {cols}")
@@ -54,6 +143,7 @@ def build_onet_db(input_csv, out_json, build_index=True):
     career_db = {}
     texts = []
     titles = []
+    code_to_key = {}
 
     for _, row in df.iterrows():
         title = str(row[title_col]).strip()
@@ -67,11 +157,15 @@ def build_onet_db(input_csv, out_json, build_index=True):
             "resources": [],
             "market": text[:500],
             "future": "",
-            "source_title": title
+            "source_title": title,
+            # Task statements seed the mock interview question bank
+            "tasks": split_tasks(row.get(task_col)) if task_col else []
         }
 
         texts.append(text)
         titles.append(key)
+        if code_col is not None and not pd.isna(row[code_col]):
+            code_to_key[str(row[code_col]).strip()] = key
 
     # write JSON
     with open(out_json, 'w', encoding='utf-8') as f:
@@ -79,6 +173,19 @@ def build_onet_db(input_csv, out_json, build_index=True):
 
     print(f"Wrote {len(career_db)} careers to {out_json}")
 
+    alias_path = Path(out_json).with_suffix('.aliases.json')
+    if alt_titles:
+        title_to_key = {normalize_text(k): k for k in career_db}
+        aliases, n_ambiguous = build_alias_index(alt_titles, code_to_key, title_to_key)
+        with open(alias_path, 'w', encoding='utf-8') as f:
+            json.dump(aliases, f, ensure_ascii=False)
+        print(f"Wrote {len(aliases)} alternate titles to {alias_path} ({n_ambiguous} ambiguous titles skipped)")
+    elif alias_path.exists():
+        # Titles from an earlier import would resolve to careers of the old catalog
+        alias_path.unlink()
+        print(f"Removed stale alternate titles {alias_path}")
+
+    lsa_path = Path(out_json).with_suffix('.lsa.npz')
     if build_index:
         from scipy import sparse
 
@@ -94,12 +201,28 @@ def build_onet_db(input_csv, out_json, build_index=True):
         sparse.save_npz(matrix_path, X)
         print(f"Built TF-IDF index ({X.shape}) and saved to {idx_path} / {vec_path} / {matrix_path}")
 
+        if lsa_dim:
+            import numpy as np
+
+            components, embeddings = fit_lsa(X, lsa_dim)
+            # The fingerprint ties the projection to this vectorizer and row order
+            np.savez(lsa_path, components=components, embeddings=embeddings,
+                     fingerprint=np.array(index_fingerprint(vec.vocabulary_, titles)))
+            print(f"Built {embeddings.shape[1]}-dimensional LSA embeddings and saved to {lsa_path}")
+
+    if not (build_index and lsa_dim) and lsa_path.exists():
+        # Embeddings from an earlier import would not match the new catalog
+        lsa_path.unlink()
+        print(f"Removed stale LSA embeddings {lsa_path}")
+
 
 def main():
     parser = argparse.ArgumentParser(description='Import O*NET occupations CSV into CAREER_DB JSON and build index')
     parser.add_argument('--input', '-i', default='data/onet/occupations.csv', help='Path to O*NET occupations CSV')
     parser.add_argument('--output', '-o', default='backend/CAREER_DB_onet.json', help='Output JSON path')
+    parser.add_argument('--alternate-titles', '-a', default='data/onet/alternate_titles.txt', help='Path to O*NET Alternate Titles file (skipped if missing)')
     parser.add_argument('--no-index', action='store_true', help='Skip building TF-IDF index')
+    parser.add_argument('--lsa-dim', type=int, default=192, help='Dimensions of the LSA career embeddings (0 = skip)')
     args = parser.parse_args()
 
     if not os.path.exists(args.input):
@@ -107,7 +230,11 @@ def main():
         print("Please download an O*NET occupations CSV (Occupation Data) and place it at the path above.")
         return
 
-    build_onet_db(args.input, args.output, build_index=not args.no_index)
+    alt_titles = args.alternate_titles if os.path.exists(args.alternate_titles) else None
+    if alt_titles is None:
+        print(f"Alternate titles file not found: {args.alternate_titles} (alias index will not be built)")
+
+    build_onet_db(args.input, args.output, build_index=not args.no_index, alt_titles=alt_titles, lsa_dim=args.lsa_dim)
 
 
 if __name__ == '__main__':
@@ -5,9 +5,6 @@ Provides O*NET data handling and intelligent semantic career search using TF-IDF
 import json
 from .career_data import CAREER_DB
 from .fuzzy_matcher import find_best_career_match
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
 
 # O*NET Sample Data with detailed descriptions
 ONET_SAMPLE_DATA = {
@@ -95,6 +92,10 @@ def search_onet_careers(keyword: str) -> dict:
         }
     
     try:
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
         # TF-IDF Vectorizer for semantic search
         vectorizer = TfidfVectorizer(
             analyzer='char',
@@ -0,0 +1,149 @@
+"""
+Guidance Precomputation
+Generates the generic AI guidance for every (career, level) pair in the
+catalog and saves it in the guidance store. Pairs already stored for the
+current catalog version are skipped, so an interrupted run resumes where it
+stopped.
+
+    python -m backend.precompute_guidance --workers 4 --rate 2
+"""
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .career_data import CAREER_DB, CAREER_LEVELS, CATALOG_VERSION
+from .guidance_store import guidance_store
+from .llm_guidance import generate_personalized_guidance, GEMINI_AVAILABLE, OPENAI_AVAILABLE
+
+
+class RateLimiter:
+    """Spaces calls evenly so all workers together stay under `rate` calls per second."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(self._next_at, now)
+            self._next_at = start_at + self.interval
+        time.sleep(max(start_at - now, 0))
+
+
+def pending_pairs(store, careers=None, levels=None):
+    """(career, level) pairs of the catalog that have no stored guidance yet."""
+    done = store.completed()
+    return [
+        (career, level)
+        for career in (careers or sorted(CAREER_DB))
+        for level in (levels or list(CAREER_LEVELS))
+        if (career, level) not in done
+    ]
+
+
+def precompute(store, pairs, workers=4, rate=1.0, force=False):
+    """
+    Generate and store guidance for `pairs`.
+
+    Args:
+        store (GuidanceStore): Destination store
+        pairs (list): (career, level) tuples
+        workers (int): Concurrent provider calls
+        rate (float): Maximum calls per second across workers (0 = unlimited)
+        force (bool): Regenerate even if the store or the response cache already has the pair
+
+    Returns:
+        dict: generated / failed counts and elapsed seconds
+    """
+    limiter = RateLimiter(rate)
+    summary = {"generated": 0, "failed": 0, "elapsed_seconds": 0.0}
+    start = time.perf_counter()
+
+    def generate(career, level):
+        limiter.acquire()
+        # A forced run must reach a provider: neither the store nor the response cache answers it
+        result = generate_personalized_guidance(career, level, use_store=not force, use_cache=not force)
+        if result and result.get("status") == "success" and not result.get("precomputed"):
+            # Written as soon as it arrives, so an interrupted run keeps its progress
+            store.put(career, level, result["personalized_guidance"], result.get("provider"), result.get("model"))
+        return result
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='precompute')
+    futures = {executor.submit(generate, career, level): (career, level) for career, level in pairs}
+    try:
+        for i, future in enumerate(as_completed(futures), 1):
+            career, level = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"status": "error", "message": str(e)}
+            if result and result.get("status") == "success":
+                summary["generated"] += 1
+                print(f"[{i}/{len(pairs)}] {career} ({level}) via {result.get('provider')}")
+            else:
+                summary["failed"] += 1
+                print(f"[{i}/{len(pairs)}] {career} ({level}) failed: {(result or {}).get('message')}")
+    except KeyboardInterrupt:
+        executor.shutdown(wait=True, cancel_futures=True)
+        print("Interrupted; run the same command again to resume")
+        raise
+    executor.shutdown()
+
+    summary["elapsed_seconds"] = round(time.perf_counter() - start, 2)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute AI guidance for every career and level in the catalog')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent provider calls')
+    parser.add_argument('--rate', type=float, default=1.0, help='Maximum provider calls per second (0 = unlimited)')
+    parser.add_argument('--careers', help='Comma-separated careers (default: the whole catalog)')
+    parser.add_argument('--levels', help='Comma-separated levels (default: ' + ', '.join(CAREER_LEVELS) + ')')
+    parser.add_argument('--limit', type=int, help='Stop after this many pairs')
+    parser.add_argument('--force', action='store_true', help='Regenerate pairs that are already stored')
+    parser.add_argument('--prune', action='store_true', help='Delete guidance stored for older catalog versions')
+    parser.add_argument('--dry-run', action='store_true', help='Only list the pairs that would be generated')
+    args = parser.parse_args()
+
+    if guidance_store is None:
+        parser.error('GUIDANCE_STORE_ENABLED is not "True"')
+
+    careers = [c.strip().lower() for c in args.careers.split(',')] if args.careers else None
+    levels = [l.strip().lower() for l in args.levels.split(',')] if args.levels else None
+    unknown = [c for c in careers or [] if c not in CAREER_DB] + [l for l in levels or [] if l not in CAREER_LEVELS]
+    if unknown:
+        parser.error(f"Not in the catalog: {', '.join(unknown)}")
+
+    if args.prune:
+        print(f"Pruned {guidance_store.prune()} rows from older catalog versions")
+
+    if args.force:
+        pairs = [(c, l) for c in (careers or sorted(CAREER_DB)) for l in (levels or list(CAREER_LEVELS))]
+    else:
+        pairs = pending_pairs(guidance_store, careers, levels)
+    if args.limit:
+        pairs = pairs[:args.limit]
+
+    print(f"Catalog version {CATALOG_VERSION}: {len(pairs)} (career, level) pairs to generate")
+    if args.dry_run or not pairs:
+        for career, level in pairs:
+            print(f"  {career} ({level})")
+        return
+    if not (GEMINI_AVAILABLE or OPENAI_AVAILABLE):
+        parser.error('No AI providers configured. Set GEMINI_API_KEY or OPENAI_API_KEY')
+
+    try:
+        summary = precompute(guidance_store, pairs, workers=args.workers, rate=args.rate, force=args.force)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    print(f"Generated {summary['generated']}, failed {summary['failed']} in {summary['elapsed_seconds']}s")
+
+
+if __name__ == '__main__':
+    main()
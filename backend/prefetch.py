@@ -0,0 +1,152 @@
+"""
+Guidance Prefetch Module
+After /career answers, warms the LLM response cache for the similar careers
+it suggested (same level), since users often open one of them next.
+Prefetching only uses spare capacity: it has its own call budget and is the
+first work dropped when providers or the guidance queue are busy.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .guidance_jobs import get_job_stats
+from .llm_guidance import generate_personalized_guidance, get_ready_guidance, get_provider_load
+
+PREFETCH_ENABLED = os.getenv('GUIDANCE_PREFETCH', 'False') == 'True'
+# Similar careers warmed per /career request
+PREFETCH_TOP_N = int(os.getenv('GUIDANCE_PREFETCH_TOP_N', '2'))
+# Provider calls per minute (per worker) that prefetching may spend
+PREFETCH_BUDGET = int(os.getenv('GUIDANCE_PREFETCH_BUDGET', '20'))
+# Skip prefetching when a provider has this share of its concurrency limit in use
+PREFETCH_MAX_LOAD = float(os.getenv('GUIDANCE_PREFETCH_MAX_LOAD', '0.5'))
+# Seconds a prefetched career counts towards the hit rate
+PREFETCH_HIT_WINDOW = int(os.getenv('GUIDANCE_PREFETCH_HIT_WINDOW', '1800'))
+
+_MAX_TRACKED = 1024
+_MAX_QUEUED = 8
+
+_executor = None
+_executor_lock = threading.Lock()
+_lock = threading.Lock()
+_queued = set()           # (career, level) waiting for or running a prefetch
+_prefetched = OrderedDict()  # (career, level) -> time the prefetch finished
+_budget_window = [0.0, 0]  # [window start, calls spent in it]
+_stats = {
+    "scheduled": 0,
+    "completed": 0,
+    "failed": 0,
+    "skipped_cached": 0,
+    "dropped_load": 0,
+    "dropped_budget": 0,
+    "hits": 0
+}
+
+
+def _get_executor():
+    # One thread: prefetches never compete with each other for provider slots.
+    # Created on first use so no threads exist before gunicorn forks workers
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        return _executor
+
+
+def _under_load():
+    jobs = get_job_stats()
+    # Guidance jobs backing up behind busy workers means users are waiting
+    return jobs["pending"] >= jobs["max_workers"] or get_provider_load() >= PREFETCH_MAX_LOAD
+
+
+def _spend_budget():
+    now = time.monotonic()
+    with _lock:
+        if now - _budget_window[0] >= 60:
+            _budget_window[0], _budget_window[1] = now, 0
+        if _budget_window[1] >= PREFETCH_BUDGET:
+            return False
+        _budget_window[1] += 1
+        return True
+
+
+def _run(career_name, level):
+    key = (career_name, level)
+    try:
+        # Load may have risen while queued; prefetch is the first thing to give way
+        if _under_load():
+            outcome = "dropped_load"
+        elif not _spend_budget():
+            outcome = "dropped_budget"
+        else:
+            result = generate_personalized_guidance(career_name, level)
+            outcome = "completed" if result and result.get("status") == "success" else "failed"
+    except Exception:
+        outcome = "failed"
+    with _lock:
+        _queued.discard(key)
+        _stats[outcome] += 1
+        if outcome == "completed":
+            _prefetched[key] = time.time()
+            _prefetched.move_to_end(key)
+            while len(_prefetched) > _MAX_TRACKED:
+                _prefetched.popitem(last=False)
+
+
+def prefetch_guidance(careers, level):
+    """
+    Queue cache warming for careers the user is likely to open next.
+
+    Args:
+        careers (list): Career keys, most likely first
+        level (str): User level the guidance is generated for
+
+    Returns:
+        int: Number of prefetches queued
+    """
+    if not PREFETCH_ENABLED:
+        return 0
+    queued = 0
+    for career_name in careers[:PREFETCH_TOP_N]:
+        key = (career_name, level)
+        with _lock:
+            if key in _queued:
+                continue
+            if len(_queued) >= _MAX_QUEUED:
+                _stats["dropped_load"] += 1
+                continue
+        if _under_load():
+            with _lock:
+                _stats["dropped_load"] += 1
+            continue
+        if get_ready_guidance(career_name, level) is not None:
+            with _lock:
+                _stats["skipped_cached"] += 1
+            continue
+        with _lock:
+            _queued.add(key)
+            _stats["scheduled"] += 1
+        _get_executor().submit(_run, career_name, level)
+        queued += 1
+    return queued
+
+
+def record_guidance_request(career_name, level):
+    """Count a hit when a career is requested after being prefetched."""
+    key = (career_name, level)
+    with _lock:
+        finished_at = _prefetched.pop(key, None)
+        if finished_at is not None and time.time() - finished_at <= PREFETCH_HIT_WINDOW:
+            _stats["hits"] += 1
+
+
+def get_prefetch_stats():
+    """Return prefetch counters and the share of completed prefetches that were used."""
+    with _lock:
+        stats = dict(_stats)
+        stats["queued"] = len(_queued)
+    stats["enabled"] = PREFETCH_ENABLED
+    stats["budget_per_minute"] = PREFETCH_BUDGET
+    stats["hit_rate"] = round(stats["hits"] / stats["completed"], 4) if stats["completed"] else 0.0
+    return stats
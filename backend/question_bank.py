@@ -0,0 +1,275 @@
+"""
+Interview Question Bank
+Role-specific mock interview questions for careers without a hand-written
+list (every imported O*NET occupation). A (career, level) pair is filled on
+first use: questions are built offline from the occupation's task
+statements so the interview can start at once, and if a provider is
+configured they are replaced in the background by LLM-written ones. Rows
+are keyed by `CATALOG_VERSION` like the guidance store, and later lookups
+are a dictionary hit.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .career_data import CAREER_DB, CAREER_LEVELS, CATALOG_VERSION
+
+_DEFAULT_PATH = Path(__file__).parent / 'question_bank.sqlite3'
+
+QUESTION_BANK_ENABLED = os.getenv('QUESTION_BANK_ENABLED', 'True') == 'True'
+# True = replace task-based questions with LLM-written ones in the background
+QUESTION_BANK_LLM = os.getenv('QUESTION_BANK_LLM', 'True') == 'True'
+# Seconds before a failed LLM generation for a pair is retried
+_RETRY_AFTER = 600
+
+# Questions kept per (career, level)
+QUESTIONS_PER_ROLE = 10
+
+
+class QuestionBank:
+    """SQLite table of question lists with an in-process read cache."""
+
+    def __init__(self, path=_DEFAULT_PATH, version=CATALOG_VERSION):
+        self.path = str(path) if path else None
+        self.version = version
+        self._memory = {}  # (career, level) -> {"questions", "source"}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0}
+
+    def _connect(self):
+        # One connection per thread and per process (never reuse across a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS questions ("
+            "catalog_version TEXT NOT NULL, career TEXT NOT NULL, level TEXT NOT NULL, "
+            "questions TEXT NOT NULL, source TEXT NOT NULL, provider TEXT, created_at REAL NOT NULL, "
+            "PRIMARY KEY (catalog_version, career, level))"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, stat):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get(self, career, level):
+        """
+        Look up stored questions for the current catalog version.
+
+        Returns:
+            dict: {"questions", "source"} or None
+        """
+        key = (career.lower().strip(), level.lower().strip())
+        with self._lock:
+            cached = self._memory.get(key)
+        if cached is None and self.path:
+            try:
+                row = self._connect().execute(
+                    "SELECT questions, source FROM questions "
+                    "WHERE catalog_version = ? AND career = ? AND level = ?",
+                    (self.version,) + key
+                ).fetchone()
+            except sqlite3.Error:
+                self._count("errors")
+                row = None
+            if row is not None:
+                cached = {"questions": json.loads(row[0]), "source": row[1]}
+                # Task-based rows may still be replaced by another worker's LLM rows; only final rows are kept
+                if cached["source"] == "llm" or not _llm_upgrades():
+                    with self._lock:
+                        self._memory[key] = cached
+        self._count("hits" if cached else "misses")
+        return cached
+
+    def put(self, career, level, questions, source, provider=None):
+        key = (career.lower().strip(), level.lower().strip())
+        entry = {"questions": list(questions), "source": source}
+        if self.path:
+            try:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO questions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self.version,) + key + (json.dumps(entry["questions"]), source, provider, time.time())
+                )
+            except sqlite3.Error:
+                self._count("errors")
+        with self._lock:
+            # Final rows stay in memory; without a database the memory copy is the only one
+            if source == "llm" or not _llm_upgrades() or not self.path:
+                self._memory[key] = entry
+            else:
+                self._memory.pop(key, None)
+        self._count("writes")
+
+    def prune(self):
+        """Delete rows from older catalog versions; returns the number removed."""
+        if not self.path:
+            return 0
+        return self._connect().execute(
+            "DELETE FROM questions WHERE catalog_version != ?", (self.version,)
+        ).rowcount
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["catalog_version"] = self.version
+        stats["llm_generation"] = _llm_upgrades()
+        with _pending_lock:
+            stats["generating"] = len(_pending)
+        return stats
+
+
+def _llm_upgrades():
+    # Task-based rows are final unless a provider can replace them
+    from .llm_guidance import GEMINI_AVAILABLE, OPENAI_AVAILABLE
+    return QUESTION_BANK_LLM and (GEMINI_AVAILABLE or OPENAI_AVAILABLE)
+
+
+def _task_statements(career_data):
+    # Imported occupations carry O*NET task statements; built-in careers have a typical day
+    tasks = list(career_data.get("tasks") or [])
+    if not tasks:
+        tasks = [line.lstrip("-• ").strip() for line in (career_data.get("typical_day") or "").splitlines()]
+    return [t.rstrip(".") for t in tasks if len(t.split()) >= 2]
+
+
+def _lower_first(text):
+    return text[:1].lower() + text[1:] if text else text
+
+
+def questions_from_tasks(career, level, count=QUESTIONS_PER_ROLE):
+    """
+    Build role-specific questions from a career's task statements and skills.
+
+    Args:
+        career (str): Career key in CAREER_DB
+        level (str): Candidate level (student, fresher or professional)
+        count (int): Number of questions
+
+    Returns:
+        list: Question strings (at most `count`)
+    """
+    data = CAREER_DB.get(career, {})
+    title = data.get("source_title") or career.title()
+    tasks = _task_statements(data)
+    skills = [s for s in data.get("skills", []) if not re.search(r"\d", s)]
+    experience = "a project, internship or coursework" if level in ("student", "fresher") else "your work"
+
+    questions = []
+    for task in tasks[:4]:
+        questions.append(f"Walk me through how you would {_lower_first(task)}.")
+    for task in tasks[4:6]:
+        questions.append(f"Tell me about a time in {experience} when you had to {_lower_first(task)}.")
+    for skill in skills[:3]:
+        questions.append(f"Describe how you have used {skill} in {experience}.")
+    questions += [
+        "What do you find most challenging about this kind of work, and how do you handle it?",
+        "How do you keep your skills current in this field?",
+        f"Why are you interested in this role ({title})?"
+    ]
+
+    seen = set()
+    unique = [q for q in questions if not (q.lower() in seen or seen.add(q.lower()))]
+    return unique[:count]
+
+
+_executor = None
+_pending = set()  # (career, level) with an LLM generation queued or running
+_failed = {}      # (career, level) -> time of the last failed LLM generation
+_pending_lock = threading.Lock()
+
+
+def _get_executor():
+    # Created on first use so no threads exist before gunicorn forks workers
+    global _executor
+    with _pending_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='question-bank')
+        return _executor
+
+
+def _generate_with_llm(career, level):
+    from .llm_guidance import generate_interview_questions
+    try:
+        result = generate_interview_questions(career, level, QUESTIONS_PER_ROLE)
+        succeeded = bool(result and result.get("status") == "success" and len(result["questions"]) >= 5)
+        if succeeded:
+            question_bank.put(career, level, result["questions"], "llm", result.get("provider"))
+    except Exception:
+        succeeded = False
+    with _pending_lock:
+        _pending.discard((career, level))
+        if not succeeded:
+            # The task-based questions stay in place until a later retry
+            _failed[(career, level)] = time.monotonic()
+
+
+def _queue_llm_generation(career, level):
+    if not _llm_upgrades():
+        return
+    with _pending_lock:
+        if (career, level) in _pending:
+            return
+        if time.monotonic() - _failed.get((career, level), -_RETRY_AFTER) < _RETRY_AFTER:
+            return
+        _pending.add((career, level))
+    _get_executor().submit(_generate_with_llm, career, level)
+
+
+def get_role_questions(career, level):
+    """
+    Interview questions for a career without a hand-written list.
+
+    Args:
+        career (str): Career key in CAREER_DB
+        level (str): Candidate level
+
+    Returns:
+        list: Question strings, or None if the career has nothing to build them from
+    """
+    if level not in CAREER_LEVELS:
+        return None  # never create bank rows (or LLM jobs) for arbitrary levels
+    stored = question_bank.get(career, level) if question_bank is not None else None
+    if stored is not None:
+        if stored["source"] != "llm":
+            _queue_llm_generation(career, level)
+        return stored["questions"]
+
+    questions = questions_from_tasks(career, level)
+    if len(questions) < 5:
+        return None
+    if question_bank is not None:
+        question_bank.put(career, level, questions, "tasks")
+        _queue_llm_generation(career, level)
+    return questions
+
+
+def _bank_from_env():
+    if not QUESTION_BANK_ENABLED:
+        return None
+    # An empty path keeps the bank in memory only
+    return QuestionBank(os.getenv('QUESTION_BANK_PATH', str(_DEFAULT_PATH)))
+
+
+# Shared bank; None when QUESTION_BANK_ENABLED is not "True"
+question_bank = _bank_from_env()
+
+
+def get_question_bank_stats():
+    """Return question bank counters."""
+    if question_bank is None:
+        return {"enabled": False}
+    return dict(question_bank.stats(), enabled=True)
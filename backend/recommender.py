@@ -1,7 +1,6 @@
 from .career_data import CAREER_DB
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+from .fuzzy_matcher import lsa_available, semantic_search
+from .skill_normalizer import normalize_skills
 
 def recommend_careers_by_skills(user_skills, top_n=5):
     """
@@ -14,9 +13,25 @@ def recommend_careers_by_skills(user_skills, top_n=5):
     Returns:
         list: List of (career_name, match_score, matching_skills) tuples
     """
+    user_skills = normalize_skills(user_skills)
     if not user_skills or len(user_skills) == 0:
         return []
     
+    # With LSA embeddings from the O*NET importer, one dense product scores every career.
+    # Candidates come best first; those sharing no skill with the user are skipped.
+    if lsa_available():
+        results = []
+        for career, score in semantic_search(" ".join(user_skills).lower(), len(CAREER_DB)):
+            matching = [s for s in CAREER_DB[career]["skills"] if any(
+                user_skill.lower() in s.lower() or s.lower() in user_skill.lower()
+                for user_skill in user_skills
+            )]
+            if matching:
+                results.append((career, score, matching))
+                if len(results) == top_n:
+                    break
+        return results
+    
     # Create skill profiles
     career_skill_profiles = {}
     for career, info in CAREER_DB.items():
@@ -28,6 +43,9 @@ def recommend_careers_by_skills(user_skills, top_n=5):
     all_profiles = [user_profile] + list(career_skill_profiles.values())
     
     try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
         vectorizer = TfidfVectorizer(analyzer='char', ngram_range=(2, 2))
         vectors = vectorizer.fit_transform(all_profiles)
         
@@ -97,7 +115,8 @@ def find_skill_gap(desired_career, user_skills):
         return None
     
     career_skills = set(CAREER_DB[desired_career]["skills"])
-    user_skills_set = set(skill.lower() for skill in user_skills)
+    # "python3", "Pyhton" and "PowerBI" count as the catalog's "Python" and "Power BI"
+    user_skills_set = set(skill.lower() for skill in normalize_skills(user_skills))
     
     career_skills_lower = set(s.lower() for s in career_skills)
     
@@ -0,0 +1,146 @@
+"""
+Semantic Matching Benchmark
+Side-by-side latency and quality of the sparse TF-IDF path and dense LSA
+embeddings of several sizes. It runs on the imported O*NET index when
+`backend/CAREER_DB_onet.*` exists, otherwise on a synthetic catalog of the
+same shape.
+
+Each query is a handful of words from one career's text, like a user would
+type. A hit means that career ranked first (accuracy@1) or in the top 5
+(accuracy@5). Overlap@10 is how many of the sparse path's top 10 the dense
+path also returns.
+
+    python -m backend.semantic_bench --dims 64 128 192 256 --queries 500
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+_ONET_JSON = Path(__file__).parent / 'CAREER_DB_onet.json'
+
+
+def _synthetic_catalog(n, seed=0, vocabulary=6000, topics=80):
+    # Careers drawn from overlapping topics so that near neighbours exist
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    words = [f"w{i}" for i in range(vocabulary)]
+    topic_words = [rng.choice(vocabulary, 150, replace=False) for _ in range(topics)]
+    texts = []
+    for _ in range(n):
+        mix = rng.choice(topics, 2, replace=False)
+        pool = np.concatenate([topic_words[mix[0]]] * 3 + [topic_words[mix[1]], rng.choice(vocabulary, 40)])
+        texts.append(" ".join(words[j] for j in rng.choice(pool, 120)))
+    return texts
+
+
+def _onet_texts():
+    with open(_ONET_JSON, encoding='utf-8') as f:
+        db = json.load(f)
+    return [" ".join([title, data.get("description", ""), data.get("market", ""), " ".join(data.get("tasks", []))])
+            for title, data in db.items()]
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def run(texts, dims, n_queries, query_words, seed=0):
+    """
+    Compare the sparse and dense paths on one corpus.
+
+    Returns:
+        list: One dict per path with latency (ms per query) and quality figures
+    """
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    from .onet_importer import fit_lsa
+
+    rng = np.random.default_rng(seed)
+    vec = TfidfVectorizer(ngram_range=(1, 2), max_features=20000)  # same as the importer
+    X = vec.fit_transform(texts)
+
+    targets = rng.choice(len(texts), min(n_queries, len(texts)), replace=False)
+    queries = []
+    for t in targets:
+        tokens = texts[t].split()
+        queries.append(" ".join(rng.choice(tokens, min(query_words, len(tokens)), replace=False)))
+
+    def measure(name, score, build_ms=0.0, extra=None):
+        latencies, top1, top5, top10 = [], 0, 0, []
+        for target, query in zip(targets, queries):
+            start = time.perf_counter()
+            sims = score(query)
+            top = np.argpartition(-sims, 9)[:10]
+            top = top[np.argsort(-sims[top])]
+            latencies.append((time.perf_counter() - start) * 1000)
+            top1 += int(top[0] == target)
+            top5 += int(target in top[:5])
+            top10.append(top)
+        return {
+            "path": name,
+            "build_ms": round(build_ms, 1),
+            "mean_ms": round(sum(latencies) / len(latencies), 3),
+            "p95_ms": round(_percentile(latencies, 0.95), 3),
+            "accuracy@1": round(top1 / len(queries), 3),
+            "accuracy@5": round(top5 / len(queries), 3),
+            "top10": top10,
+            **(extra or {})
+        }
+
+    results = [measure("tfidf (sparse)", lambda q: cosine_similarity(vec.transform([q]), X).ravel(),
+                       extra={"size_mb": round((X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 1e6, 2)})]
+
+    for dim in dims:
+        start = time.perf_counter()
+        components, embeddings = fit_lsa(X, dim)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        def score(q, components=components, embeddings=embeddings):
+            # As in fuzzy_matcher.semantic_scores
+            q = vec.transform([q])
+            v = components[:, q.indices] @ q.data.astype(np.float32)
+            norm = np.linalg.norm(v)
+            return embeddings @ (v / norm) if norm else np.zeros(len(embeddings), dtype=np.float32)
+
+        results.append(measure(f"lsa {embeddings.shape[1]}d (dense)", score, build_ms,
+                               {"size_mb": round((embeddings.nbytes + components.nbytes) / 1e6, 2)}))
+
+    sparse_top10 = results[0]["top10"]
+    for result in results:
+        top10 = result.pop("top10")
+        result["agree@1"] = round(sum(int(a[0] == b[0]) for a, b in zip(top10, sparse_top10)) / len(top10), 3)
+        result["overlap@10"] = round(
+            sum(len(set(a.tolist()) & set(b.tolist())) for a, b in zip(top10, sparse_top10)) / (10 * len(top10)), 3)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare sparse TF-IDF and dense LSA career matching')
+    parser.add_argument('--dims', type=int, nargs='+', default=[64, 128, 192, 256], help='LSA dimensions to try')
+    parser.add_argument('--queries', type=int, default=500, help='Queries per path')
+    parser.add_argument('--query-words', type=int, default=6, help='Words per query')
+    parser.add_argument('--synthetic', type=int, default=0,
+                        help='Use a synthetic catalog of this many careers instead of the O*NET import')
+    args = parser.parse_args()
+
+    if not args.synthetic and _ONET_JSON.exists():
+        texts, source = _onet_texts(), str(_ONET_JSON)
+    else:
+        n = args.synthetic or 1000
+        texts, source = _synthetic_catalog(n), f"synthetic catalog of {n} careers"
+    print(f"{source}: {args.queries} queries of {args.query_words} words")
+
+    results = run(texts, args.dims, args.queries, args.query_words)
+    columns = ["path", "build_ms", "size_mb", "mean_ms", "p95_ms", "accuracy@1", "accuracy@5", "agree@1", "overlap@10"]
+    print("  ".join(f"{c:>18}" if i == 0 else f"{c:>10}" for i, c in enumerate(columns)))
+    for result in results:
+        print("  ".join(f"{result[c]:>18}" if i == 0 else f"{result[c]:>10}" for i, c in enumerate(columns)))
+
+
+if __name__ == '__main__':
+    main()
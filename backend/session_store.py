@@ -0,0 +1,249 @@
+"""
+Session Store
+Server-side storage for mock interview sessions, keyed by a random session
+ID with idle-TTL expiry. The in-memory store is an LRU capped at
+`max_sessions`; the SQLite store is shared by all gunicorn workers on a host.
+
+Stored objects provide `session_id`, `to_dict()` and a `from_dict(data)`
+classmethod (used by the SQLite store).
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+def new_session_id():
+    return uuid.uuid4().hex
+
+
+class SessionNotFound(KeyError):
+    """Unknown or expired session ID."""
+
+
+class SessionConflict(Exception):
+    """Other workers kept updating the session; the request can be retried."""
+
+
+class _StripedLocks:
+    # Serializes updates to one session without a global lock around slow work
+    def __init__(self, stripes=64):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __call__(self, session_id):
+        return self._locks[hash(session_id) % len(self._locks)]
+
+
+class MemorySessionStore:
+    """In-process LRU of live session objects with idle TTL."""
+
+    def __init__(self, ttl_seconds=1800, max_sessions=10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()  # session_id -> (last_access, session)
+        self._lock = threading.Lock()
+        self._update_locks = _StripedLocks()
+        self._stats = {"created": 0, "hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+
+    def put(self, session):
+        with self._lock:
+            self._sessions[session.session_id] = (time.monotonic(), session)
+            self._sessions.move_to_end(session.session_id)
+            self._stats["created"] += 1
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self._stats["evicted"] += 1
+
+    def get(self, session_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if now - entry[0] > self.ttl_seconds:
+                del self._sessions[session_id]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._sessions[session_id] = (now, entry[1])
+            self._sessions.move_to_end(session_id)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def update(self, session_id, fn):
+        """
+        Apply `fn(session)` to a stored session and return its result.
+        `fn` must only change the session (see SQLiteSessionStore.update).
+
+        Raises:
+            SessionNotFound: If the session does not exist or has expired
+        """
+        with self._update_locks(session_id):
+            session = self.get(session_id)
+            if session is None:
+                raise SessionNotFound(session_id)
+            return fn(session)
+
+    def delete(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def purge_expired(self):
+        # Entries are in access order, so expired ones are at the front
+        now = time.monotonic()
+        removed = 0
+        with self._lock:
+            while self._sessions:
+                session_id, (last_access, _) = next(iter(self._sessions.items()))
+                if now - last_access <= self.ttl_seconds:
+                    break
+                del self._sessions[session_id]
+                removed += 1
+            self._stats["expired"] += removed
+        return removed
+
+    def stats(self):
+        self.purge_expired()
+        with self._lock:
+            stats = dict(self._stats)
+            stats["active"] = len(self._sessions)
+        stats.update(backend="memory", ttl_seconds=self.ttl_seconds, max_sessions=self.max_sessions)
+        return stats
+
+
+class SQLiteSessionStore:
+    """Sessions serialized to SQLite so any worker can continue them."""
+
+    def __init__(self, session_cls, path, ttl_seconds=1800, max_sessions=10000):
+        self.session_cls = session_cls
+        self.path = str(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._update_locks = _StripedLocks()
+        self._writes_since_purge = 0
+        # A read refreshes accessed_at at most this often, so polling keeps a session alive
+        self._touch_after = min(60.0, ttl_seconds / 10)
+        self._stats = {"created": 0, "hits": 0, "misses": 0, "expired": 0, "evicted": 0, "conflicts": 0}
+
+    def _connect(self):
+        # One connection per thread and per process (never reuse across a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, data TEXT NOT NULL, "
+            "version INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS sessions_accessed ON sessions (accessed_at)")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _count(self, stat, n=1):
+        with self._lock:
+            self._stats[stat] += n
+
+    def put(self, session):
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO sessions VALUES (?, ?, 0, ?)",
+            (session.session_id, json.dumps(session.to_dict()), time.time())
+        )
+        self._count("created")
+        with self._lock:
+            self._writes_since_purge += 1
+            purge = self._writes_since_purge >= 100
+            if purge:
+                self._writes_since_purge = 0
+        if purge:
+            self.purge_expired()
+
+    def _load(self, session_id):
+        row = self._connect().execute(
+            "SELECT data, version, accessed_at FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            self._count("misses")
+            return None, None
+        now = time.time()
+        if now - row[2] > self.ttl_seconds:
+            self.delete(session_id)
+            self._count("expired")
+            self._count("misses")
+            return None, None
+        if now - row[2] >= self._touch_after:
+            # Only the access time changes, so concurrent updates do not conflict
+            self._connect().execute(
+                "UPDATE sessions SET accessed_at = ? WHERE session_id = ?", (now, session_id)
+            )
+        self._count("hits")
+        return self.session_cls.from_dict(json.loads(row[0])), row[1]
+
+    def get(self, session_id):
+        session, _ = self._load(session_id)
+        return session
+
+    def update(self, session_id, fn, retries=3):
+        """
+        Apply `fn(session)` and write the session back; retried if another
+        worker updated it in between. `fn` may therefore run more than once
+        and must only change the session: start jobs or provider calls after
+        `update` returns.
+
+        Raises:
+            SessionNotFound: If the session does not exist or has expired
+            SessionConflict: If every attempt lost to another worker's update
+        """
+        with self._update_locks(session_id):
+            for _ in range(retries):
+                session, version = self._load(session_id)
+                if session is None:
+                    raise SessionNotFound(session_id)
+                result = fn(session)
+                updated = self._connect().execute(
+                    "UPDATE sessions SET data = ?, version = version + 1, accessed_at = ? "
+                    "WHERE session_id = ? AND version = ?",
+                    (json.dumps(session.to_dict()), time.time(), session_id, version)
+                ).rowcount
+                if updated:
+                    return result
+                self._count("conflicts")
+            raise SessionConflict("Session is being updated elsewhere; please retry")
+
+    def delete(self, session_id):
+        self._connect().execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def purge_expired(self):
+        conn = self._connect()
+        removed = conn.execute(
+            "DELETE FROM sessions WHERE accessed_at < ?", (time.time() - self.ttl_seconds,)
+        ).rowcount
+        evicted = conn.execute(
+            "DELETE FROM sessions WHERE session_id IN (SELECT session_id FROM sessions "
+            "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (self.max_sessions,)
+        ).rowcount
+        self._count("expired", removed)
+        self._count("evicted", evicted)
+        return removed
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        try:
+            stats["active"] = self._connect().execute(
+                "SELECT COUNT(*) FROM sessions WHERE accessed_at >= ?", (time.time() - self.ttl_seconds,)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            stats["active"] = None
+        stats.update(backend="sqlite", ttl_seconds=self.ttl_seconds, max_sessions=self.max_sessions)
+        return stats
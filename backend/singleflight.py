@@ -0,0 +1,77 @@
+"""
+Single-Flight Request Coalescing
+Concurrent callers asking for the same key share one in-flight call: the
+first caller runs it, the rest wait for its result (or its exception).
+"""
+import threading
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicate identical concurrent calls across threads in one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {
+            "leader_calls": 0,
+            "deduplicated_calls": 0,
+            "max_waiters": 0
+        }
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Run `fn(*args, **kwargs)` unless a call for `key` is already running,
+        in which case wait for that call and return its result.
+
+        Returns:
+            tuple: (result, shared) where `shared` is True for callers that
+            reused another thread's call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._stats["deduplicated_calls"] += 1
+                self._stats["max_waiters"] = max(self._stats["max_waiters"], call.waiters)
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["leader_calls"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self):
+        """Return leader/deduplicated call counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls)
+        total = stats["leader_calls"] + stats["deduplicated_calls"]
+        stats["dedup_rate"] = round(stats["deduplicated_calls"] / total, 4) if total else 0.0
+        return stats
@@ -0,0 +1,324 @@
+"""
+Skill Co-occurrence
+Which skills the catalog lists together ("careers needing Docker also need
+Kubernetes"). The skill x skill co-occurrence counts are one sparse product
+of the careers x skills matrix with itself, normalized by lift (how much
+more often two skills share a career than chance would give; PMI is its
+log2). Pairs are ranked by PMI discounted for rare evidence (Pantel & Lin):
+a pair seen in one career, or a skill only one career lists, has a high
+lift by chance alone. Only each skill's RELATED_TOP_K strongest neighbours
+are kept, sorted, so a lookup is a slice of precomputed arrays.
+
+The table is saved next to the other catalog artifacts (SKILL_RELATED_PATH)
+and reused while the catalog version, top_k and min_count are unchanged.
+Rebuild it with:
+    python -m backend.skill_cooccurrence --build
+numpy and scipy are imported on first use (see backend/startup.py).
+"""
+import argparse
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+
+from .career_data import CATALOG_VERSION
+from .skill_index import get_skill_index
+from .skill_normalizer import normalize_skill, normalize_skills
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PATH = Path(__file__).parent / 'skill_related.npz'
+
+# Neighbours kept per skill, and how many careers a pair must share to count
+RELATED_TOP_K = int(os.getenv('SKILL_RELATED_TOP_K', '20'))
+RELATED_MIN_COUNT = int(os.getenv('SKILL_RELATED_MIN_COUNT', '1'))
+MAX_RELATED_LIMIT = 50
+
+
+class SkillCooccurrence:
+    """Top-k related skills per skill column, as CSR-style arrays."""
+
+    def __init__(self, indptr, neighbours, counts, lift, score, skill_names, careers, version=None,
+                 top_k=RELATED_TOP_K, min_count=RELATED_MIN_COUNT):
+        self.indptr = indptr          # skill j's neighbours are [indptr[j]:indptr[j + 1]]
+        self.neighbours = neighbours  # skill columns, strongest first
+        self.counts = counts          # careers requiring both skills
+        self.lift = lift
+        self.score = score            # discounted PMI, the ranking key
+        self.skill_names = list(skill_names)
+        self.careers = careers        # careers requiring each skill
+        self.version = version
+        self.top_k = top_k            # settings the table was built with
+        self.min_count = min_count
+        self.column = {name.lower().strip(): j for j, name in enumerate(self.skill_names)}
+
+    @classmethod
+    def build(cls, index, top_k=RELATED_TOP_K, min_count=RELATED_MIN_COUNT):
+        """
+        Compute the table from a SkillIndex.
+
+        Args:
+            index (SkillIndex): careers x skills incidence matrix
+            top_k (int): Neighbours kept per skill
+            min_count (int): Careers a pair must share
+
+        Returns:
+            SkillCooccurrence
+        """
+        import numpy as np
+        from scipy import sparse
+
+        A = index.matrix
+        n_careers = A.shape[0]
+        careers = np.asarray(A.sum(axis=0)).ravel().astype(np.int64)
+
+        # Off-diagonal entries are the careers shared by each pair of skills
+        C = sparse.triu(A.T @ A, k=1, format="coo")
+        C = (C + C.T).tocsr()
+        C.eliminate_zeros()
+
+        indptr = [0]
+        neighbours, counts, lifts, scores = [], [], [], []
+        for j in range(C.shape[0]):
+            cols = C.indices[C.indptr[j]:C.indptr[j + 1]]
+            both = C.data[C.indptr[j]:C.indptr[j + 1]].astype(np.int64)
+            keep = both >= min_count
+            cols, both = cols[keep], both[keep]
+            lift = both * n_careers / (careers[j] * careers[cols])
+            # Discount PMI by how little evidence the pair and its rarer skill have
+            rarer = np.minimum(careers[j], careers[cols])
+            score = np.log2(lift) * (both / (both + 1)) * (rarer / (rarer + 1))
+            # Strongest association first; more shared careers breaks ties
+            order = np.lexsort((cols, -both, -score))[:top_k]
+            neighbours.append(cols[order])
+            counts.append(both[order])
+            lifts.append(lift[order])
+            scores.append(score[order])
+            indptr.append(indptr[-1] + len(order))
+
+        def concat(parts, dtype):
+            return np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+
+        return cls(
+            np.asarray(indptr, dtype=np.int64),
+            concat(neighbours, np.int32),
+            concat(counts, np.int32),
+            concat(lifts, np.float32),
+            concat(scores, np.float32),
+            index.skill_names,
+            careers,
+            index.version,
+            top_k,
+            min_count
+        )
+
+    def matches(self, version, top_k, min_count):
+        """Whether the table was built for this catalog version and these settings."""
+        return (self.version, self.top_k, self.min_count) == (version, top_k, min_count)
+
+    def save(self, path):
+        import numpy as np
+
+        # Write then rename so another worker never reads a half-written file
+        tmp = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp,
+            indptr=self.indptr, neighbours=self.neighbours, counts=self.counts, lift=self.lift, score=self.score,
+            careers=self.careers, skill_names=np.array(self.skill_names, dtype=str),
+            version=np.array(self.version or ""),
+            top_k=np.array(self.top_k), min_count=np.array(self.min_count)
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["indptr"], data["neighbours"], data["counts"], data["lift"], data["score"],
+                data["skill_names"].tolist(), data["careers"], str(data["version"]),
+                int(data["top_k"]), int(data["min_count"])
+            )
+
+    def related(self, j, limit=10):
+        """
+        Strongest neighbours of skill column `j`.
+
+        Returns:
+            list: {"skill", "shared_careers", "lift", "pmi", "score"}, strongest first
+        """
+        start = self.indptr[j]
+        stop = min(self.indptr[j + 1], start + limit)
+        return [
+            {
+                "skill": self.skill_names[k],
+                "shared_careers": int(count),
+                "lift": round(float(lift), 3),
+                "pmi": round(math.log2(lift), 3),
+                "score": round(float(score), 3)
+            }
+            for k, count, lift, score in zip(self.neighbours[start:stop].tolist(),
+                                             self.counts[start:stop].tolist(),
+                                             self.lift[start:stop].tolist(),
+                                             self.score[start:stop].tolist())
+        ]
+
+    def suggest(self, skills, candidates, limit=3):
+        """
+        Rank `candidates` by their association with `skills`.
+
+        Each known skill contributes the discounted PMI of its top-k
+        neighbours that are candidates, so the work is len(skills) x top_k.
+
+        Args:
+            skills (list): Skills the user has (catalog names)
+            candidates (list): Skills to choose from, e.g. a career's missing skills
+            limit (int): Suggestions returned
+
+        Returns:
+            list: {"skill", "score", "because"}, best first; only candidates
+            positively associated with at least one of `skills`
+        """
+        wanted = {self.column[c.lower()]: c for c in candidates if c.lower() in self.column}
+        scores, because = {}, {}
+        for skill in skills:
+            j = self.column.get(skill.lower())
+            if j is None:
+                continue
+            start, stop = self.indptr[j], self.indptr[j + 1]
+            for k, score in zip(self.neighbours[start:stop].tolist(), self.score[start:stop].tolist()):
+                if k in wanted and score > 0:
+                    scores[k] = scores.get(k, 0.0) + score
+                    because.setdefault(k, []).append(self.skill_names[j])
+        best = sorted(scores, key=lambda k: (-scores[k], wanted[k]))[:limit]
+        return [
+            {"skill": wanted[k], "score": round(scores[k], 3), "because": because[k]}
+            for k in best
+        ]
+
+    def stats(self):
+        return {
+            "catalog_version": self.version,
+            "skills": len(self.skill_names),
+            "pairs": int(len(self.neighbours)),
+            "top_k": self.top_k,
+            "min_count": self.min_count
+        }
+
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def _table_path():
+    return os.getenv('SKILL_RELATED_PATH', str(_DEFAULT_PATH))
+
+
+def get_cooccurrence():
+    """Shared table for the loaded catalog: loaded from disk if current, else built and saved."""
+    global _table
+    with _table_lock:
+        if _table is not None and _table.matches(CATALOG_VERSION, RELATED_TOP_K, RELATED_MIN_COUNT):
+            return _table
+        path = _table_path()
+        table = None
+        if os.path.exists(path):
+            try:
+                table = SkillCooccurrence.load(path)
+            except Exception as e:
+                logger.warning("Could not read %s: %s", path, e)
+            if table is not None and not table.matches(CATALOG_VERSION, RELATED_TOP_K, RELATED_MIN_COUNT):
+                table = None
+        if table is None:
+            table = SkillCooccurrence.build(get_skill_index(), RELATED_TOP_K, RELATED_MIN_COUNT)
+            try:
+                table.save(path)
+            except OSError as e:
+                logger.warning("Could not save %s: %s", path, e)
+        _table = table
+        return _table
+
+
+def get_related_skills(skill: str, limit: int = 10) -> dict:
+    """
+    Skills most often required together with `skill`.
+
+    Args:
+        skill (str): Skill as typed by the user
+        limit (int): Related skills returned (at most MAX_RELATED_LIMIT)
+
+    Returns:
+        dict: The catalog skill, how many careers require it and its related skills
+    """
+    if not 1 <= limit <= MAX_RELATED_LIMIT:
+        return {"status": "error", "message": f"limit must be between 1 and {MAX_RELATED_LIMIT}"}
+
+    start = time.perf_counter()
+    table = get_cooccurrence()
+    name = normalize_skill(skill)
+    j = table.column.get(name.lower())
+    if j is None:
+        return {"status": "not_found", "message": f"Skill '{skill}' is not required by any career"}
+
+    return {
+        "status": "success",
+        "skill": table.skill_names[j],
+        "careers": int(table.careers[j]),
+        "related": table.related(j, limit),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)
+    }
+
+
+def suggest_next_skills(user_skills: list, missing_skills: list, limit: int = 3) -> list:
+    """
+    Missing skills that best fit what the user already knows.
+
+    Args:
+        user_skills (list): The user's skills as typed
+        missing_skills (list): Catalog skills the target career still needs
+        limit (int): Suggestions returned
+
+    Returns:
+        list: {"skill", "score", "because"}, best first
+    """
+    if not missing_skills:
+        return []
+    return get_cooccurrence().suggest(normalize_skills(user_skills), missing_skills, limit)
+
+
+def get_cooccurrence_stats() -> dict:
+    """Return the size of the loaded co-occurrence table (empty until first use)."""
+    table = _table
+    return table.stats() if table is not None else {"loaded": False}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the skill co-occurrence table or look up related skills')
+    parser.add_argument('skill', nargs='?', help='Skill to show related skills for')
+    parser.add_argument('--build', action='store_true', help='Rebuild and save the table')
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.build:
+        table = SkillCooccurrence.build(get_skill_index())
+        table.save(_table_path())
+        print(f"Built {table.stats()} in {(time.perf_counter() - start) * 1000:.1f} ms -> {_table_path()}")
+    else:
+        table = get_cooccurrence()
+        print(f"Loaded {table.stats()} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if args.skill:
+        result = get_related_skills(args.skill, args.limit)
+        for item in result.get("related", []):
+            print(f"  {item['skill']}: {item['shared_careers']} careers, lift {item['lift']}, PMI {item['pmi']}, "
+                  f"score {item['score']}")
+        if result["status"] != "success":
+            print(result["message"])
+
+
+if __name__ == '__main__':
+    main()
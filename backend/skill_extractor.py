@@ -0,0 +1,218 @@
+"""
+Skill Extraction
+Finds every catalog skill and alias mentioned in resume or profile text in
+one linear pass, using an Aho-Corasick automaton built from the skill
+vocabulary (once per catalog version). Matches must sit on word
+boundaries, so "java" is not found inside "javascript"; a version suffix
+("python3", "html5") is allowed.
+
+    python -m backend.skill_extractor --bench --size-kb 64
+"""
+import argparse
+import re
+import threading
+import time
+from collections import deque
+
+from .career_data import CAREER_DB, CATALOG_VERSION, SKILL_ALIASES
+from .skill_normalizer import skill_key
+
+# Texts longer than this are rejected by /skills/extract
+MAX_EXTRACT_CHARS = 200000
+
+# Aliases that are also everyday words; they resolve typed skills but are not
+# trusted in free text ("the rest of the team")
+AMBIGUOUS_ALIASES = {"rest", "node", "spark", "torch", "kube", "containers", "py", "math", "maths"}
+
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+def _normalize_text(text):
+    # Same folding for patterns and text: case, and runs of spaces/dashes/underscores
+    return _SEPARATORS.sub(" ", text.lower())
+
+
+class SkillAutomaton:
+    """Aho-Corasick automaton whose outputs are canonical skill names."""
+
+    def __init__(self, patterns, version=None):
+        """
+        Args:
+            patterns (dict): surface form -> canonical skill
+            version (str): Catalog version the patterns came from
+        """
+        self.version = version
+        self.goto = [{}]      # state -> {char: state}
+        self.fail = [0]
+        self.output = [()]    # state -> ((pattern length, canonical), ...) incl. via fail links
+        self.patterns = 0
+
+        for surface, canonical in patterns.items():
+            surface = _normalize_text(surface).strip()
+            if not surface:
+                continue
+            state = 0
+            for char in surface:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = nxt
+            self.output[state] = self.output[state] + ((len(surface), canonical),)
+            self.patterns += 1
+
+        # Breadth-first so a state's fail target is finished before the state itself
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and char not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(char, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def find(self, text):
+        """
+        Scan `text` once. Where matches overlap, only the longest is kept
+        ("node.js" is not also a "js" mention).
+
+        Returns:
+            dict: canonical skill -> {"count", "matched": set of surface forms}
+        """
+        text = _normalize_text(text)
+        goto, fail, output = self.goto, self.fail, self.output
+        n = len(text)
+        spans = []  # accepted (start, end, canonical), in order of end
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                # Word boundary after: no letter (a digit is a version suffix)
+                if i + 1 < n and text[i + 1].isalpha():
+                    continue
+                # Outputs run longest first; take the longest with a word boundary before it
+                for length, canonical in output[state]:
+                    start = i - length + 1
+                    if start == 0 or not text[start - 1].isalnum():
+                        while spans and spans[-1][0] >= start:
+                            spans.pop()  # contained in this longer match
+                        spans.append((start, i + 1, canonical))
+                        break
+
+        found = {}
+        for start, end, canonical in spans:
+            entry = found.get(canonical)
+            if entry is None:
+                entry = found[canonical] = {"count": 0, "matched": set()}
+            entry["count"] += 1
+            entry["matched"].add(text[start:end])
+        return found
+
+
+def _vocabulary(career_db, aliases):
+    patterns = {}
+    for career in career_db.values():
+        for skill in career.get("skills", []):
+            patterns.setdefault(skill.lower(), skill)
+    for skill, alias_list in aliases.items():
+        for alias in alias_list:
+            if alias not in AMBIGUOUS_ALIASES:
+                patterns.setdefault(alias.lower(), skill)
+    # Run-together spellings of multi-word names ("powerbi", "nodejs")
+    for surface, skill in list(patterns.items()):
+        compact = skill_key(surface)
+        if compact != surface and len(compact) >= 4:
+            patterns.setdefault(compact, skill)
+    return patterns
+
+
+_automaton = None
+_automaton_lock = threading.Lock()
+
+
+def get_skill_automaton():
+    """Shared automaton for the loaded catalog, built on first use."""
+    global _automaton
+    with _automaton_lock:
+        if _automaton is None or _automaton.version != CATALOG_VERSION:
+            _automaton = SkillAutomaton(_vocabulary(CAREER_DB, SKILL_ALIASES), CATALOG_VERSION)
+        return _automaton
+
+
+def extract_skills(text):
+    """
+    Catalog skills mentioned in free text.
+
+    Args:
+        text (str): Resume or profile text
+
+    Returns:
+        dict: Skills ordered by mention count, with the surface forms matched
+    """
+    start = time.perf_counter()
+    found = get_skill_automaton().find(text or "")
+    skills = sorted(found.items(), key=lambda item: (-item[1]["count"], item[0]))
+    elapsed = time.perf_counter() - start
+    return {
+        "status": "success",
+        "skills": [name for name, _ in skills],
+        "mentions": [
+            {"skill": name, "count": info["count"], "matched": sorted(info["matched"])}
+            for name, info in skills
+        ],
+        "characters": len(text or ""),
+        "elapsed_ms": round(elapsed * 1000, 3)
+    }
+
+
+_SAMPLE_RESUME = """Data analyst with 4 years of experience building Power-BI dashboards and
+automating reporting in Python3 and SQL (PostgreSQL, MySQL). Comfortable with
+statistics, A/B testing and data visualization in Tableau; strong communication
+with stakeholders. Side projects: a React front end on Node.js with REST APIs,
+deployed with Docker on AWS. Familiar with git, Linux and basic machine learning
+in PyTorch. Led a team of three analysts; mentoring and problem solving.
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract catalog skills from text, or benchmark extraction throughput')
+    parser.add_argument('file', nargs='?', help='Text file to extract skills from')
+    parser.add_argument('--bench', action='store_true', help='Measure throughput on a synthetic resume')
+    parser.add_argument('--size-kb', type=int, default=64, help='Benchmark text size')
+    parser.add_argument('--rounds', type=int, default=20, help='Benchmark repetitions')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    automaton = get_skill_automaton()
+    print(f"Automaton: {automaton.patterns} patterns, {len(automaton.goto)} states, "
+          f"built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if args.bench:
+        text = (_SAMPLE_RESUME * (args.size_kb * 1024 // len(_SAMPLE_RESUME) + 1))[:args.size_kb * 1024]
+        automaton.find(text)
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            found = automaton.find(text)
+        elapsed = (time.perf_counter() - start) / args.rounds
+        print(f"{len(text) / 1024:.0f} KB in {elapsed * 1000:.2f} ms: {len(text) / elapsed / 1e6:.2f} MB/s, "
+              f"{len(found)} distinct skills")
+        return
+
+    if not args.file:
+        parser.error('Give a text file or --bench')
+    with open(args.file, encoding='utf-8', errors='replace') as f:
+        result = extract_skills(f.read())
+    for mention in result["mentions"]:
+        print(f"  {mention['skill']} x{mention['count']} ({', '.join(mention['matched'])})")
+
+
+if __name__ == '__main__':
+    main()
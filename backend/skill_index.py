@@ -0,0 +1,304 @@
+"""
+Skill Index
+A careers x skills incidence matrix built once per catalog version, plus a
+salary table, so N-way comparisons (up to MAX_MATRIX_CAREERS careers) and
+whole-catalog fit ranking are a few vectorized operations instead of
+per-career set rebuilding.
+numpy and scipy are imported on first use (see backend/startup.py).
+"""
+import threading
+import time
+
+from .career_data import CAREER_DB, CATALOG_VERSION
+from .career_comparison import _resolve_careers
+from .skill_normalizer import normalize_skill
+
+# Careers one /compare/matrix request may include
+MAX_MATRIX_CAREERS = 50
+SIMILARITY_METRICS = ("jaccard", "cosine")
+SALARY_LEVELS = ("entry", "mid", "senior", "lead")
+# Page size cap for /career-fit/rank
+MAX_RANK_LIMIT = 100
+
+
+class SkillIndex:
+    """Row per career, column per distinct skill (case-insensitive)."""
+
+    def __init__(self, career_db, version=None):
+        import numpy as np
+        from scipy import sparse
+
+        self.version = version
+        self.careers = list(career_db)
+        self.row = {career: i for i, career in enumerate(self.careers)}
+        self.column = {}       # normalized skill -> column
+        self.skill_names = []  # column -> skill as first written in the catalog
+
+        rows, cols = [], []
+        for i, career in enumerate(self.careers):
+            seen = set()
+            for skill in career_db[career].get("skills", []):
+                key = skill.lower().strip()
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                j = self.column.get(key)
+                if j is None:
+                    j = self.column[key] = len(self.skill_names)
+                    self.skill_names.append(skill)
+                rows.append(i)
+                cols.append(j)
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(self.careers), len(self.skill_names))
+        )
+        self.sizes = np.diff(self.matrix.indptr)  # skills per career
+        self.postings = self.matrix.tocsc()       # column j lists the careers requiring skill j
+
+        # NaN where a career has no figure for a level (e.g. imported O*NET rows)
+        self.salary = np.full((len(self.careers), len(SALARY_LEVELS)), np.nan)
+        for i, career in enumerate(self.careers):
+            salary = career_db[career].get("salary") or {}
+            for j, level in enumerate(SALARY_LEVELS):
+                if isinstance(salary.get(level), (int, float)):
+                    self.salary[i, j] = salary[level]
+
+    def incidence(self, careers):
+        """
+        Dense 0/1 matrix for `careers` over just the skills they use.
+
+        Returns:
+            tuple: (k x m float32 array, list of the m skill names)
+        """
+        import numpy as np
+
+        sub = self.matrix[[self.row[c] for c in careers]]
+        cols = np.unique(sub.indices)
+        return sub[:, cols].toarray(), [self.skill_names[j] for j in cols]
+
+    def skill_vector(self, skills):
+        """
+        0/1 vector over the skill columns.
+
+        Returns:
+            tuple: (float32 array, list of skills not in the catalog)
+        """
+        import numpy as np
+
+        vector = np.zeros(len(self.skill_names), dtype=np.float32)
+        unknown = []
+        for skill in skills:
+            j = self.column.get(normalize_skill(skill).lower())
+            if j is None:
+                unknown.append(skill)
+            else:
+                vector[j] = 1.0
+        return vector, unknown
+
+    def career_skills(self, i):
+        """Column indices of career row `i`."""
+        return self.matrix.indices[self.matrix.indptr[i]:self.matrix.indptr[i + 1]]
+
+    def skill_postings(self, j):
+        """Row indices of the careers requiring skill column `j`."""
+        return self.postings.indices[self.postings.indptr[j]:self.postings.indptr[j + 1]]
+
+    def stats(self):
+        return {
+            "catalog_version": self.version,
+            "careers": len(self.careers),
+            "skills": len(self.skill_names),
+            "nonzeros": int(self.matrix.nnz)
+        }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_skill_index():
+    """Shared index for the loaded catalog, built on first use."""
+    global _index
+    with _index_lock:
+        if _index is None or _index.version != CATALOG_VERSION:
+            _index = SkillIndex(CAREER_DB, CATALOG_VERSION)
+        return _index
+
+
+def _matrix(values):
+    # JSON has no NaN; a missing salary gives a null delta
+    import numpy as np
+
+    out = np.round(values.astype(float), 4).astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+
+def compare_matrix(career_names: list, metric: str = "jaccard") -> dict:
+    """
+    N-way comparison of up to MAX_MATRIX_CAREERS careers.
+
+    Args:
+        career_names (list): Career names as typed by the user
+        metric (str): "jaccard" or "cosine" skill similarity
+
+    Returns:
+        dict: Pairwise similarity matrix, shared and unique skills, salary
+        table and pairwise salary deltas (row minus column) per level
+    """
+    import numpy as np
+
+    if metric not in SIMILARITY_METRICS:
+        return {
+            "status": "error",
+            "message": f"Unknown metric '{metric}'. Available: {', '.join(SIMILARITY_METRICS)}"
+        }
+    if career_names and len(career_names) > MAX_MATRIX_CAREERS:
+        return {
+            "status": "error",
+            "message": f"At most {MAX_MATRIX_CAREERS} careers can be compared at once"
+        }
+
+    timings = {}
+    start = time.perf_counter()
+    careers, error = _resolve_careers(career_names, limit=MAX_MATRIX_CAREERS)
+    timings["resolve"] = round((time.perf_counter() - start) * 1000, 3)
+    if error:
+        return error
+
+    start = time.perf_counter()
+    index = get_skill_index()
+    A, skills = index.incidence(careers)
+    k = len(careers)
+    sizes = A.sum(axis=1)
+    overlap = A @ A.T  # shared skill counts for every pair
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if metric == "jaccard":
+            similarity = overlap / (sizes[:, None] + sizes[None, :] - overlap)
+        else:
+            similarity = overlap / np.sqrt(np.outer(sizes, sizes))
+    similarity = np.nan_to_num(similarity)
+
+    # Careers requiring each skill; 1 = unique to its career, k = common to all
+    holders = A.sum(axis=0)
+    skill_array = np.array(skills, dtype=object)
+    per_career = [
+        {
+            "name": career.title(),
+            "skill_count": int(sizes[i]),
+            "unique_skills": skill_array[(A[i] > 0) & (holders == 1)].tolist(),
+            "shared_skills": skill_array[(A[i] > 0) & (holders > 1)].tolist()
+        }
+        for i, career in enumerate(careers)
+    ]
+    timings["skills"] = round((time.perf_counter() - start) * 1000, 3)
+
+    start = time.perf_counter()
+    salary = index.salary[[index.row[c] for c in careers]]
+    deltas = salary[:, None, :] - salary[None, :, :]  # k x k x levels
+    salary_view = {
+        "levels": list(SALARY_LEVELS),
+        "values": _matrix(salary),
+        "deltas": {level: _matrix(deltas[:, :, j]) for j, level in enumerate(SALARY_LEVELS)}
+    }
+    timings["salary"] = round((time.perf_counter() - start) * 1000, 3)
+
+    return {
+        "status": "success",
+        "careers": [career.title() for career in careers],
+        "metric": metric,
+        "similarity": _matrix(similarity),
+        "common_to_all": skill_array[holders == k].tolist() if k > 1 else [],
+        "per_career": per_career,
+        "salary": salary_view,
+        "timings_ms": timings
+    }
+
+
+def fit_page(index, rows, matching, user_columns, limit, offset):
+    """
+    One page of careers ranked by fit.
+
+    Args:
+        index (SkillIndex): Index the rows refer to
+        rows (ndarray): Candidate career rows
+        matching (ndarray): User skills each candidate requires
+        user_columns (set): Skill columns the user has
+        limit (int): Page size
+        offset (int): Rows to skip
+
+    Returns:
+        list: Career dicts, best fit first
+    """
+    import numpy as np
+
+    rows = np.asarray(rows, dtype=np.int64)
+    matching = np.asarray(matching, dtype=np.int64)
+    sizes = index.sizes[rows]
+    fit = np.where(sizes > 0, matching * 100 // np.maximum(sizes, 1), 0)
+
+    # Fit, then matching count, then catalog order: a unique key keeps pages stable
+    key = (fit << 40) + (matching << 20) - rows
+    end = min(offset + limit, len(rows))
+    if offset >= end:
+        return []
+    top = np.argpartition(-key, end - 1)[:end]
+    page = top[np.argsort(-key[top])][offset:end]
+
+    careers = []
+    for p in page.tolist():
+        i = int(rows[p])
+        columns = index.career_skills(i).tolist()
+        careers.append({
+            "name": index.careers[i].title(),
+            "fit_score": int(fit[p]),
+            "matching_count": int(matching[p]),
+            "missing_count": int(sizes[p] - matching[p]),
+            "matching_skills": [index.skill_names[j] for j in columns if j in user_columns],
+            "missing_skills": [index.skill_names[j] for j in columns if j not in user_columns]
+        })
+    return careers
+
+
+def rank_career_fit(user_skills: list, limit: int = 20, offset: int = 0) -> dict:
+    """
+    Rank every career by the share of its skill list the user already has.
+
+    Fit is scored the same way as `get_career_fit_score`, for the whole
+    catalog at once: one sparse matrix-vector product gives the matching
+    counts, and only the requested page is sorted.
+
+    Args:
+        user_skills (list): The user's skills
+        limit (int): Page size (at most MAX_RANK_LIMIT)
+        offset (int): Rows to skip
+
+    Returns:
+        dict: Careers with at least one matching skill, best fit first
+    """
+    import numpy as np
+
+    if not 1 <= limit <= MAX_RANK_LIMIT or offset < 0:
+        return {
+            "status": "error",
+            "message": f"limit must be between 1 and {MAX_RANK_LIMIT} and offset must not be negative"
+        }
+
+    start = time.perf_counter()
+    index = get_skill_index()
+    vector, unknown = index.skill_vector(user_skills or [])
+    matching = (index.matrix @ vector).astype(np.int64)
+
+    candidates = np.flatnonzero(matching > 0)
+    careers = fit_page(index, candidates, matching[candidates], set(np.flatnonzero(vector).tolist()), limit, offset)
+
+    return {
+        "status": "success",
+        "total": int(len(candidates)),
+        "offset": offset,
+        "limit": limit,
+        "careers": careers,
+        "user_skills": user_skills or [],
+        "unrecognized_skills": unknown,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)
+    }
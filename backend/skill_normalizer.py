@@ -0,0 +1,179 @@
+"""
+Skill Normalizer
+Maps what users type ("python3", "Pyhton", "PowerBI", "js") to the skill
+names used in the catalog, so skill comparisons are not defeated by
+spelling. Resolution order: exact name, alias, version/plural variant, then
+typo correction (names of 5 or more characters, within edit distance 1,
+or 2 from 8 characters) using a SymSpell-style dictionary of
+precomputed deletes, which finds candidates with a few dictionary lookups
+instead of comparing against every skill.
+"""
+import re
+import threading
+
+from .career_data import CAREER_DB, CATALOG_VERSION, SKILL_ALIASES
+
+_KEY_RE = re.compile(r"[\s\-_./]+")
+_MEMO_SIZE = 10000
+
+
+def skill_key(text):
+    """Case, spacing and punctuation-insensitive form ("Node.js" -> "nodejs")."""
+    return _KEY_RE.sub("", text.lower().strip())
+
+
+def _max_distance(key):
+    # Short names are too close to other real words to correct safely ("rust" is
+    # one edit from the "rest" alias, "hash" from "bash")
+    if len(key) < 5:
+        return 0
+    return 1 if len(key) < 8 else 2
+
+
+def _deletes(key, distance):
+    """Every string obtained by removing up to `distance` characters."""
+    result = {key}
+    frontier = {key}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+def _edit_distance(a, b, limit):
+    # Damerau-Levenshtein (optimal string alignment); stops early above `limit`
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class SkillNormalizer:
+    """Name, alias and delete-neighbourhood dictionaries over the catalog's skills."""
+
+    def __init__(self, career_db, aliases=None, version=None):
+        self.version = version
+        self.names = {}    # key -> canonical skill (catalog names and aliases)
+        for career in career_db.values():
+            for skill in career.get("skills", []):
+                self.names.setdefault(skill_key(skill), skill)
+        self.canonical_keys = set(self.names)
+        for skill, alias_list in (aliases or {}).items():
+            for alias in [skill] + list(alias_list):
+                self.names.setdefault(skill_key(alias), skill)
+
+        # delete -> keys it can be derived from; a typo shares a delete with its key.
+        # Short names and aliases are never correction targets, only exact matches.
+        self.deletes = {}
+        for key in self.names:
+            if not _max_distance(key):
+                continue
+            for delete in _deletes(key, _max_distance(key)):
+                self.deletes.setdefault(delete, set()).add(key)
+
+        self._memo = {}
+        self._lock = threading.Lock()
+        self._stats = {"exact": 0, "alias": 0, "variant": 0, "typo": 0, "unknown": 0}
+
+    def _lookup(self, key):
+        if key in self.names:
+            return self.names[key], "exact" if key in self.canonical_keys else "alias"
+
+        # "python3", "html5", "wireframes"
+        for variant in (key.rstrip("0123456789"), key[:-1] if key.endswith("s") else key):
+            if variant != key and variant in self.names:
+                return self.names[variant], "variant"
+
+        distance = _max_distance(key)
+        if distance:
+            best = None
+            candidates = set()
+            for delete in _deletes(key, distance):
+                candidates |= self.deletes.get(delete, set())
+            for candidate in candidates:
+                d = _edit_distance(key, candidate, distance)
+                # Closest wins; ties go to a catalog name, then alphabetically for stable results
+                rank = (d, candidate not in self.canonical_keys, candidate)
+                if d <= distance and (best is None or rank < best):
+                    best = rank
+            if best is not None:
+                return self.names[best[2]], "typo"
+        return None, "unknown"
+
+    def resolve(self, skill):
+        """
+        Catalog name for a user-typed skill.
+
+        Returns:
+            tuple: (canonical skill or None, "exact" | "alias" | "variant" | "typo" | "unknown")
+        """
+        key = skill_key(skill)
+        with self._lock:
+            cached = self._memo.get(key)
+        if cached is None:
+            cached = self._lookup(key) if key else (None, "unknown")
+            with self._lock:
+                if len(self._memo) >= _MEMO_SIZE:
+                    self._memo.clear()
+                self._memo[key] = cached
+        with self._lock:
+            self._stats[cached[1]] += 1
+        return cached
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(
+            catalog_version=self.version,
+            names=len(self.names),
+            deletes=len(self.deletes)
+        )
+        return stats
+
+
+_normalizer = None
+_normalizer_lock = threading.Lock()
+
+
+def get_skill_normalizer():
+    """Shared normalizer for the loaded catalog, built on first use."""
+    global _normalizer
+    with _normalizer_lock:
+        if _normalizer is None or _normalizer.version != CATALOG_VERSION:
+            _normalizer = SkillNormalizer(CAREER_DB, SKILL_ALIASES, CATALOG_VERSION)
+        return _normalizer
+
+
+def normalize_skill(skill):
+    """Catalog name for `skill`, or the stripped input when it cannot be resolved."""
+    canonical, _ = get_skill_normalizer().resolve(skill)
+    return canonical if canonical is not None else skill.strip()
+
+
+def normalize_skills(skills):
+    """Normalize a list of skills, dropping blanks and duplicates (first occurrence kept)."""
+    result = []
+    seen = set()
+    for skill in skills or []:
+        if not isinstance(skill, str) or not skill.strip():
+            continue
+        name = normalize_skill(skill)
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            result.append(name)
+    return result
+
+
+def get_normalizer_stats():
+    """Return how user skills were resolved since startup."""
+    return get_skill_normalizer().stats()
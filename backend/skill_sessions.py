@@ -0,0 +1,235 @@
+"""
+Skill Scoring Sessions
+Keeps a user's skill set and their per-career matching counts on the
+server, so toggling one skill applies that skill's postings (the careers
+requiring it) instead of rescoring the whole catalog. Each update returns
+the refreshed fit ranking and, if a target career is set, its skill gap.
+Scores are the exact skill-list fit used by /career-fit and /skill-gap.
+
+Only the count update is proportional to the toggled skill's postings.
+Ranking the returned page still looks at every career with a match
+(fit_page partitions, it does not sort all of them). The SQLite store saves
+the counts with the skills, so loading a session in another worker also
+costs time proportional to the matched careers; the skills' postings are
+replayed only after a catalog change.
+"""
+import os
+from pathlib import Path
+
+from .career_data import CAREER_DB, CATALOG_VERSION
+from .fuzzy_matcher import find_best_career_match
+from .session_store import MemorySessionStore, SQLiteSessionStore, SessionConflict, SessionNotFound, new_session_id
+from .skill_cooccurrence import suggest_next_skills
+from .skill_index import MAX_RANK_LIMIT, fit_page, get_skill_index
+from .skill_normalizer import normalize_skill
+
+
+class SkillSession:
+    """A user's current skills and matching count per career (only careers with a match)."""
+
+    __slots__ = ('session_id', 'skills', 'target', 'unrecognized', 'version', '_columns', '_counts')
+
+    def __init__(self, target: str = None, session_id: str = None):
+        self.session_id = session_id or new_session_id()
+        self.target = target
+        self.skills = {}         # normalized skill -> skill as the user typed it
+        self.unrecognized = []   # skills not in the catalog (they cannot change any score)
+        self.version = CATALOG_VERSION
+        self._columns = set()
+        self._counts = {}        # career row -> user skills it requires
+
+    def to_dict(self) -> dict:
+        # Counts are stored so a load does not replay every skill's postings
+        return {
+            "session_id": self.session_id,
+            "target": self.target,
+            "skills": list(self.skills.values()),
+            "skill_keys": list(self.skills),
+            "unrecognized": list(self.unrecognized),
+            "version": self.version,
+            "columns": sorted(self._columns),
+            "rows": list(self._counts),
+            "counts": list(self._counts.values())
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SkillSession":
+        session = cls(data.get("target"), session_id=data["session_id"])
+        if data.get("version") != session.version or "counts" not in data:
+            # Saved for another catalog version: rebuild the counts from the skills
+            session.apply(add=data.get("skills", []))
+            return session
+        session.skills = dict(zip(data["skill_keys"], data["skills"]))
+        session.unrecognized = list(data["unrecognized"])
+        session._columns = set(data["columns"])
+        session._counts = dict(zip(data["rows"], data["counts"]))
+        return session
+
+    def _toggle(self, index, skill, delta):
+        # "python3" and "Python" are the same skill, so either one can remove the other
+        key = normalize_skill(skill).lower()
+        column = index.column.get(key)
+        if column is None:
+            if delta > 0 and key and key not in self.skills:
+                self.skills[key] = skill
+                self.unrecognized.append(skill)
+            elif delta < 0 and key in self.skills:
+                self.unrecognized = [s for s in self.unrecognized if s.lower().strip() != key]
+                del self.skills[key]
+            return
+        if (delta > 0) == (column in self._columns):
+            return  # already added / already removed
+        if delta > 0:
+            self.skills[key] = skill
+            self._columns.add(column)
+        else:
+            del self.skills[key]
+            self._columns.discard(column)
+        # Work is proportional to the careers requiring this skill, not the catalog size
+        counts = self._counts
+        for row in index.skill_postings(column).tolist():
+            n = counts.get(row, 0) + delta
+            if n:
+                counts[row] = n
+            else:
+                del counts[row]
+
+    def apply(self, add=(), remove=()):
+        """Add and remove skills, updating the matching counts by their postings."""
+        index = get_skill_index()
+        if index.version != self.version:
+            # The catalog changed since the counts were built; replay the skills on the new index
+            skills = list(self.skills.values())
+            self.skills, self.unrecognized, self._columns, self._counts = {}, [], set(), {}
+            self.version = index.version
+            for skill in skills:
+                self._toggle(index, skill, 1)
+        for skill in remove:
+            self._toggle(index, skill, -1)
+        for skill in add:
+            self._toggle(index, skill, 1)
+
+    def results(self, limit: int = 10, offset: int = 0) -> dict:
+        """Current fit ranking and target skill gap."""
+        index = get_skill_index()
+        rows = list(self._counts)
+        result = {
+            "status": "success",
+            "session_id": self.session_id,
+            "skills": list(self.skills.values()),
+            "unrecognized_skills": list(self.unrecognized),
+            "total": len(rows),
+            "offset": offset,
+            "limit": limit,
+            "careers": fit_page(index, rows, [self._counts[r] for r in rows], self._columns, limit, offset)
+        }
+        if self.target in index.row:
+            result["skill_gap"] = self._skill_gap(index)
+        return result
+
+    def _skill_gap(self, index) -> dict:
+        # Same fields as /skill-gap
+        columns = index.career_skills(index.row[self.target]).tolist()
+        matching = [index.skill_names[j] for j in columns if j in self._columns]
+        missing = [index.skill_names[j] for j in columns if j not in self._columns]
+        return {
+            "career": self.target.title(),
+            "current_skills": len(matching),
+            "total_skills": len(columns),
+            "matching_skills": matching,
+            "missing_skills": missing,
+            "skill_match_percentage": round(len(matching) / len(columns) * 100, 2) if columns else 0,
+            "next_skills": suggest_next_skills(list(self.skills.values()), missing)
+        }
+
+
+def _session_store_from_env():
+    ttl = int(os.getenv('SKILL_SESSION_TTL', '1800'))
+    max_sessions = int(os.getenv('SKILL_SESSION_MAX_SESSIONS', '10000'))
+    if os.getenv('SKILL_SESSION_STORE', 'memory') == 'sqlite':
+        # Shared by all workers on the host; counts are stored with the skills
+        path = os.getenv('SKILL_SESSION_PATH', str(Path(__file__).parent / 'skill_sessions.sqlite3'))
+        return SQLiteSessionStore(SkillSession, path, ttl_seconds=ttl, max_sessions=max_sessions)
+    return MemorySessionStore(ttl_seconds=ttl, max_sessions=max_sessions)
+
+
+# Live skill scoring sessions (SKILL_SESSION_STORE=memory|sqlite)
+session_store = _session_store_from_env()
+
+
+def _check_page(limit, offset):
+    if not 1 <= limit <= MAX_RANK_LIMIT or offset < 0:
+        return {
+            "status": "error",
+            "message": f"limit must be between 1 and {MAX_RANK_LIMIT} and offset must not be negative"
+        }
+    return None
+
+
+def start_skill_session(skills: list = None, target: str = None, limit: int = 10, offset: int = 0) -> dict:
+    """
+    Start a scoring session.
+
+    Args:
+        skills (list): Initial skills
+        target (str): Optional career to report the skill gap for
+        limit (int): Page size of the fit ranking
+        offset (int): Rows to skip
+
+    Returns:
+        dict: Session ID, fit ranking and target skill gap
+    """
+    error = _check_page(limit, offset)
+    if error:
+        return error
+    target_key = None
+    if target:
+        target_key, _ = find_best_career_match(target)
+        if not target_key or target_key not in CAREER_DB:
+            return {"status": "error", "message": f"Career '{target}' not found"}
+
+    session = SkillSession(target_key)
+    session.apply(add=skills or [])
+    session_store.put(session)
+    return session.results(limit, offset)
+
+
+def update_skill_session(session_id: str, add: list = None, remove: list = None,
+                         limit: int = 10, offset: int = 0) -> dict:
+    """Toggle skills in a session and return the updated ranking"""
+    error = _check_page(limit, offset)
+    if error:
+        return error
+
+    def toggle(session):
+        session.apply(add=add or [], remove=remove or [])
+        return session.results(limit, offset)
+
+    try:
+        return session_store.update(session_id, toggle)
+    except SessionNotFound:
+        return {
+            "status": "not_found",
+            "message": "Skill session not found or expired. Start a new session."
+        }
+    except SessionConflict as e:
+        return {"status": "conflict", "message": str(e)}
+
+
+def get_skill_session(session_id: str, limit: int = 10, offset: int = 0) -> dict:
+    """Current ranking of a session"""
+    error = _check_page(limit, offset)
+    if error:
+        return error
+    session = session_store.get(session_id)
+    if session is None:
+        return {
+            "status": "not_found",
+            "message": "Skill session not found or expired. Start a new session."
+        }
+    return session.results(limit, offset)
+
+
+def get_skill_session_stats() -> dict:
+    """Return skill session store counters."""
+    return session_store.stats()
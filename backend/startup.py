@@ -0,0 +1,144 @@
+"""
+Startup Budget
+Heavy third-party modules are imported on first use so a fresh worker can
+serve cheap endpoints straight away. Under gunicorn's preload mode the
+master calls `preload()` once and every forked worker inherits the warm
+modules instead of paying for them on its first request.
+
+Measure the per-module import cost with:
+    python -m backend.startup
+"""
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Target for `import backend.app` in a fresh interpreter
+STARTUP_BUDGET_MS = float(os.getenv('STARTUP_BUDGET_MS', '500'))
+
+# Deferred by the app; (module, needed only when this env var is set)
+HEAVY_MODULES = (
+    ("numpy", None),
+    ("scipy.sparse", None),
+    ("sklearn.feature_extraction.text", None),
+    ("sklearn.metrics.pairwise", None),
+    ("fuzzywuzzy.process", None),
+    ("openai", "OPENAI_API_KEY"),
+    ("google.generativeai", "GEMINI_API_KEY"),
+)
+
+_preload_report = {"preloaded": False, "modules": {}, "total_ms": 0.0}
+
+
+def _wanted_modules():
+    return [name for name, env in HEAVY_MODULES if env is None or os.getenv(env)]
+
+
+def preload():
+    """
+    Import the deferred modules and load the career match indexes in this process.
+
+    Only modules and read-only data are loaded: SDK clients, thread pools and
+    SQLite connections are still created lazily after the fork.
+
+    Returns:
+        dict: Per-module import time in milliseconds
+    """
+    start = time.perf_counter()
+    modules = {}
+    for name in _wanted_modules():
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            modules[name] = {"error": str(e)}
+            continue
+        modules[name] = {"import_ms": round((time.perf_counter() - t0) * 1000, 1)}
+
+    from .fuzzy_matcher import _load_alias_index, _try_load_index
+    t0 = time.perf_counter()
+    _load_alias_index()
+    _try_load_index()
+    modules["career match indexes"] = {"import_ms": round((time.perf_counter() - t0) * 1000, 1)}
+
+    _preload_report.update(
+        preloaded=True,
+        modules=modules,
+        total_ms=round((time.perf_counter() - start) * 1000, 1)
+    )
+    return modules
+
+
+def get_startup_report():
+    """Return what `preload()` loaded and which heavy modules are already imported."""
+    return {
+        "budget_ms": STARTUP_BUDGET_MS,
+        "preloaded": _preload_report["preloaded"],
+        "preload_ms": _preload_report["total_ms"],
+        "modules": _preload_report["modules"],
+        "loaded": {name: name in sys.modules for name, _ in HEAVY_MODULES}
+    }
+
+
+_MEASURE_SCRIPT = """
+import importlib, json, sys, time
+costs = {}
+for name in sys.argv[1:]:
+    t0 = time.perf_counter()
+    try:
+        importlib.import_module(name)
+        costs[name] = round((time.perf_counter() - t0) * 1000, 1)
+    except Exception as e:
+        costs[name] = repr(e)
+print(json.dumps(costs))
+"""
+
+
+def measure_import_costs(modules, isolated=False):
+    """
+    Time imports in fresh interpreters.
+
+    Args:
+        modules (list): Module names, imported in order
+        isolated (bool): One interpreter per module (standalone cost) instead of
+            one shared interpreter (incremental cost after the modules before it)
+
+    Returns:
+        dict: Module name -> milliseconds (or the import error)
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    batches = [[m] for m in modules] if isolated else [list(modules)]
+    costs = {}
+    for batch in batches:
+        out = subprocess.run([sys.executable, "-c", _MEASURE_SCRIPT, *batch],
+                             cwd=root, capture_output=True, text=True, check=True)
+        costs.update(json.loads(out.stdout.strip().splitlines()[-1]))
+    return costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure import-time cost of the app and its heavy dependencies')
+    parser.add_argument('--isolated', action='store_true',
+                        help='Time every module in its own interpreter instead of incrementally')
+    args = parser.parse_args()
+
+    app_ms = measure_import_costs(["backend.app"])["backend.app"]
+    print(f"import backend.app: {app_ms} ms (budget {STARTUP_BUDGET_MS:.0f} ms)")
+
+    print("\nDeferred modules (" + ("standalone" if args.isolated else "incremental, after backend.app") + "):")
+    names = ["backend.app"] + _wanted_modules()
+    costs = measure_import_costs(names, isolated=args.isolated)
+    for name in names[1:]:
+        cost = costs.get(name)
+        print(f"  {name:<36} {cost} ms" if isinstance(cost, float) else f"  {name:<36} {cost}")
+
+    if isinstance(app_ms, float) and app_ms > STARTUP_BUDGET_MS:
+        print(f"\nOver budget by {app_ms - STARTUP_BUDGET_MS:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
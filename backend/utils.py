@@ -0,0 +1,42 @@
+import hashlib
+import json
+import re
+
+_NON_TITLE_CHARS = re.compile(r"[^a-z0-9+#]+")
+
+
+def normalize_text(text):
+    """
+    Normalize a career title or alias for exact-match lookups.
+
+    Lowercases, drops punctuation (keeping "+" and "#" for titles like
+    "C++ Developer") and collapses whitespace, so "Sr. BI-Developer" and
+    "sr bi developer" produce the same key.
+
+    Args:
+        text: Raw title string
+
+    Returns:
+        str: Normalized title
+    """
+    if not text:
+        return ""
+    return " ".join(_NON_TITLE_CHARS.sub(" ", str(text).lower()).split())
+
+
+def index_fingerprint(vocabulary, titles):
+    """
+    Identify a TF-IDF index by its vocabulary and row titles.
+
+    Derived artifacts (the LSA projection) store it so a file left over
+    from an earlier import is never applied to a different index.
+
+    Args:
+        vocabulary: The vectorizer's term -> column mapping
+        titles: Career key of each matrix row
+
+    Returns:
+        str: Hex digest
+    """
+    material = json.dumps([sorted((term, int(col)) for term, col in vocabulary.items()), list(titles)])
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()[:16]
@@ -48,18 +48,25 @@ document.getElementById('careerForm').addEventListener('submit', async function(
     const resultDiv = document.getElementById('careerResult');
 
     resultDiv.innerHTML = '<p class="loading">⏳ Analyzing career path...</p>';
+    const search = stopAiGuidance();
 
     try {
         const response = await fetch('http://127.0.0.1:5000/career', {
             method: 'POST',
             headers: {'Content-Type': 'application/json'},
-            body: JSON.stringify({ career: career, level: level })
+            body: JSON.stringify({ career: career, level: level, stream: !!window.EventSource })
         });
 
         if (response.ok) {
             const data = await response.json();
+            if (search !== aiGuidanceSearch) return;  // a newer search is showing
             if (data.status === 'success') {
                 displayCareerGuidance(data);
+                if (data.ai_guidance_stream_url) {
+                    streamAiGuidance(data.ai_guidance_stream_url);
+                } else if (data.ai_guidance_job_id) {
+                    pollAiGuidance(data.ai_guidance_url, search);
+                }
             } else if (data.status === 'unknown') {
                 displayUnknownCareer(data);
             }
@@ -72,6 +79,71 @@ document.getElementById('careerForm').addEventListener('submit', async function(
     }
 });
 
+// Bumped on every search so polls and streams of earlier searches stop
+let aiGuidanceSearch = 0;
+let aiGuidanceSource = null;
+
+function stopAiGuidance() {
+    aiGuidanceSearch++;
+    if (aiGuidanceSource) {
+        aiGuidanceSource.close();
+        aiGuidanceSource = null;
+    }
+    return aiGuidanceSearch;
+}
+
+function removeAiGuidanceSection() {
+    const section = document.getElementById('aiGuidanceSection');
+    if (section) section.remove();
+}
+
+// Poll the background AI guidance job queued by /career
+async function pollAiGuidance(url, search, attempt = 0) {
+    if (search !== aiGuidanceSearch) return;  // user started a new search
+
+    try {
+        const response = await fetch(`http://127.0.0.1:5000${url}`);
+        const data = await response.json();
+        const contentDiv = document.getElementById('aiGuidanceContent');
+        if (search !== aiGuidanceSearch || !contentDiv) return;
+
+        if (data.status === 'success') {
+            contentDiv.innerHTML = data.ai_personalized_guidance.replace(/\n/g, '<br>');
+        } else if (data.status === 'pending' && attempt < 40) {
+            setTimeout(() => pollAiGuidance(url, search, attempt + 1), 1500);
+        } else {
+            removeAiGuidanceSection();
+        }
+    } catch (error) {
+        console.error('Error fetching AI guidance:', error);
+        if (search === aiGuidanceSearch) removeAiGuidanceSection();
+    }
+}
+
+// Render AI guidance as it streams in over Server-Sent Events
+function streamAiGuidance(url) {
+    const contentDiv = document.getElementById('aiGuidanceContent');
+    const source = new EventSource(`http://127.0.0.1:5000${url}`);
+    aiGuidanceSource = source;
+    let text = '';
+
+    source.addEventListener('token', event => {
+        if (source !== aiGuidanceSource) return;
+        text += JSON.parse(event.data).text;
+        contentDiv.innerHTML = text.replace(/\n/g, '<br>');
+    });
+    source.addEventListener('done', () => source.close());
+    source.addEventListener('failure', () => {
+        source.close();
+        if (!text && source === aiGuidanceSource) removeAiGuidanceSection();
+    });
+    // Connection errors: EventSource would otherwise reconnect and regenerate
+    source.onerror = () => {
+        source.close();
+        if (!text && source === aiGuidanceSource) removeAiGuidanceSection();
+    };
+}
+
 // ========== TAB 2: Recommend by Skills ==========
 document.getElementById('skillForm').addEventListener('submit', async function(event) {
     event.preventDefault();
@@ -300,6 +372,13 @@ function displayCareerGuidance(data) {
                 </div>
             ` : ''}
 
+            ${data.ai_guidance_job_id || data.ai_guidance_stream_url ? `
+                <div class="ai-section" id="aiGuidanceSection">
+                    <strong>🤖 AI-Powered Personalized Guidance:</strong>
+                    <div class="ai-content" id="aiGuidanceContent"><p class="loading">⏳ Generating personalized guidance...</p></div>
+                </div>
+            ` : ''}
+
             ${data.similar_careers && data.similar_careers.length > 0 ? `
                 <div class="similar-careers-section">
                     <strong>🔗 Similar Careers You Might Like:</strong>
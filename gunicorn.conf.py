@@ -0,0 +1,13 @@
+# Picked up automatically by `gunicorn app:app` (Procfile / render.yaml)
+import os
+
+# Import the app once in the master and fork warm workers from it
+preload_app = os.getenv('GUNICORN_PRELOAD', 'False') == 'True'
+
+
+def on_starting(server):
+    if preload_app:
+        from backend.startup import preload
+        modules = preload()
+        server.log.info("Preloaded %s", ", ".join(f"{name} ({info.get('import_ms', 'failed')} ms)"
+                                                  for name, info in modules.items()))
@@ -0,0 +1,52 @@
+import pytest
+
+from backend import career_comparison
+from backend.app import app
+from backend.career_comparison import (
+    compare_full, get_career_fit_score, get_growth_comparison, get_salary_comparison, get_skill_comparison
+)
+
+CAREERS = ["Data Analyst", "web developer"]
+
+
+def test_full_comparison_matches_the_single_view_endpoints():
+    skills = ["SQL", "python"]
+    full = compare_full(CAREERS, user_skills=skills)
+    assert full["careers"] == ["Data Analyst", "Web Developer"]
+    assert list(full["views"]) == ["salary", "skills", "growth", "fit"]
+    assert full["views"]["salary"] == get_salary_comparison(CAREERS)["careers"]
+    assert full["views"]["skills"] == get_skill_comparison(CAREERS)["careers"]
+    assert full["views"]["growth"] == get_growth_comparison(CAREERS)["careers"]
+    assert full["views"]["fit"] == get_career_fit_score(CAREERS, skills)["careers"]
+    assert set(full["timings_ms"]) == {"resolve", "salary", "skills", "growth", "fit"}
+
+
+def test_careers_are_resolved_once(monkeypatch):
+    calls = []
+    resolve = career_comparison._resolve_careers
+    monkeypatch.setattr(career_comparison, "_resolve_careers", lambda names: calls.append(names) or resolve(names))
+    compare_full(CAREERS)
+    assert len(calls) == 1
+
+
+def test_selected_views_keep_response_order():
+    result = compare_full(CAREERS, views=["fit", "salary"])
+    assert list(result["views"]) == ["salary", "fit"]
+
+
+@pytest.mark.parametrize("careers, views", [
+    (CAREERS, ["salary", "weather"]),
+    (["data analyst", "Data Analyst"], None),
+    (["data analyst", "underwater basket weaver"], None),
+])
+def test_invalid_comparisons_are_errors(careers, views):
+    assert compare_full(careers, views)["status"] == "error"
+
+
+def test_endpoint_reads_views_from_the_query_string():
+    client = app.test_client()
+    response = client.post("/compare/full?views=growth,%20Salary", json={"careers": CAREERS})
+    assert response.status_code == 200
+    assert set(response.json["views"]) == {"salary", "growth"}
+    assert client.post("/compare/full", json={"careers": CAREERS, "views": ["nope"]}).status_code == 400
+    assert client.post("/compare/full", json={"careers": ["data analyst"]}).status_code == 400
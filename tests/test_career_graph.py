@@ -0,0 +1,51 @@
+from backend.career_graph import CareerGraph
+from backend.skill_index import SkillIndex
+
+CATALOG = {
+    "analyst": {"skills": ["SQL", "Excel", "Statistics"]},
+    "data scientist": {"skills": ["SQL", "Statistics", "Python", "Machine Learning"]},
+    "ml engineer": {"skills": ["Python", "Machine Learning", "Docker", "Kubernetes"]},
+    "chef": {"skills": ["Cooking", "Menu Planning"]},
+    "baker": {"skills": ["Cooking", "Baking"]},
+}
+
+
+def _graph():
+    return CareerGraph(SkillIndex(CATALOG, "test"), k=2, hop_cost=0.5)
+
+
+def _hand_built(n, edges):
+    # Graph with given step costs and no heuristic guidance (no skills)
+    graph = CareerGraph.__new__(CareerGraph)
+    graph.skills = [frozenset()] * n
+    graph.adjacency = [[] for _ in range(n)]
+    for i, j, cost in edges:
+        graph.adjacency[i].append((j, cost, 1.0))
+    graph.component = [0] * n
+    return graph
+
+
+def test_path_goes_through_the_intermediate_career():
+    graph = _graph()
+    row = graph.index.row
+    cost, path = graph.shortest_path(row["analyst"], row["ml engineer"])
+    assert path == [row["analyst"], row["data scientist"], row["ml engineer"]]
+    # Python + Machine Learning, then Docker + Kubernetes, plus two hop costs
+    assert cost == 5.0
+
+
+def test_unrelated_careers_are_in_different_components():
+    graph = _graph()
+    row = graph.index.row
+    assert graph.components == 2
+    assert graph.connected(row["chef"], row["baker"])
+    assert not graph.connected(row["analyst"], row["chef"])
+    assert graph.shortest_path(row["analyst"], row["chef"]) == (None, None)
+
+
+def test_hop_limit_keeps_a_dearer_route_with_fewer_steps():
+    # 0 -> 1 -> 2 -> 3 is cheapest, but only 0 -> 2 -> 3 fits in two steps
+    graph = _hand_built(4, [(0, 1, 1.0), (1, 2, 1.0), (0, 2, 5.0), (2, 3, 1.0)])
+    assert graph.shortest_path(0, 3, max_hops=3) == (3.0, [0, 1, 2, 3])
+    assert graph.shortest_path(0, 3, max_hops=2) == (6.0, [0, 2, 3])
+    assert graph.shortest_path(0, 3, max_hops=1) == (None, None)
@@ -0,0 +1,30 @@
+import pytest
+
+from backend import career_ai
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    jobs = []
+    monkeypatch.setattr(career_ai, "get_ready_guidance", lambda career, level: None)
+    monkeypatch.setattr(career_ai, "submit_guidance_job", lambda career, level: jobs.append(career) or "job-1")
+    monkeypatch.setattr(career_ai, "prefetch_guidance", lambda careers, level: None)
+    return jobs
+
+
+@pytest.mark.parametrize("typed", ["BI developer", "SRE", "data analist"])
+def test_aliases_and_typos_get_ai_guidance(queued, typed):
+    result = career_ai.career_guidance(typed)
+    assert result["status"] == "success"
+    assert result["ai_guidance_url"] == "/career/guidance/job-1"
+    assert len(queued) == 1
+
+
+def test_alias_hit_reports_full_confidence(queued):
+    assert career_ai.career_guidance("SRE")["match_confidence"] == 100
+
+
+def test_typed_catalog_title_skips_ai_guidance(queued):
+    result = career_ai.career_guidance("Data Analyst")
+    assert "ai_guidance_url" not in result
+    assert queued == []
@@ -0,0 +1,72 @@
+import pytest
+
+from backend.app import app
+from backend.career_index import CareerColumns, parse_growth_percent, query_careers
+
+CATALOG = {
+    "a": {"salary": {"entry": 50000, "mid": 70000}, "job_outlook": "10% growth"},
+    "b": {"salary": {"entry": 60000, "mid": 90000}, "job_outlook": "Growing fast"},
+    "c": {"salary": {"entry": 60000}, "job_outlook": "25.5% growth (2021-2031)"},
+    "d": {"salary": {}, "job_outlook": "-3% decline"},
+}
+
+
+def _careers(columns, *args, **kwargs):
+    total, rows = columns.query(*args, **kwargs)
+    return total, [columns.careers[i] for i in rows]
+
+
+def test_growth_percent_is_parsed_from_the_outlook():
+    assert parse_growth_percent("32% growth (2021-2031)") == 32.0
+    assert parse_growth_percent("-3% decline") == -3.0
+    assert parse_growth_percent("Growing fast") is None
+    assert parse_growth_percent(None) is None
+
+
+def test_range_masks_are_inclusive_and_skip_missing_values():
+    columns = CareerColumns(CATALOG)
+    assert columns.range_mask("entry", 60000, None).tolist() == [False, True, True, False]
+    assert columns.range_mask("entry", None, 50000).tolist() == [True, False, False, False]
+    assert columns.range_mask("growth").tolist() == [True, False, True, True]
+
+
+def test_empty_range_matches_nothing():
+    columns = CareerColumns(CATALOG)
+    assert not columns.range_mask("entry", 70000, 50000).any()
+    assert _careers(columns, {"entry": (70000, 50000)}, sort="entry") == (0, [])
+
+
+def test_ranking_excludes_careers_without_the_sort_value():
+    columns = CareerColumns(CATALOG)
+    assert _careers(columns, sort="mid") == (2, ["b", "a"])
+    assert _careers(columns, sort="growth", descending=False) == (3, ["d", "a", "c"])
+    # Ties keep catalog order
+    assert _careers(columns, {"entry": (55000, None)}, sort="entry", descending=False) == (2, ["b", "c"])
+
+
+def test_filters_on_several_columns_are_combined():
+    columns = CareerColumns(CATALOG)
+    assert _careers(columns, {"entry": (55000, None), "growth": (0, None)}, sort="entry") == (1, ["c"])
+    assert _careers(columns, {"entry": (None, None)}, sort="entry", limit=1, offset=2) == (3, ["a"])
+
+
+@pytest.mark.parametrize("filters", [{"entry": (float("nan"), None)}, {"growth": (None, float("nan"))}])
+def test_nan_bounds_are_rejected(filters):
+    assert query_careers(filters)["status"] == "error"
+
+
+@pytest.mark.parametrize("kwargs", [{"sort": "salary"}, {"filters": {"weather": (0, 1)}}, {"limit": 0}, {"offset": -1}])
+def test_invalid_queries_are_errors(kwargs):
+    assert query_careers(**kwargs)["status"] == "error"
+
+
+def test_query_endpoint():
+    client = app.test_client()
+    response = client.get("/careers/query?min_growth=30&sort=entry&order=asc")
+    assert response.status_code == 200
+    assert [c["name"] for c in response.json["careers"]] == ["Cybersecurity Analyst", "Cloud Architect",
+                                                              "Machine Learning Engineer"]
+    assert all(c["growth_percent"] >= 30 for c in response.json["careers"])
+    assert client.get("/careers/query?min_entry=nan").status_code == 400
+    assert client.get("/careers/query?max_mid=lots").status_code == 400
+    assert client.get("/careers/query?min_mid=200000&max_mid=100000").json["total"] == 0
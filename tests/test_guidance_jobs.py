@@ -0,0 +1,93 @@
+import pytest
+
+from backend import guidance_jobs
+from backend.guidance_jobs import get_guidance_job, get_job_stats, submit_guidance_job
+
+
+class ManualExecutor:
+    """Holds submitted jobs until the test runs them."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        self.jobs.append((fn, args))
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, []
+        for fn, args in jobs:
+            fn(*args)
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    executor = ManualExecutor()
+    monkeypatch.setattr(guidance_jobs, "_get_executor", lambda: executor)
+    monkeypatch.setattr(guidance_jobs, "_jobs", {})
+    monkeypatch.setattr(guidance_jobs, "_pending_by_request", {})
+    monkeypatch.setattr(guidance_jobs, "_pending", 0)
+    monkeypatch.setattr(guidance_jobs, "_stats", dict.fromkeys(guidance_jobs._stats, 0))
+    monkeypatch.setattr(guidance_jobs, "GEMINI_AVAILABLE", True)
+    monkeypatch.setattr(guidance_jobs, "generate_personalized_guidance", lambda career, level, skills: {
+        "status": "success", "personalized_guidance": f"Guidance for {career}", "provider": "fake"
+    })
+    return executor
+
+
+def test_job_result_is_returned_once_finished(jobs):
+    job_id = submit_guidance_job("data analyst", "fresher")
+    assert get_guidance_job(job_id)["status"] == "pending"
+    jobs.run_all()
+    result = get_guidance_job(job_id)
+    assert result["status"] == "success"
+    assert result["ai_personalized_guidance"] == "Guidance for data analyst"
+
+
+def test_identical_pending_requests_share_a_job(jobs):
+    first = submit_guidance_job("data analyst", "fresher", ["SQL", "python"])
+    assert submit_guidance_job("data analyst", "fresher", ["Python", "sql"]) == first
+    assert submit_guidance_job("data analyst", "fresher", ["Excel"]) != first
+    assert len(jobs.jobs) == 2
+    assert get_job_stats()["coalesced"] == 1
+
+
+def test_full_queue_rejects_new_jobs_until_one_finishes(jobs, monkeypatch):
+    monkeypatch.setattr(guidance_jobs, "MAX_PENDING", 2)
+    assert submit_guidance_job("data analyst", "fresher")
+    assert submit_guidance_job("web developer", "fresher")
+    assert submit_guidance_job("devops engineer", "fresher") is None
+    stats = get_job_stats()
+    assert (stats["pending"], stats["rejected"]) == (2, 1)
+
+    jobs.run_all()
+    assert submit_guidance_job("devops engineer", "fresher")
+
+
+def test_finished_jobs_expire_after_the_ttl(jobs, monkeypatch):
+    done = submit_guidance_job("data analyst", "fresher")
+    jobs.run_all()
+    waiting = submit_guidance_job("web developer", "fresher")
+
+    monkeypatch.setattr(guidance_jobs, "JOB_TTL_SECONDS", -1)
+    submit_guidance_job("devops engineer", "fresher")  # expired jobs are purged on submit
+    assert get_guidance_job(done)["status"] == "not_found"
+    assert get_guidance_job(waiting)["status"] == "pending"  # pending jobs never expire
+
+
+def test_failed_generation_is_reported(jobs, monkeypatch):
+    def fail(career, level, skills):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(guidance_jobs, "generate_personalized_guidance", fail)
+    job_id = submit_guidance_job("data analyst", "fresher")
+    jobs.run_all()
+    result = get_guidance_job(job_id)
+    assert result["status"] == "error"
+    assert "provider down" in result["message"]
+    assert get_job_stats()["pending"] == 0
+
+
+def test_no_job_without_a_provider(jobs, monkeypatch):
+    monkeypatch.setattr(guidance_jobs, "GEMINI_AVAILABLE", False)
+    monkeypatch.setattr(guidance_jobs, "OPENAI_AVAILABLE", False)
+    assert submit_guidance_job("data analyst", "fresher") is None
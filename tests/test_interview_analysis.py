@@ -0,0 +1,82 @@
+import pytest
+
+from backend import interview_generator
+from backend.app import app
+from backend.interview_generator import get_interview_analysis, process_interview_answer, start_interview
+from backend.session_store import MemorySessionStore
+
+ANSWER = "I would start by profiling the slow query and checking its plan."
+
+
+class ManualExecutor:
+    """Holds submitted analyses until the test runs them."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        self.jobs.append((fn, args))
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, []
+        for fn, args in jobs:
+            fn(*args)
+
+
+@pytest.fixture
+def interview(monkeypatch):
+    executor = ManualExecutor()
+    monkeypatch.setattr(interview_generator, "session_store", MemorySessionStore())
+    monkeypatch.setattr(interview_generator, "_get_analysis_executor", lambda: executor)
+    monkeypatch.setattr(interview_generator, "GRADING_MODE", "per_answer")
+    monkeypatch.setattr(interview_generator, "_analyze_answer",
+                        lambda career, question, answer: f"Feedback on: {question}")
+    return start_interview("data analyst")["session_id"], executor
+
+
+def test_next_question_does_not_wait_for_the_analysis(interview):
+    session_id, executor = interview
+    result = process_interview_answer(session_id, ANSWER)
+    assert result["status"] == "next_question"
+    assert (result["analyses"], result["analysis_pending"]) == ([], [1])
+    assert result["analysis_url"] == f"/interview/{session_id}/analysis"
+
+    polled = get_interview_analysis(session_id)
+    assert [a["status"] for a in polled["analyses"]] == ["pending"]
+    assert polled["complete"] is False
+    assert len(executor.jobs) == 1
+
+
+def test_finished_analysis_is_delivered_once_and_always_pollable(interview):
+    session_id, executor = interview
+    process_interview_answer(session_id, ANSWER)
+    executor.run_all()
+
+    result = process_interview_answer(session_id, ANSWER)
+    assert [a["question_number"] for a in result["analyses"]] == [1]
+    assert result["analyses"][0]["feedback"].startswith("Feedback on: ")
+    assert result["analysis_pending"] == [2]
+
+    executor.run_all()
+    assert [a["question_number"] for a in process_interview_answer(session_id, ANSWER)["analyses"]] == [2]
+    polled = get_interview_analysis(session_id)
+    assert [a["status"] for a in polled["analyses"]] == ["ready", "ready", "pending"]
+
+
+def test_analysis_for_an_expired_session_is_dropped(interview):
+    session_id, executor = interview
+    process_interview_answer(session_id, ANSWER)
+    interview_generator.session_store.delete(session_id)
+    executor.run_all()  # must not raise
+    assert get_interview_analysis(session_id)["status"] == "not_found"
+
+
+def test_analysis_endpoint(interview):
+    session_id, executor = interview
+    process_interview_answer(session_id, ANSWER)
+    executor.run_all()
+    client = app.test_client()
+    response = client.get(f"/interview/{session_id}/analysis")
+    assert response.status_code == 200
+    assert response.json["complete"] is True
+    assert client.get("/interview/unknown/analysis").status_code == 404
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from backend import llm_guidance
+from backend.interview_generator import InterviewSession
+from backend.llm_guidance import _parse_interview_grading, grade_interview
+
+GRADING = {
+    "answers": [
+        {"question_number": 1, "score": 8, "feedback": "Clear and specific."},
+        {"question_number": 2, "score": 4.6, "feedback": "Needs an example."}
+    ],
+    "technical_score": 7, "communication_score": 12, "problem_solving_score": "6",
+    "strengths": ["Structured"], "improvements": ["Depth"],
+    "assessment": "Solid start.", "recommendation": "Hire"
+}
+
+
+def test_grading_is_pulled_out_of_a_fenced_reply():
+    grading = _parse_interview_grading(f"Here you go:\n```json\n{json.dumps(GRADING)}\n```", 2)
+    assert [a["score"] for a in grading["answers"]] == [8, 5]
+    assert grading["communication_score"] == 10  # clamped to 1-10
+    assert grading["problem_solving_score"] == 6
+    assert grading["recommendation"] == "Hire"
+
+
+@pytest.mark.parametrize("text", [
+    "I cannot grade this interview.",
+    '{"answers": [{"question_number": 1, "score": 8,}]}',  # trailing comma
+    '{"answers": [{"question_number": 1, "score": 8',       # truncated
+    '{"technical_score": 7}',                                # no per-answer grades
+    '{"answers": "good"}',
+])
+def test_malformed_grading_is_rejected(text):
+    assert _parse_interview_grading(text, 2) is None
+
+
+def test_answers_are_slotted_by_question_number():
+    text = json.dumps({"answers": [
+        {"question_number": 2, "score": "n/a", "feedback": "Short."},
+        {"question_number": 9, "score": 5, "feedback": "Falls back to slot 2, already taken."},
+        "not an entry"
+    ], "recommendation": "Definitely"})
+    grading = _parse_interview_grading(text, 3)
+    assert [(a["question_number"], a["score"], a["feedback"]) for a in grading["answers"]] == [
+        (1, None, None), (2, None, "Short."), (3, None, None)
+    ]
+    assert grading["recommendation"] == "Further Discussion"
+
+
+def test_unparseable_reply_is_an_error(monkeypatch):
+    monkeypatch.setattr(llm_guidance, "_generate", lambda *args: ("Great interview!", "fake", "primary"))
+    result = grade_interview("data analyst", "fresher", [("Q1", "A1")])
+    assert result["status"] == "error"
+
+    session = InterviewSession("data analyst")
+    session.get_first_question()
+    session.answers = ["A1"]
+    assert session.complete(result)["feedback"]["graded"] is False
+
+
+def test_graded_interview_records_scores(monkeypatch):
+    monkeypatch.setattr(llm_guidance, "_generate", lambda *args: (json.dumps(GRADING), "fake", "primary"))
+    session = InterviewSession("data analyst")
+    session.get_first_question()
+    session.answers = ["A1", "A2"]
+    result = session.complete(grade_interview("data analyst", "fresher", [("Q1", "A1"), ("Q2", "A2")]))
+    assert result["feedback"]["graded"] is True
+    assert result["feedback"]["technical_score"] == 7
+    assert [a["score"] for a in result["analyses"]] == [8, 5]
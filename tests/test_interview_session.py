@@ -0,0 +1,102 @@
+import pytest
+
+from backend import interview_generator
+from backend.interview_generator import InterviewSession, TOTAL_QUESTIONS, process_interview_answer
+from backend.session_store import SQLiteSessionStore, SessionConflict
+
+ANSWER = "I would start by profiling the slow query and checking its plan."
+
+
+class RecordingExecutor:
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        self.jobs.append(args)
+
+
+@pytest.fixture
+def interview(tmp_path, monkeypatch):
+    store = SQLiteSessionStore(InterviewSession, tmp_path / "interviews.sqlite3")
+    executor = RecordingExecutor()
+    gradings = []
+
+    def grade(career, level, qa_pairs):
+        gradings.append(qa_pairs)
+        return None  # no provider: ungraded feedback
+
+    monkeypatch.setattr(interview_generator, "session_store", store)
+    monkeypatch.setattr(interview_generator, "_get_analysis_executor", lambda: executor)
+    monkeypatch.setattr(interview_generator, "_grade_answers", grade)
+    monkeypatch.setattr(interview_generator, "GRADING_MODE", "per_answer")
+
+    session = InterviewSession("data analyst")
+    session.get_first_question()
+    store.put(session)
+
+    # Every load is followed by a write from "another worker", once per answer
+    load = store._load
+    conflicted = set()
+
+    def conflicting_load(session_id):
+        result = load(session_id)
+        key = len(result[0].answers)
+        if key not in conflicted:
+            conflicted.add(key)
+            store._connect().execute("UPDATE sessions SET version = version + 1 WHERE session_id = ?", (session_id,))
+        return result
+
+    monkeypatch.setattr(store, "_load", conflicting_load)
+    return session.session_id, store, executor, gradings
+
+
+def test_conflicts_do_not_duplicate_analysis_jobs_or_grading(interview):
+    session_id, store, executor, gradings = interview
+    for _ in range(TOTAL_QUESTIONS - 1):
+        assert process_interview_answer(session_id, ANSWER)["status"] == "next_question"
+    result = process_interview_answer(session_id, ANSWER)
+
+    assert result["status"] == "interview_complete"
+    assert result["feedback"]["graded"] is False
+    assert store.stats()["conflicts"] >= TOTAL_QUESTIONS
+    assert [job[1] for job in executor.jobs] == list(range(TOTAL_QUESTIONS))
+    assert len(gradings) == 1 and len(gradings[0]) == TOTAL_QUESTIONS
+    assert len(store.get(session_id).analyses) == TOTAL_QUESTIONS
+
+
+def test_answer_after_completion_is_rejected(interview):
+    session_id, _, _, gradings = interview
+    for _ in range(TOTAL_QUESTIONS):
+        process_interview_answer(session_id, ANSWER)
+    assert process_interview_answer(session_id, ANSWER)["status"] == "error"
+    assert len(gradings) == 1
+
+
+@pytest.mark.parametrize("level, expected", [("Professional", "professional"), ("x" * 40, "fresher"), ("", "fresher")])
+def test_start_interview_only_accepts_known_levels(tmp_path, monkeypatch, level, expected):
+    monkeypatch.setattr(interview_generator, "session_store", SQLiteSessionStore(InterviewSession, tmp_path / "s.sqlite3"))
+    result = interview_generator.start_interview("data analyst", level)
+    assert result["level"] == expected
+
+
+def test_question_bank_ignores_unknown_levels(monkeypatch):
+    from backend import question_bank
+
+    monkeypatch.setattr(question_bank, "questions_from_tasks", lambda career, level: pytest.fail("built questions"))
+    assert question_bank.get_role_questions("data analyst", "made-up-level") is None
+
+
+def test_persistent_conflict_is_reported_not_raised(tmp_path, monkeypatch):
+    store = SQLiteSessionStore(InterviewSession, tmp_path / "s.sqlite3")
+    monkeypatch.setattr(interview_generator, "session_store", store)
+    session_id = interview_generator.start_interview("data analyst")["session_id"]
+
+    def conflict(session_id, fn, retries=3):
+        raise SessionConflict("Session is being updated elsewhere; please retry")
+
+    monkeypatch.setattr(store, "update", conflict)
+    assert process_interview_answer(session_id, ANSWER)["status"] == "conflict"
+
+    from backend.app import app
+    response = app.test_client().post("/interview/answer", json={"session_id": session_id, "answer": ANSWER})
+    assert response.status_code == 409
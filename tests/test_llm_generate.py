@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pytest
+
+from backend import llm_guidance, precompute_guidance
+from backend.llm_cache import LLMCache, make_cache_key
+from backend.singleflight import SingleFlight
+
+
+class FakeProvider:
+    name = "fake"
+    model = "fake-model"
+
+
+class FakeRouter:
+    def __init__(self, delay=0.0):
+        self.providers = [FakeProvider()]
+        self.calls = 0
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def complete(self, prompt, system_prompt, max_tokens):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        time.sleep(self.delay)
+        return f"answer {n}", "fake", "fake-model", "primary", None
+
+    def stream(self, prompt, system_prompt, max_tokens):
+        self.calls += 1
+        for word in ("streamed ", "answer"):
+            yield "fake", "fake-model", word
+
+
+@pytest.fixture
+def router(monkeypatch):
+    router = FakeRouter()
+    monkeypatch.setattr(llm_guidance, "router", router)
+    monkeypatch.setattr(llm_guidance, "llm_cache", LLMCache(path=None))
+    monkeypatch.setattr(llm_guidance, "_flights", SingleFlight())
+    return router
+
+
+def test_repeated_prompt_is_served_from_cache(router):
+    first = llm_guidance._generate("Explain SQL joins", "system", 100, "test")
+    second = llm_guidance._generate("  explain SQL   joins ", "system", 100, "test")
+    assert first == second == ("answer 1", "fake", "fake-model")
+    assert router.calls == 1
+
+
+def test_bypassing_the_cache_calls_the_provider_and_refreshes_it(router):
+    llm_guidance._generate("prompt", "system", 100, "test")
+    assert llm_guidance._generate("prompt", "system", 100, "test", use_cache=False)[0] == "answer 2"
+    assert llm_guidance._generate("prompt", "system", 100, "test")[0] == "answer 2"
+    assert router.calls == 2
+
+
+class NamedProvider:
+    def __init__(self, name, model):
+        self.name = name
+        self.model = model
+
+
+def test_fallback_answer_is_cached_under_the_fallback_model(router):
+    router.providers = [NamedProvider("primary", "primary-model"), NamedProvider("fallback", "fallback-model")]
+    router.complete = lambda *args: ("from fallback", "fallback", "fallback-model", "fallback", None)
+
+    assert llm_guidance._generate("prompt", "system", 100, "test") == ("from fallback", "fallback", "fallback-model")
+    cache = llm_guidance.llm_cache
+    assert cache.get(make_cache_key("prompt", "primary-model", "system", 100)) is None
+    assert cache.get(make_cache_key("prompt", "fallback-model", "system", 100))["provider"] == "fallback"
+
+    # Served from the cache with the pairing that really answered, until the primary writes its own
+    router.complete = lambda *args: ("from primary", "primary", "primary-model", "primary", None)
+    assert llm_guidance._generate("prompt", "system", 100, "test")[1:] == ("fallback", "fallback-model")
+    llm_guidance._generate("prompt", "system", 100, "test", use_cache=False)
+    assert llm_guidance._generate("prompt", "system", 100, "test") == ("from primary", "primary", "primary-model")
+
+
+def test_finished_stream_is_cached(router):
+    assert "".join(llm_guidance._stream("prompt", "system", 100, "test")) == "streamed answer"
+    assert list(llm_guidance._stream("prompt", "system", 100, "test")) == ["streamed answer"]
+    assert router.calls == 1
+
+
+def test_no_provider_means_no_completion(router):
+    router.providers = []
+    assert llm_guidance._generate("prompt", "system", 100, "test") is None
+
+
+def test_concurrent_misses_share_one_provider_call(router):
+    router.delay = 0.2
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(llm_guidance._generate("same", "s", 10, "test")))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert router.calls == 1
+    assert len(results) == 8 and len(set(results)) == 1
+
+
+def test_cache_key_ignores_whitespace_and_case_but_not_model():
+    assert make_cache_key("Hello  World", "m") == make_cache_key("hello world", "m")
+    assert make_cache_key("hello", "m1") != make_cache_key("hello", "m2")
+
+
+def test_memory_tier_is_an_lru(tmp_path):
+    cache = LLMCache(path=tmp_path / "cache.sqlite3", max_memory_entries=2)
+    for key in "abc":
+        cache.set(key, {"text": key})
+    assert cache.stats()["evictions"] >= 1
+    assert cache.get("a") == {"text": "a"}  # still on disk
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_expired_entries_are_misses():
+    cache = LLMCache(path=None, ttl_seconds=-1)
+    cache.set("k", {"text": "old"})
+    assert cache.get("k") is None
+
+
+def test_workers_share_the_disk_tier(tmp_path):
+    writer = LLMCache(path=tmp_path / "cache.sqlite3")
+    reader = LLMCache(path=tmp_path / "cache.sqlite3")
+    writer.set("k", {"text": "shared"})
+    assert reader.get("k") == {"text": "shared"}
+    assert reader.get("k") == {"text": "shared"}  # promoted to the reader's memory tier
+    stats = reader.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["hit_rate"]) == (1, 1, 1.0)
+
+
+def test_disk_tier_is_pruned_to_its_size_cap(tmp_path):
+    cache = LLMCache(path=tmp_path / "cache.sqlite3", max_memory_entries=1, max_disk_entries=10)
+    for i in range(100):  # pruning runs every 100 writes
+        cache.set(str(i), {"text": str(i)})
+    assert cache._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 10
+    assert cache.get("0") is None
+    assert cache.get("95") == {"text": "95"}
+
+
+def test_unusable_disk_tier_falls_back_to_memory(tmp_path):
+    cache = LLMCache(path=tmp_path)  # a directory, not a database
+    cache.set("k", {"text": "kept"})
+    assert cache.get("k") == {"text": "kept"}
+    assert cache.get("missing") is None
+    assert cache.stats()["disk_errors"] == 2
+
+
+class FakeStore:
+    def __init__(self):
+        self.rows = {}
+
+    def put(self, career, level, text, provider, model):
+        self.rows[(career, level)] = text
+
+
+def test_forced_precompute_regenerates_instead_of_reusing_the_cache(router, monkeypatch):
+    monkeypatch.setattr(llm_guidance, "_precomputed_guidance", lambda career, level, skills: None)
+    store = FakeStore()
+    pairs = [("data analyst", "fresher")]
+    precompute_guidance.precompute(store, pairs, workers=1, rate=0)
+    assert store.rows[pairs[0]] == "answer 1"
+
+    precompute_guidance.precompute(store, pairs, workers=1, rate=0, force=True)
+    assert router.calls == 2
+    assert store.rows[pairs[0]] == "answer 2"
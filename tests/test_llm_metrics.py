@@ -0,0 +1,73 @@
+from backend.app import app
+from backend.llm_metrics import LLMMetrics, estimate_tokens
+from backend.metrics import Histogram, LatencyHistogram
+
+
+def test_token_estimate_is_about_four_characters_per_token():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abc") == 1
+    assert estimate_tokens("x" * 400) == 100
+
+
+def test_histogram_buckets_and_percentiles():
+    hist = Histogram((10, 100))
+    for value in (5, 10, 50, 500):
+        hist.observe(value)
+    snapshot = hist.snapshot()
+    assert snapshot["buckets"] == {"le_10": 2, "le_100": 1, "inf": 1}
+    assert (snapshot["count"], snapshot["max"], snapshot["p50"]) == (4, 500, 50)
+    assert hist.percentile(95, min_samples=5) is None
+
+
+def test_latency_histogram_reports_milliseconds_and_exports_seconds():
+    hist = LatencyHistogram((100, 1000))
+    hist.record(0.05)
+    hist.record(2.0)
+    assert hist.snapshot()["p99_ms"] == 2000
+    assert hist.percentile(99) == 2.0
+    lines = hist.prometheus("latency", {"operation": "guidance"})
+    assert lines == [
+        'latency_bucket{operation="guidance",le="0.1"} 1',
+        'latency_bucket{operation="guidance",le="1"} 1',
+        'latency_bucket{operation="guidance",le="+Inf"} 2',
+        'latency_sum{operation="guidance"} 2.05',
+        'latency_count{operation="guidance"} 2',
+    ]
+
+
+def test_records_are_aggregated_by_route_and_provider():
+    metrics = LLMMetrics()
+    metrics.record("guidance", "primary", 0.5, "gemini", "flash", prompt_tokens=10, completion_tokens=40)
+    metrics.record("guidance", "fallback", 1.0, "openai", "mini", prompt_tokens=12, completion_tokens=30,
+                   estimated=True)
+    metrics.record("guidance", "cache", 0.001)
+    metrics.record("guidance", "coalesced", 0.2)
+    metrics.record("guidance", "precomputed", 0.001)
+
+    snapshot = metrics.snapshot()
+    guidance = snapshot["operations"]["guidance"]
+    assert guidance["calls"] == {"primary": 1, "fallback": 1, "cache": 1, "coalesced": 1, "precomputed": 1}
+    assert guidance["cache_hit_rate"] == 0.5  # precomputed answers are not cache lookups
+    assert guidance["latency"]["count"] == 5
+    openai = snapshot["providers"]["openai (mini)"]
+    assert (openai["calls"], openai["prompt_tokens"], openai["estimated_calls"]) == (1, 12, 1)
+    assert set(snapshot["providers"]) == {"gemini (flash)", "openai (mini)"}
+
+
+def test_prometheus_exposition():
+    metrics = LLMMetrics()
+    metrics.record("guidance", "primary", 0.5, "gemini", "flash", prompt_tokens=10, completion_tokens=40)
+    metrics.record("guidance", "error", 0.1, error="timeout")
+    lines = metrics.prometheus()
+    assert 'llm_calls_total{operation="guidance",route="error"} 1' in lines
+    assert 'llm_cache_lookups_total{operation="guidance",result="miss"} 2' in lines
+    assert 'llm_tokens_total{provider="gemini",model="flash",kind="completion"} 40' in lines
+    assert 'llm_call_duration_seconds_count{operation="guidance"} 2' in lines
+    assert "# TYPE llm_provider_duration_seconds histogram" in lines
+
+
+def test_metrics_endpoint_serves_prometheus_text():
+    response = app.test_client().get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    assert "# TYPE llm_calls_total counter" in response.get_data(as_text=True)
@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from backend.llm_router import CircuitBreaker, ProviderRouter, ProviderUnavailable
+
+
+class FakeProvider:
+    """
+    Answers after `delay` seconds. A slower provider gives up at the caller's
+    timeout, unless it `hangs` (then only the router's deadline stops the wait).
+    """
+
+    def __init__(self, name, delay=0.0, fail=False, hangs=False, text="fake answer"):
+        self.name = name
+        self.model = f"{name}-model"
+        self.delay = delay
+        self.fail = fail
+        self.hangs = hangs
+        self.text = text
+        self.calls = 0
+
+    def _wait(self, timeout):
+        self.calls += 1
+        if self.delay > timeout and not self.hangs:
+            time.sleep(timeout)
+            raise TimeoutError(f"{self.name} timed out")
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} is down")
+
+    def complete(self, prompt, system_prompt, max_tokens, timeout):
+        self._wait(timeout)
+        return self.text, {"prompt_tokens": 3, "completion_tokens": 2}
+
+    def stream(self, prompt, system_prompt, max_tokens, timeout):
+        self._wait(timeout)
+        for word in self.text.split():
+            yield word + " "
+
+
+def test_primary_answers():
+    router = ProviderRouter([FakeProvider("a"), FakeProvider("b")])
+    assert router.complete("p", "s", 10)[1:4] == ("a", "a-model", "primary")
+
+
+def test_failed_primary_falls_back():
+    primary, secondary = FakeProvider("a", fail=True), FakeProvider("b")
+    router = ProviderRouter([primary, secondary])
+    text, provider, _, route, _ = router.complete("p", "s", 10)
+    assert (text, provider, route) == ("fake answer", "b", "fallback")
+    assert router.stats()["providers"]["a"]["failures"] == 1
+
+
+def test_stalled_provider_hits_the_deadline():
+    router = ProviderRouter([FakeProvider("a", delay=1, hangs=True)], deadline=0.2)
+    start = time.monotonic()
+    with pytest.raises(ProviderUnavailable):
+        router.complete("p", "s", 10)
+    assert time.monotonic() - start < 1
+    assert router.stats()["providers"]["a"]["deadline_exceeded"] == 1
+
+
+def test_hedge_fires_once_the_primary_is_slower_than_its_p95():
+    primary, secondary = FakeProvider("a", delay=0.01), FakeProvider("b", delay=0.01)
+    router = ProviderRouter([primary, secondary], hedge=True, hedge_min_samples=5, deadline=5)
+    for _ in range(5):
+        assert router.complete("p", "s", 10)[3] == "primary"
+    assert router._hedge_after(primary) < 0.1
+
+    primary.delay = 2
+    start = time.monotonic()
+    _, provider, _, route, _ = router.complete("p", "s", 10)
+    assert (provider, route) == ("b", "hedge")
+    assert time.monotonic() - start < 1
+    stats = router.stats()["providers"]["b"]
+    assert (stats["hedges_launched"], stats["hedge_wins"]) == (1, 1)
+
+
+def test_open_circuit_skips_the_provider_until_a_half_open_trial_succeeds():
+    primary, secondary = FakeProvider("a", fail=True), FakeProvider("b")
+    router = ProviderRouter([primary, secondary], failure_threshold=2, reset_timeout=0.2)
+    for _ in range(2):
+        router.complete("p", "s", 10)
+    assert router.stats()["providers"]["a"]["circuit"]["state"] == "open"
+
+    assert router.complete("p", "s", 10)[1] == "b"
+    assert primary.calls == 2  # skipped while open
+
+    time.sleep(0.25)
+    primary.fail = False
+    assert router.complete("p", "s", 10)[1:4] == ("a", "a-model", "primary")
+    assert router.stats()["providers"]["a"]["circuit"]["state"] == "closed"
+
+
+def test_half_open_lets_a_single_trial_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()  # the trial failed: open again
+    assert breaker.snapshot()["state"] == "open"
+
+
+def test_stream_falls_back_before_the_first_token():
+    router = ProviderRouter([FakeProvider("a", fail=True), FakeProvider("b", text="hello there")])
+    chunks = list(router.stream("p", "s", 10))
+    assert [c for _, _, c in chunks] == ["hello ", "there "]
+    assert {name for name, _, _ in chunks} == {"b"}
+
+
+def test_stream_fallbacks_share_one_deadline():
+    providers = [FakeProvider(name, delay=5) for name in "abc"]
+    router = ProviderRouter(providers, deadline=0.3)
+    start = time.monotonic()
+    with pytest.raises(ProviderUnavailable):
+        list(router.stream("p", "s", 10))
+    assert time.monotonic() - start < 0.6  # not 3 x 0.3 s
+    assert providers[2].calls == 0
@@ -0,0 +1,99 @@
+import pytest
+
+from backend import prefetch
+from backend.prefetch import get_prefetch_stats, prefetch_guidance, record_guidance_request
+
+
+class ManualExecutor:
+    """Holds submitted prefetches until the test runs them."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        self.jobs.append((fn, args))
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, []
+        for fn, args in jobs:
+            fn(*args)
+
+
+@pytest.fixture
+def state(monkeypatch):
+    executor = ManualExecutor()
+    calls = []
+    load = {"provider": 0.0, "pending": 0}
+    monkeypatch.setattr(prefetch, "_get_executor", lambda: executor)
+    monkeypatch.setattr(prefetch, "PREFETCH_ENABLED", True)
+    monkeypatch.setattr(prefetch, "PREFETCH_TOP_N", 2)
+    monkeypatch.setattr(prefetch, "_queued", set())
+    monkeypatch.setattr(prefetch, "_prefetched", prefetch.OrderedDict())
+    monkeypatch.setattr(prefetch, "_budget_window", [0.0, 0])
+    monkeypatch.setattr(prefetch, "_stats", dict.fromkeys(prefetch._stats, 0))
+    monkeypatch.setattr(prefetch, "get_ready_guidance", lambda career, level: None)
+    monkeypatch.setattr(prefetch, "get_provider_load", lambda: load["provider"])
+    monkeypatch.setattr(prefetch, "get_job_stats", lambda: {"pending": load["pending"], "max_workers": 2})
+
+    def generate(career, level):
+        calls.append(career)
+        return {"status": "success"}
+
+    monkeypatch.setattr(prefetch, "generate_personalized_guidance", generate)
+    return executor, calls, load
+
+
+def test_top_careers_are_prefetched_once(state):
+    executor, calls, _ = state
+    assert prefetch_guidance(["data analyst", "web developer", "devops engineer"], "fresher") == 2
+    assert prefetch_guidance(["data analyst"], "fresher") == 0  # already queued
+    executor.run_all()
+    assert calls == ["data analyst", "web developer"]
+    assert get_prefetch_stats()["completed"] == 2
+
+
+def test_cached_careers_are_skipped(state, monkeypatch):
+    monkeypatch.setattr(prefetch, "get_ready_guidance", lambda career, level: {"status": "success"})
+    assert prefetch_guidance(["data analyst"], "fresher") == 0
+    assert get_prefetch_stats()["skipped_cached"] == 1
+
+
+def test_prefetch_is_dropped_under_load(state):
+    executor, calls, load = state
+    load["provider"] = 0.9
+    assert prefetch_guidance(["data analyst"], "fresher") == 0
+
+    load["provider"] = 0.0
+    assert prefetch_guidance(["data analyst"], "fresher") == 1
+    load["pending"] = 2  # guidance jobs backed up while the prefetch waited
+    executor.run_all()
+    assert calls == []
+    assert get_prefetch_stats()["dropped_load"] == 2
+
+
+def test_budget_limits_provider_calls(state, monkeypatch):
+    executor, calls, _ = state
+    monkeypatch.setattr(prefetch, "PREFETCH_BUDGET", 1)
+    prefetch_guidance(["data analyst", "web developer"], "fresher")
+    executor.run_all()
+    assert calls == ["data analyst"]
+    assert get_prefetch_stats()["dropped_budget"] == 1
+
+
+def test_hits_count_prefetched_careers_requested_in_the_window(state, monkeypatch):
+    executor, _, _ = state
+    prefetch_guidance(["data analyst", "web developer"], "fresher")
+    executor.run_all()
+
+    record_guidance_request("data analyst", "fresher")
+    record_guidance_request("data analyst", "fresher")  # a hit is only counted once
+    monkeypatch.setattr(prefetch, "PREFETCH_HIT_WINDOW", -1)
+    record_guidance_request("web developer", "fresher")
+    stats = get_prefetch_stats()
+    assert (stats["hits"], stats["hit_rate"]) == (1, 0.5)
+
+
+def test_disabled_prefetch_queues_nothing(state, monkeypatch):
+    monkeypatch.setattr(prefetch, "PREFETCH_ENABLED", False)
+    assert prefetch_guidance(["data analyst"], "fresher") == 0
+    assert state[0].jobs == []
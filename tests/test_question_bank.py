@@ -0,0 +1,70 @@
+import pytest
+
+from backend import llm_guidance, question_bank
+from backend.question_bank import QuestionBank, get_role_questions
+
+
+class RecordingExecutor:
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        self.jobs.append(args)
+
+
+def _count_connects(bank, monkeypatch):
+    calls = []
+    connect = bank._connect
+    monkeypatch.setattr(bank, "_connect", lambda: calls.append(1) or connect())
+    return calls
+
+
+@pytest.fixture
+def bank(tmp_path, monkeypatch):
+    bank = QuestionBank(tmp_path / "questions.sqlite3")
+    executor = RecordingExecutor()
+    monkeypatch.setattr(question_bank, "question_bank", bank)
+    monkeypatch.setattr(question_bank, "_get_executor", lambda: executor)
+    monkeypatch.setattr(question_bank, "_pending", set())
+    monkeypatch.setattr(question_bank, "_failed", {})
+    return bank, executor
+
+
+def _providers(monkeypatch, available):
+    monkeypatch.setattr(llm_guidance, "GEMINI_AVAILABLE", available)
+    monkeypatch.setattr(llm_guidance, "OPENAI_AVAILABLE", available)
+
+
+def test_without_a_provider_task_questions_are_served_from_memory(bank, monkeypatch):
+    bank, executor = bank
+    _providers(monkeypatch, False)
+    first = get_role_questions("data analyst", "fresher")
+    assert first
+
+    calls = _count_connects(bank, monkeypatch)
+    assert get_role_questions("data analyst", "fresher") == first
+    assert calls == []
+    assert executor.jobs == []
+
+
+def test_another_worker_caches_task_rows_after_one_read(bank, tmp_path, monkeypatch):
+    bank, _ = bank
+    _providers(monkeypatch, False)
+    first = get_role_questions("data analyst", "fresher")
+
+    other = QuestionBank(tmp_path / "questions.sqlite3")
+    calls = _count_connects(other, monkeypatch)
+    assert other.get("data analyst", "fresher")["questions"] == first
+    assert other.get("data analyst", "fresher")["questions"] == first
+    assert len(calls) == 1
+
+
+def test_with_a_provider_task_rows_wait_for_the_llm_upgrade(bank, monkeypatch):
+    bank, executor = bank
+    _providers(monkeypatch, True)
+    get_role_questions("data analyst", "fresher")
+    assert executor.jobs == [("data analyst", "fresher")]
+
+    calls = _count_connects(bank, monkeypatch)
+    get_role_questions("data analyst", "fresher")
+    assert len(calls) == 1  # re-read: another worker may have stored LLM questions
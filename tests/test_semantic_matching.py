@@ -0,0 +1,119 @@
+import csv
+import json
+
+import pytest
+
+from backend import fuzzy_matcher, onet_importer, recommender
+
+TOPICS = {
+    "data": "sql python statistics dashboards reporting excel analysis",
+    "web": "javascript html css react frontend browser pages",
+    "cloud": "aws kubernetes docker terraform infrastructure deployment",
+    "security": "threats firewall incident vulnerability penetration audit",
+}
+
+
+def _write_csv(path, careers):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["O*NET-SOC Code", "Title", "Description"])
+        for i, (title, text) in enumerate(careers):
+            writer.writerow([f"{i:05d}", title, text])
+
+
+def _careers(suffix=""):
+    careers = []
+    for topic, words in TOPICS.items():
+        for level in range(6):
+            text = f"{words} {topic} level{level} {suffix} " * 3 + "team communication planning"
+            careers.append((f"{topic} specialist {level}{suffix}", text))
+    return careers
+
+
+def _import(tmp_path, careers, lsa_dim=16, alt_titles=None):
+    csv_path = tmp_path / "occupations.csv"
+    out_json = tmp_path / "CAREER_DB_onet.json"
+    _write_csv(csv_path, careers)
+    onet_importer.build_onet_db(str(csv_path), str(out_json), lsa_dim=lsa_dim, alt_titles=alt_titles)
+    with open(out_json, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def use_index(tmp_path, monkeypatch):
+    """Point fuzzy_matcher at an index in tmp_path and reload it on demand."""
+    for name, suffix in [("_VEC_PATH", ".vec.pkl"), ("_IDX_PATH", ".idx.pkl"),
+                         ("_MATRIX_PATH", ".matrix.npz"), ("_LSA_PATH", ".lsa.npz")]:
+        monkeypatch.setattr(fuzzy_matcher, name, tmp_path / f"CAREER_DB_onet{suffix}")
+    monkeypatch.setattr(fuzzy_matcher, "SEMANTIC_MATCHING", "lsa")
+
+    def load(catalog):
+        monkeypatch.setattr(fuzzy_matcher, "CAREER_DB", catalog)
+        monkeypatch.setattr(recommender, "CAREER_DB", catalog)
+        for name in ("_TFIDF_VEC", "_TFIDF_MATRIX", "_TFIDF_TITLES", "_LSA_COMPONENTS", "_LSA_EMBEDDINGS"):
+            monkeypatch.setattr(fuzzy_matcher, name, None)
+        assert fuzzy_matcher._try_load_index()
+
+    return load
+
+
+def test_lsa_embeddings_are_used_when_they_match_the_index(tmp_path, use_index):
+    catalog = _import(tmp_path, _careers())
+    use_index(catalog)
+    assert fuzzy_matcher.lsa_available()
+    career, _ = fuzzy_matcher.semantic_search("kubernetes docker terraform", 1)[0]
+    assert career.startswith("cloud")
+
+
+def test_stale_lsa_file_is_ignored(tmp_path, use_index):
+    _import(tmp_path, _careers())
+    stale = (tmp_path / "CAREER_DB_onet.lsa.npz").read_bytes()
+    catalog = _import(tmp_path, _careers(" renamed"))
+    (tmp_path / "CAREER_DB_onet.lsa.npz").write_bytes(stale)
+    use_index(catalog)
+    assert not fuzzy_matcher.lsa_available()
+    assert fuzzy_matcher.semantic_scores("sql python")[1] == "tfidf"
+
+
+def test_import_without_lsa_removes_old_embeddings(tmp_path):
+    _import(tmp_path, _careers())
+    assert (tmp_path / "CAREER_DB_onet.lsa.npz").exists()
+    _import(tmp_path, _careers(), lsa_dim=0)
+    assert not (tmp_path / "CAREER_DB_onet.lsa.npz").exists()
+
+
+def test_import_without_alternate_titles_removes_old_aliases(tmp_path):
+    alt_titles = tmp_path / "alternate_titles.csv"
+    with open(alt_titles, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["O*NET-SOC Code", "Alternate Title"])
+        writer.writerow(["00000", "Numbers Person"])
+    alias_path = tmp_path / "CAREER_DB_onet.aliases.json"
+
+    _import(tmp_path, _careers(), lsa_dim=0, alt_titles=str(alt_titles))
+    assert json.loads(alias_path.read_text(encoding="utf-8")) == {"numbers person": "data specialist 0"}
+    _import(tmp_path, _careers(" renamed"), lsa_dim=0)
+    assert not alias_path.exists()
+
+
+def test_results_are_filtered_before_the_top_n_cut(tmp_path, use_index):
+    catalog = _import(tmp_path, _careers())
+    # Careers missing from the loaded catalog must not use up result slots
+    catalog = {k: v for k, v in catalog.items() if not k.startswith("data specialist") or k.endswith("5")}
+    use_index(catalog)
+    results = fuzzy_matcher.semantic_search("sql python statistics", 3)
+    assert len(results) == 3
+    assert all(career in catalog and score > 0 for career, score in results)
+
+    similar = fuzzy_matcher.find_similar_careers("data specialist 5", top_n=4)
+    assert len(similar) == 4
+    assert "data specialist 5" not in [c for c, _ in similar]
+
+
+def test_recommendations_share_a_skill_with_the_user(tmp_path, use_index):
+    catalog = _import(tmp_path, _careers())
+    use_index(catalog)
+    skills = list(catalog["web specialist 0"]["skills"][:2])
+    results = recommender.recommend_careers_by_skills(skills, top_n=3)
+    assert results
+    assert all(matching and score > 0 for _, score, matching in results)
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from backend.session_store import MemorySessionStore, SQLiteSessionStore, SessionConflict, SessionNotFound
+
+
+class Counter:
+    def __init__(self, session_id, value=0):
+        self.session_id = session_id
+        self.value = value
+
+    def to_dict(self):
+        return {"session_id": self.session_id, "value": self.value}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["session_id"], data["value"])
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    return SQLiteSessionStore(Counter, tmp_path / "sessions.sqlite3")
+
+
+@pytest.mark.parametrize("make_store", ["memory", "sqlite"])
+def test_update_persists_and_returns_result(make_store, tmp_path):
+    store = MemorySessionStore() if make_store == "memory" else SQLiteSessionStore(Counter, tmp_path / "s.sqlite3")
+    store.put(Counter("a"))
+
+    def bump(session):
+        session.value += 1
+        return session.value
+
+    assert store.update("a", bump) == 1
+    assert store.update("a", bump) == 2
+    assert store.get("a").value == 2
+
+
+def test_update_unknown_session(sqlite_store):
+    with pytest.raises(SessionNotFound):
+        sqlite_store.update("missing", lambda session: None)
+
+
+def test_version_conflict_reruns_fn_on_fresh_state(sqlite_store):
+    sqlite_store.put(Counter("a"))
+    calls = []
+
+    def bump(session):
+        calls.append(session.value)
+        if len(calls) == 1:
+            # Another worker writes the session between our load and our write
+            sqlite_store._connect().execute(
+                "UPDATE sessions SET data = ?, version = version + 1 WHERE session_id = 'a'",
+                ('{"session_id": "a", "value": 10}',)
+            )
+        session.value += 1
+        return session.value
+
+    assert sqlite_store.update("a", bump) == 11
+    assert calls == [0, 10]
+    assert sqlite_store.get("a").value == 11
+    assert sqlite_store.stats()["conflicts"] == 1
+
+
+def test_gives_up_after_repeated_conflicts(sqlite_store):
+    sqlite_store.put(Counter("a"))
+
+    def always_conflict(session):
+        sqlite_store._connect().execute("UPDATE sessions SET version = version + 1 WHERE session_id = 'a'")
+
+    with pytest.raises(SessionConflict):
+        sqlite_store.update("a", always_conflict, retries=2)
+
+
+def test_expired_sessions_are_not_found(tmp_path):
+    store = SQLiteSessionStore(Counter, tmp_path / "s.sqlite3", ttl_seconds=-1)
+    store.put(Counter("a"))
+    assert store.get("a") is None
+
+
+def test_reads_keep_a_session_alive(tmp_path):
+    store = SQLiteSessionStore(Counter, tmp_path / "s.sqlite3", ttl_seconds=100)
+    store.put(Counter("a"))
+    conn = store._connect()
+    conn.execute("UPDATE sessions SET accessed_at = ?", (time.time() - 90,))
+
+    assert store.get("a") is not None
+    accessed_at, version = conn.execute("SELECT accessed_at, version FROM sessions").fetchone()
+    assert accessed_at > time.time() - 5
+    assert version == 0  # a read does not make concurrent updates conflict
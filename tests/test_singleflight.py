@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from backend.singleflight import SingleFlight
+
+
+def _hold(flights, key, result=None, error=None):
+    """Start a leader call for `key` that runs until the returned event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def call():
+        started.set()
+        release.wait()
+        if error is not None:
+            raise error
+        return result
+
+    outcome = {}
+
+    def run():
+        try:
+            outcome["value"] = flights.do(key, call)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    started.wait()
+    return release, thread, outcome
+
+
+def _join_waiters(flights, key, count):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flights.do(key, pytest.fail)))
+               for _ in range(count)]
+    for t in threads:
+        t.start()
+    while flights.stats()["deduplicated_calls"] < count:
+        time.sleep(0.005)
+    return threads, results
+
+
+def test_concurrent_callers_share_the_leader_result():
+    flights = SingleFlight()
+    release, leader, outcome = _hold(flights, "k", result="answer")
+    waiters, results = _join_waiters(flights, "k", 3)
+    assert flights.stats()["in_flight"] == 1
+
+    release.set()
+    leader.join()
+    for t in waiters:
+        t.join()
+    assert outcome["value"] == ("answer", False)
+    assert results == [("answer", True)] * 3
+    stats = flights.stats()
+    assert (stats["leader_calls"], stats["deduplicated_calls"], stats["max_waiters"]) == (1, 3, 3)
+    assert stats["dedup_rate"] == 0.75
+
+
+def test_errors_are_shared_with_waiters():
+    flights = SingleFlight()
+    release, leader, outcome = _hold(flights, "k", error=ValueError("provider down"))
+    errors = []
+
+    def waiter():
+        try:
+            flights.do("k", pytest.fail)
+        except ValueError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=waiter)
+    t.start()
+    while flights.stats()["deduplicated_calls"] < 1:
+        time.sleep(0.005)
+    release.set()
+    leader.join()
+    t.join()
+    assert errors == [outcome["error"]]
+
+
+def test_key_is_released_once_the_call_finishes():
+    flights = SingleFlight()
+    assert flights.do("k", lambda: 1) == (1, False)
+    with pytest.raises(KeyError):
+        flights.do("k", lambda: {}["missing"])
+    assert flights.do("k", lambda: 2) == (2, False)
+    stats = flights.stats()
+    assert (stats["leader_calls"], stats["deduplicated_calls"], stats["in_flight"]) == (3, 0, 0)
+
+
+def test_different_keys_do_not_wait_for_each_other():
+    flights = SingleFlight()
+    release, leader, _ = _hold(flights, "a")
+    assert flights.do("b", lambda: "b") == ("b", False)
+    release.set()
+    leader.join()
+    assert flights.stats()["deduplicated_calls"] == 0
@@ -0,0 +1,73 @@
+from backend import skill_cooccurrence
+from backend.career_data import CATALOG_VERSION
+from backend.skill_cooccurrence import SkillCooccurrence
+from backend.skill_index import SkillIndex
+
+# Python and SQL share four careers; Python and Fortran one, but Fortran is
+# so rare that the pair's raw lift (4.0) beats Python and SQL's (3.2)
+CATALOG = {
+    **{f"developer {i}": {"skills": ["Python", "SQL"]} for i in range(4)},
+    "physicist": {"skills": ["Python", "Fortran"]},
+    "analyst": {"skills": ["SQL", "Excel"]},
+    **{f"cook {i}": {"skills": ["Cooking", "Baking"]} for i in range(14)},
+}
+
+
+def _table(**kwargs):
+    index = SkillIndex(CATALOG, "test")
+    return SkillCooccurrence.build(index, **kwargs), index
+
+
+def test_well_supported_pair_outranks_a_one_off():
+    table, index = _table()
+    related = table.related(index.column["python"])
+    assert [r["skill"] for r in related] == ["SQL", "Fortran"]
+    assert related[0]["lift"] < related[1]["lift"]
+    assert related[0]["score"] > related[1]["score"]
+    assert related[0]["shared_careers"] == 4
+
+
+def test_only_top_k_neighbours_are_kept():
+    table, index = _table(top_k=1)
+    assert [r["skill"] for r in table.related(index.column["python"])] == ["SQL"]
+    assert table.related(index.column["cooking"]) == [{
+        "skill": "Baking", "shared_careers": 14, "lift": 1.429, "pmi": 0.515, "score": 0.448
+    }]
+
+
+def test_min_count_drops_rare_pairs():
+    table, index = _table(min_count=2)
+    assert [r["skill"] for r in table.related(index.column["python"])] == ["SQL"]
+    assert table.related(index.column["fortran"]) == []
+
+
+def test_suggest_prefers_the_better_supported_skill():
+    table, _ = _table()
+    suggestions = table.suggest(["Python"], ["Fortran", "SQL", "Baking"], limit=3)
+    assert [s["skill"] for s in suggestions] == ["SQL", "Fortran"]
+    assert suggestions[0]["because"] == ["Python"]
+
+
+def test_saved_table_loads_back(tmp_path):
+    table, index = _table()
+    path = tmp_path / "related.npz"
+    table.save(path)
+    loaded = SkillCooccurrence.load(path)
+    assert loaded.version == "test"
+    assert loaded.related(index.column["sql"]) == table.related(index.column["sql"])
+
+
+def test_saved_table_is_rebuilt_when_the_settings_change(tmp_path, monkeypatch):
+    index = SkillIndex(CATALOG, CATALOG_VERSION)
+    monkeypatch.setattr(skill_cooccurrence, "get_skill_index", lambda: index)
+    monkeypatch.setattr(skill_cooccurrence, "_table_path", lambda: str(tmp_path / "related.npz"))
+    monkeypatch.setattr(skill_cooccurrence, "_table", None)
+
+    assert skill_cooccurrence.get_cooccurrence().stats()["top_k"] == skill_cooccurrence.RELATED_TOP_K
+    monkeypatch.setattr(skill_cooccurrence, "_table", None)  # as in a fresh worker
+    monkeypatch.setattr(skill_cooccurrence, "RELATED_TOP_K", 1)
+    monkeypatch.setattr(skill_cooccurrence, "RELATED_MIN_COUNT", 2)
+    table = skill_cooccurrence.get_cooccurrence()
+    assert (table.stats()["top_k"], table.stats()["min_count"]) == (1, 2)
+    assert table.related(index.column["fortran"]) == []
+    assert SkillCooccurrence.load(tmp_path / "related.npz").matches(CATALOG_VERSION, 1, 2)
@@ -0,0 +1,57 @@
+import pytest
+
+from backend.app import app
+from backend.skill_extractor import SkillAutomaton, extract_skills
+
+PATTERNS = {
+    "java": "Java",
+    "javascript": "JavaScript",
+    "js": "JavaScript",
+    "node.js": "Node.js",
+    "python": "Python",
+    "html": "HTML",
+    "machine learning": "Machine Learning",
+    "learning": "Learning",
+}
+
+
+def _find(text):
+    return {skill: info["count"] for skill, info in SkillAutomaton(PATTERNS).find(text).items()}
+
+
+def test_matches_need_word_boundaries():
+    assert _find("JavaScript developer") == {"JavaScript": 1}
+    assert _find("javanese and pythonic") == {}
+    assert _find("java, Java; (java)") == {"Java": 3}
+
+
+def test_version_suffix_is_allowed():
+    assert _find("python3 and html5") == {"Python": 1, "HTML": 1}
+
+
+def test_longest_overlapping_match_wins():
+    assert _find("Node.js backend") == {"Node.js": 1}
+    assert _find("machine learning, then learning Rust") == {"Machine Learning": 1, "Learning": 1}
+
+
+def test_separators_and_case_are_folded():
+    found = SkillAutomaton(PATTERNS).find("MACHINE-learning and machine_learning")
+    assert found == {"Machine Learning": {"count": 2, "matched": {"machine learning"}}}
+
+
+def test_ambiguous_aliases_are_not_trusted_in_free_text():
+    result = extract_skills("Built REST APIs; the rest of the team wrote Python3")
+    assert result["skills"] == ["Python", "REST APIs"]
+    assert extract_skills("the rest of the team")["skills"] == []
+
+
+@pytest.mark.parametrize("career", [5, "", "   ", ["data analyst"]])
+def test_extract_endpoint_rejects_a_malformed_career(career):
+    response = app.test_client().post("/skills/extract", json={"text": "python", "career": career})
+    assert response.status_code == 400
+
+
+def test_extract_endpoint_reports_the_skill_gap():
+    response = app.test_client().post("/skills/extract", json={"text": "SQL and Excel", "career": "data analyst"})
+    assert response.status_code == 200
+    assert "SQL" in response.json["skill_gap"]["matching_skills"]
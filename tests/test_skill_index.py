@@ -0,0 +1,95 @@
+import math
+
+import numpy as np
+import pytest
+
+from backend import skill_index
+from backend.app import app
+from backend.career_data import CAREER_DB
+from backend.skill_index import SkillIndex, compare_matrix, fit_page
+
+CATALOG = {
+    "a": {"skills": ["SQL", "Python"]},             # 2 of 2
+    "b": {"skills": ["SQL", "Python", "Docker"]},   # 2 of 3
+    "c": {"skills": ["SQL", "Excel", "Tableau"]},   # 1 of 3
+    "d": {"skills": ["Python", "Excel", "Linux"]},  # 1 of 3, after c in catalog order
+    "e": {"skills": ["Python"]},                    # 1 of 1
+}
+
+
+def _page(limit, offset):
+    index = SkillIndex(CATALOG, "test")
+    vector, _ = index.skill_vector(["sql", "python"])
+    matching = (index.matrix @ vector).astype(np.int64)
+    rows = np.flatnonzero(matching > 0)
+    return fit_page(index, rows, matching[rows], set(np.flatnonzero(vector).tolist()), limit, offset)
+
+
+def test_pages_follow_fit_then_matching_count_then_catalog_order():
+    everything = _page(10, 0)
+    assert [c["name"] for c in everything] == ["A", "E", "B", "C", "D"]
+    assert [c["fit_score"] for c in everything] == [100, 100, 66, 33, 33]
+
+
+def test_pages_are_consecutive_slices_of_the_full_ranking():
+    everything = [c["name"] for c in _page(10, 0)]
+    pages = [c["name"] for offset in range(0, 5, 2) for c in _page(2, offset)]
+    assert pages == everything
+
+
+def test_offset_past_the_end_is_empty():
+    assert _page(2, 5) == []
+
+
+def test_page_lists_matching_and_missing_skills():
+    b = _page(1, 2)[0]
+    assert b["name"] == "B"
+    assert b["matching_skills"] == ["SQL", "Python"]
+    assert b["missing_skills"] == ["Docker"]
+    assert (b["matching_count"], b["missing_count"]) == (2, 1)
+
+
+MATRIX_CAREERS = ["data analyst", "software engineer", "web developer"]
+
+
+def test_matrix_similarity_and_skill_sets():
+    result = compare_matrix(MATRIX_CAREERS)
+    similarity = result["similarity"]
+    assert [similarity[i][i] for i in range(3)] == [1.0, 1.0, 1.0]
+    assert similarity[0][1] == round(1 / 14, 4)  # Python, of 7 + 8 - 1 skills
+    assert similarity[1][2] == similarity[2][1] == round(2 / 15, 4)
+    assert similarity[0][2] == 0
+    assert result["common_to_all"] == []
+    web = result["per_career"][2]
+    assert sorted(web["shared_skills"]) == ["Git", "JavaScript"]
+    assert web["skill_count"] == 9 and len(web["unique_skills"]) == 7
+
+
+def test_cosine_metric():
+    similarity = compare_matrix(MATRIX_CAREERS, "cosine")["similarity"]
+    assert similarity[1][2] == round(2 / math.sqrt(8 * 9), 4)
+
+
+def test_salary_deltas_are_row_minus_column():
+    salary = compare_matrix(MATRIX_CAREERS[:2])["salary"]
+    assert salary["levels"] == ["entry", "mid", "senior", "lead"]
+    assert salary["deltas"]["entry"] == [[0, -25000], [25000, 0]]
+
+
+def test_missing_salary_gives_null_deltas(monkeypatch):
+    catalog = dict(CAREER_DB, **{"web developer": dict(CAREER_DB["web developer"], salary={"entry": 60000})})
+    monkeypatch.setattr(skill_index, "get_skill_index", lambda: SkillIndex(catalog, "test"))
+    deltas = compare_matrix(["data analyst", "web developer"])["salary"]["deltas"]
+    assert deltas["entry"] == [[0, -5000], [5000, 0]]
+    assert deltas["lead"] == [[0, None], [None, None]]
+
+
+@pytest.mark.parametrize("careers, metric", [
+    (MATRIX_CAREERS, "euclidean"),
+    (["data analyst"] * (skill_index.MAX_MATRIX_CAREERS + 1), "jaccard"),
+    (["data analyst", "underwater basket weaver"], "jaccard"),
+])
+def test_invalid_matrix_requests_are_errors(careers, metric):
+    assert compare_matrix(careers, metric)["status"] == "error"
+    response = app.test_client().post("/compare/matrix", json={"careers": careers, "metric": metric})
+    assert response.status_code == 400
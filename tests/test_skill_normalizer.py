@@ -0,0 +1,56 @@
+import pytest
+
+from backend.career_data import SKILL_ALIASES
+from backend.skill_normalizer import SkillNormalizer, skill_key
+
+CAREER_DB = {
+    "data analyst": {"skills": ["SQL", "Python", "Excel", "Power BI", "Statistics"]},
+    "software engineer": {"skills": ["Java", "JavaScript", "Git", "REST APIs", "Linux"]},
+    "web developer": {"skills": ["HTML", "CSS", "React", "Node.js"]},
+    "devops engineer": {"skills": ["Docker", "Kubernetes", "Terraform", "AWS"]},
+}
+
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return SkillNormalizer(CAREER_DB, SKILL_ALIASES, "test")
+
+
+def test_skill_key_ignores_case_spacing_and_punctuation():
+    assert skill_key(" Node.js ") == "nodejs"
+    assert skill_key("Power-BI") == "powerbi"
+
+
+@pytest.mark.parametrize("typed, expected, how", [
+    ("SQL", "SQL", "exact"),
+    ("PowerBI", "Power BI", "exact"),
+    ("js", "JavaScript", "alias"),
+    ("k8s", "Kubernetes", "alias"),
+    ("python3", "Python", "variant"),
+    ("html5", "HTML", "variant"),
+    ("Pyhton", "Python", "typo"),
+    ("Dokcer", "Docker", "typo"),
+    ("Kubernets", "Kubernetes", "typo"),
+    ("Javascrpt", "JavaScript", "typo"),
+])
+def test_resolves_spellings_of_catalog_skills(normalizer, typed, expected, how):
+    assert normalizer.resolve(typed) == (expected, how)
+
+
+@pytest.mark.parametrize("typed", [
+    "Rust",   # one edit from the "rest" alias of REST APIs
+    "Hash",   # one edit from the "bash" alias of Linux
+    "Mass",   # one edit from the "sass" alias of CSS
+    "Gti",
+    "Jvaa",   # too short to correct safely
+    "Bashx",  # short aliases are never correction targets
+    "Cobol",
+])
+def test_does_not_rewrite_other_skills(normalizer, typed):
+    assert normalizer.resolve(typed) == (None, "unknown")
+
+
+def test_counts_resolutions(normalizer):
+    before = normalizer.stats()["unknown"]
+    normalizer.resolve("Rust")
+    assert normalizer.stats()["unknown"] == before + 1
@@ -0,0 +1,42 @@
+import pytest
+
+from backend import skill_sessions
+from backend.app import app
+from backend.skill_sessions import SkillSession
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.mark.parametrize("body", [
+    {"skills": [1]},
+    {"skills": "python"},
+    {"skills": ["python"], "career": 5},
+])
+def test_start_rejects_malformed_skills(client, body):
+    response = client.post("/skills/session", json=body)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("body", [{"add": [1]}, {"add": "python"}, {"remove": {"sql": True}}])
+def test_toggle_rejects_malformed_skills(client, body):
+    session_id = client.post("/skills/session", json={"skills": ["python"]}).json["session_id"]
+    response = client.post(f"/skills/session/{session_id}", json=body)
+    assert response.status_code == 400
+    assert client.get(f"/skills/session/{session_id}").json["skills"] == ["python"]
+
+
+def test_stored_session_restores_counts_without_replaying_postings(monkeypatch):
+    session = SkillSession("data analyst")
+    session.apply(add=["Python", "SQL", "Quantum Knitting"])
+    data = session.to_dict()
+
+    monkeypatch.setattr(SkillSession, "_toggle", lambda *args: pytest.fail("replayed postings"))
+    loaded = SkillSession.from_dict(data)
+    assert loaded.results() == session.results()
+
+    monkeypatch.setattr(skill_sessions, "CATALOG_VERSION", "another catalog")
+    with pytest.raises(pytest.fail.Exception):
+        SkillSession.from_dict(data)  # a new catalog needs the counts rebuilt
@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+
+from backend import startup
+from backend.startup import HEAVY_MODULES, get_startup_report, preload
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_importing_the_app_defers_heavy_modules():
+    script = (
+        "import json, sys, backend.app\n"
+        f"print(json.dumps([m for m, _ in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert json.loads(out.stdout.strip().splitlines()[-1]) == []
+
+
+def test_sdks_are_only_preloaded_when_configured(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("GEMINI_API_KEY", "test")
+    wanted = startup._wanted_modules()
+    assert "google.generativeai" in wanted and "openai" not in wanted
+    assert "numpy" in wanted
+
+
+def test_preload_reports_what_it_loaded(monkeypatch):
+    monkeypatch.setattr(startup, "_preload_report", {"preloaded": False, "modules": {}, "total_ms": 0.0})
+    monkeypatch.setattr(startup, "_wanted_modules", lambda: ["numpy", "not_a_real_module"])
+    modules = preload()
+    assert "import_ms" in modules["numpy"]
+    assert "error" in modules["not_a_real_module"]
+    assert "career match indexes" in modules
+
+    report = get_startup_report()
+    assert report["preloaded"] is True
+    assert report["modules"] == modules
+    assert report["loaded"]["numpy"] is True